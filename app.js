@@ -21,6 +21,13 @@
 let allPapers = [];
 let filteredPapers = [];
 let currentPage = 1;
+let manifestTotal = 0;
+// Prebuilt index (data/search_index.json); full scans until it is loaded
+let searchIndex = null;
+// With the slim listing: day shard holding each paper's summaries, by id,
+// and the shard requests made so far
+let detailChunks = null;
+const chunkRequests = new Map();
 const papersPerPage = typeof CONFIG !== 'undefined' ? CONFIG.papersPerPage : 10;
 
 // Load papers on page load
@@ -53,13 +60,14 @@ function toggleLanguage(index, lang) {
     const paper = filteredPapers[index];
     if (!paper) return;
 
-    // Get the appropriate summary
+    // Get the appropriate summary (pre-rendered by the pipeline when available)
     const summaryText = lang === 'zh'
         ? (paper.summary_zh || paper.summary || paper.abstract)
         : (paper.summary_en || paper.summary || paper.abstract);
+    const summaryHtml = lang === 'zh' ? paper.summary_zh_html : paper.summary_en_html;
 
     // Update content
-    summaryDiv.innerHTML = renderMarkdown(summaryText);
+    summaryDiv.innerHTML = summaryHtml ?? renderMarkdown(summaryText);
     summaryDiv.dataset.lang = lang;
 
     // Update active states
@@ -72,24 +80,27 @@ function toggleLanguage(index, lang) {
     }
 }
 
-// Load papers from JSON
+// Load papers: the slim listing (summaries are fetched per page), else the
+// day shards listed in the manifest, or the full papers.json
 async function loadPapers() {
     try {
-        const response = await fetch('data/papers.json');
-        if (!response.ok) {
-            throw new Error('Failed to load papers');
+        const listing = await fetchJson('data/listing.json').catch(() => null);
+        if (listing && listing.version === 1) {
+            loadListing(listing);
+            return;
         }
 
-        const data = await response.json();
-        allPapers = data.papers || [];
-
-        // Update last updated time
-        if (data.last_updated) {
-            const date = new Date(data.last_updated);
-            document.getElementById('lastUpdated').textContent = date.toLocaleString();
+        const manifest = await fetchJson('data/manifest.json').catch(() => null);
+        if (manifest && Array.isArray(manifest.shards)) {
+            await loadShards(manifest);
+            return;
         }
 
+        const data = await fetchJson('data/papers.json');
+        allPapers = data.papers || [];
+        showLastUpdated(data.last_updated);
         filterAndDisplay();
+        loadSearchIndex();
     } catch (error) {
         console.error('Error loading papers:', error);
         document.getElementById('papersList').innerHTML =
@@ -97,14 +108,226 @@ async function loadPapers() {
     }
 }
 
+// Load shards newest day first: render as soon as the first page is filled,
+// then fetch the remaining days in the background for search and sorting
+async function loadShards(manifest) {
+    showLastUpdated(manifest.last_updated);
+    manifestTotal = manifest.total_count || 0;
+
+    const shards = manifest.shards;
+    let next = 0;
+    while (next < shards.length && allPapers.length < papersPerPage) {
+        const shard = await fetchJson(`data/${shards[next].file}`);
+        allPapers.push(...(shard.papers || []));
+        next++;
+    }
+    filterAndDisplay();
+
+    if (next < shards.length) {
+        try {
+            const rest = await Promise.all(
+                shards.slice(next).map(entry => fetchJson(`data/${entry.file}`))
+            );
+            rest.forEach(shard => allPapers.push(...(shard.papers || [])));
+        } catch (error) {
+            console.error('Error loading older papers:', error);
+        }
+        filterAndDisplay();
+    }
+    loadSearchIndex();
+}
+
+// Decode the column-oriented listing into paper objects with the list fields
+function loadListing(listing) {
+    showLastUpdated(listing.last_updated);
+    const columns = listing.columns;
+    allPapers = columns.id.map((id, i) => ({
+        id,
+        title: columns.title[i],
+        authors: columns.authors[i],
+        source: listing.sources[columns.source[i]],
+        published: columns.published[i],
+        keywords: columns.keywords[i].map(k => listing.keywords[k]),
+        url: columns.url[i],
+        pdf_link: columns.pdf_link[i],
+        arxiv_id: columns.arxiv_id[i],
+        iacr_id: columns.iacr_id[i],
+    }));
+    detailChunks = new Map(columns.id.map((id, i) => [id, listing.chunks[columns.chunk[i]]]));
+    filterAndDisplay();
+    loadSearchIndex();
+}
+
+// True while a listed paper's summaries have not been fetched yet
+function detailsPending(paper) {
+    return detailChunks !== null && !paper.detailsLoaded && detailChunks.get(paper.id) != null;
+}
+
+// Fetch the day shards holding the summaries of the given papers and merge
+// them into the paper objects; resolves to false when nothing was missing
+function loadDetails(papers) {
+    const files = new Set(papers.filter(detailsPending).map(paper => detailChunks.get(paper.id)));
+    if (files.size === 0) return Promise.resolve(false);
+    return Promise.all([...files].map(loadChunk)).then(() => true);
+}
+
+function loadChunk(file) {
+    if (!chunkRequests.has(file)) {
+        const byId = new Map(allPapers.map(paper => [paper.id, paper]));
+        const request = fetchJson(`data/${file}`).then(shard => {
+            for (const detail of shard.papers || []) {
+                const paper = byId.get(detail.id);
+                if (paper) Object.assign(paper, detail, { detailsLoaded: true });
+            }
+        }).catch(error => {
+            // Allow a retry the next time the page is shown
+            chunkRequests.delete(file);
+            throw error;
+        });
+        chunkRequests.set(file, request);
+    }
+    return chunkRequests.get(file);
+}
+
+// Load the search index once every paper is loaded. It is only used when it
+// covers exactly the loaded papers; otherwise searches keep scanning.
+async function loadSearchIndex() {
+    try {
+        const index = await fetchJson('data/search_index.json');
+        const byId = new Map(allPapers.map(paper => [paper.id, paper]));
+        const papers = index.ids.map(id => byId.get(id));
+        if (index.version !== 1 || papers.length !== allPapers.length || papers.includes(undefined)) {
+            return;
+        }
+        index.papers = papers;
+        index.lists = new Array(index.tokens.length);
+        searchIndex = index;
+    } catch (error) {
+        console.warn('Search index unavailable, using full scans:', error);
+    }
+}
+
+// Split text into index tokens, like tokenize() in scripts/search_index.py:
+// lowercase runs of letters and digits, CJK runs as character bigrams
+const CJK_RUN = /[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]+/g;
+
+function tokenize(text) {
+    const tokens = [];
+    for (const word of text.toLowerCase().match(/[\p{L}\p{N}]+/gu) || []) {
+        for (const part of word.split(CJK_RUN)) {
+            if (part) tokens.push(part);
+        }
+        for (const run of word.match(CJK_RUN) || []) {
+            if (run.length === 1) {
+                tokens.push(run);
+            } else {
+                for (let i = 0; i + 1 < run.length; i++) tokens.push(run.slice(i, i + 2));
+            }
+        }
+    }
+    return tokens;
+}
+
+// First token position >= value (tokens are sorted)
+function lowerBound(tokens, value) {
+    let lo = 0;
+    let hi = tokens.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >> 1;
+        if (tokens[mid] < value) lo = mid + 1;
+        else hi = mid;
+    }
+    return lo;
+}
+
+// Ordinals of one token, decoded from the delta-encoded postings on first use
+function postingList(position) {
+    let list = searchIndex.lists[position];
+    if (!list) {
+        const deltas = searchIndex.postings[position];
+        list = new Int32Array(deltas.length);
+        let ordinal = 0;
+        deltas.forEach((delta, i) => { ordinal += delta; list[i] = ordinal; });
+        searchIndex.lists[position] = list;
+    }
+    return list;
+}
+
+// Papers matching every query token (as a prefix of an indexed token), or
+// null when the query has no tokens
+function searchMatches(searchTerm) {
+    const terms = [...new Set(tokenize(searchTerm))];
+    if (terms.length === 0) return null;
+
+    const { tokens } = searchIndex;
+    let matches = null;
+    for (const term of terms) {
+        const hits = new Uint8Array(searchIndex.ids.length);
+        const end = lowerBound(tokens, term + '\uffff');
+        for (let t = lowerBound(tokens, term); t < end; t++) {
+            for (const ordinal of postingList(t)) hits[ordinal] = 1;
+        }
+        if (matches) {
+            for (let i = 0; i < matches.length; i++) matches[i] &= hits[i];
+        } else {
+            matches = hits;
+        }
+    }
+    return matches;
+}
+
+// Fetch and parse a JSON file
+async function fetchJson(url) {
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`Failed to load ${url}`);
+    }
+    return response.json();
+}
+
+// Update last updated time
+function showLastUpdated(lastUpdated) {
+    if (lastUpdated) {
+        const date = new Date(lastUpdated);
+        document.getElementById('lastUpdated').textContent = date.toLocaleString();
+    }
+}
+
+// Total number of papers, including shards that are still loading
+function totalPapers() {
+    return Math.max(allPapers.length, manifestTotal);
+}
+
 // Filter and display papers
 function filterAndDisplay() {
     const searchTerm = document.getElementById('searchInput').value.toLowerCase();
     const sourceFilter = document.getElementById('sourceFilter').value;
     const sortBy = document.getElementById('sortBy').value;
 
-    // Filter papers
-    filteredPapers = allPapers.filter(paper => {
+    if (searchIndex && searchIndex.orders[sortBy]) {
+        // Index lookups, then walk the presorted order of the sort option
+        const matches = searchTerm ? searchMatches(searchTerm) : null;
+        filteredPapers = [];
+        for (const ordinal of searchIndex.orders[sortBy]) {
+            const paper = searchIndex.papers[ordinal];
+            if (matches && !matches[ordinal]) continue;
+            if (sourceFilter !== 'all' && paper.source !== sourceFilter) continue;
+            filteredPapers.push(paper);
+        }
+    } else {
+        filteredPapers = scanPapers(searchTerm, sourceFilter);
+        sortPapers(filteredPapers, sortBy);
+    }
+
+    // Display papers with pagination
+    displayPapers(filteredPapers);
+    updateStats(filteredPapers.length, totalPapers());
+    updatePagination(filteredPapers.length);
+}
+
+// Filter papers by a full scan (before the search index is loaded)
+function scanPapers(searchTerm, sourceFilter) {
+    return allPapers.filter(paper => {
         // Source filter
         if (sourceFilter !== 'all' && paper.source !== sourceFilter) {
             return false;
@@ -127,14 +350,6 @@ function filterAndDisplay() {
 
         return true;
     });
-
-    // Sort papers
-    sortPapers(filteredPapers, sortBy);
-
-    // Display papers with pagination
-    displayPapers(filteredPapers);
-    updateStats(filteredPapers.length, allPapers.length);
-    updatePagination(filteredPapers.length);
 }
 
 // Sort papers
@@ -174,6 +389,14 @@ function displayPapers(papers) {
             btn.addEventListener('click', () => exportBibtex(paper));
         }
     });
+
+    // Fill in summaries of listed papers, unless the page changed meanwhile
+    const page = currentPage;
+    loadDetails(pagePapers).then(loaded => {
+        if (loaded && page === currentPage && papers === filteredPapers) {
+            displayPapers(papers);
+        }
+    }).catch(error => console.error('Error loading paper details:', error));
 }
 
 // Render Markdown to HTML
@@ -196,12 +419,16 @@ function createPaperCard(paper, index) {
 
     const keywords = (paper.keywords || []).slice(0, 8).join(', ');
 
-    // Default to Chinese summary
+    // Default to Chinese summary; the pipeline ships it as sanitized HTML,
+    // older data is parsed here
     const summaryText = paper.summary_zh || paper.summary || paper.abstract;
-    const summaryHtml = renderMarkdown(summaryText);
+    const summaryHtml = detailsPending(paper)
+        ? '<p class="loading">Loading summary...</p>'
+        : paper.summary_zh_html ?? renderMarkdown(summaryText);
 
-    // Check if bilingual summaries are available
-    const hasBilingual = paper.summary_zh && paper.summary_en;
+    // Check if bilingual summaries are available (the shards ship them as HTML)
+    const hasBilingual = (paper.summary_zh_html || paper.summary_zh) &&
+                         (paper.summary_en_html || paper.summary_en);
 
     return `
         <div class="paper-entry">
@@ -287,7 +514,7 @@ function updatePagination(totalFiltered) {
 function changePage(page) {
     currentPage = page;
     displayPapers(filteredPapers);
-    updateStats(filteredPapers.length, allPapers.length);
+    updateStats(filteredPapers.length, totalPapers());
     updatePagination(filteredPapers.length);
     window.scrollTo({ top: 0, behavior: 'smooth' });
 }
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Feed format benchmark for Paper Pulse.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Writes the main and focused feeds of a synthetic corpus as RSS only, then
+RSS + Atom, then RSS + Atom + JSON Feed, and separately times building the
+shared FeedItem model and serializing its items in each format. The growth
+of the total write time should match the per-format serialization time.
+
+Usage:
+    python benchmarks/bench_feeds.py --papers 5000 --repeat 5
+"""
+
+import argparse
+import contextlib
+import io
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from rss import FORMATS, FeedItem, generate_feeds
+from synthetic import make_corpus
+
+
+def timed(fn, repeat: int) -> float:
+    """Median wall time of ``repeat`` calls (seconds)."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        # generate_feeds prints a summary line per call
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark RSS / Atom / JSON Feed output")
+    parser.add_argument("--papers", type=int, default=5000)
+    parser.add_argument("--max-items", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    papers = make_corpus(args.papers, seed=args.seed)
+    papers.sort(key=lambda p: p.get("published", ""), reverse=True)
+    sample = papers[: args.max_items * 20]
+
+    print(f"{len(papers)} papers, {args.max_items} items per feed (median of {args.repeat})")
+    model = timed(lambda: [FeedItem(p) for p in sample], args.repeat)
+    print(f"\nFeedItem model: {model * 1e6 / len(sample):.1f} us/paper")
+    items = [FeedItem(p) for p in sample]
+    for fmt in FORMATS:
+        # Fresh items each round so the per-item render cache does not hide the cost
+        rendered = timed(lambda: [FeedItem(p).render(fmt) for p in sample], args.repeat)
+        print(f"  + {fmt:<5} items: {(rendered - model) * 1e6 / len(items):.1f} us/paper")
+
+    print(f"\n{'formats':<18} {'write(ms)':>10} {'delta(ms)':>10} {'files':>6} {'size(KB)':>9}")
+    previous = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for formats in (["rss"], ["rss", "atom"], ["rss", "atom", "json"]):
+            out = Path(tmp) / "-".join(formats)
+            out.mkdir()
+            feed = out / "feed.xml"
+            elapsed = timed(
+                lambda: generate_feeds(
+                    papers, feed, max_items=args.max_items, formats=formats, force=True
+                ),
+                args.repeat,
+            )
+            files = [f for f in out.rglob("*") if f.is_file()]
+            size = sum(f.stat().st_size for f in files) / 1024
+            delta = f"{(elapsed - previous) * 1000:>10.1f}" if previous else f"{'':>10}"
+            print(f"{'+'.join(formats):<18} {elapsed * 1000:>10.1f} {delta} {len(files):>6} {size:>9.0f}")
+            previous = elapsed
+
+        unchanged = timed(
+            lambda: generate_feeds(papers, feed, max_items=args.max_items, formats=formats),
+            args.repeat,
+        )
+        print(f"{'all, unchanged':<18} {unchanged * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks of the CPU hot paths of Paper Pulse, with baselines.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Times each pipeline function that scales with the number of papers on a
+deterministic synthetic corpus (benchmarks/synthetic.py) of every requested
+size, and reports the best of several runs. Results can be stored as a
+baseline and later runs compared against it: a case that got slower than
+the baseline by more than the threshold is reported as a regression and
+the script exits with status 1.
+
+Baselines are only comparable on the same machine and Python version, so
+record one before starting performance work and compare against it after
+each change.
+
+Usage:
+    python benchmarks/bench_hotpaths.py --sizes 1k,10k --save-baseline
+    python benchmarks/bench_hotpaths.py --sizes 1k,10k --compare --threshold 0.25
+    python benchmarks/bench_hotpaths.py --sizes 100k --cases filter_papers,merge_papers
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from digest import generate_email_report
+from filter import KeywordFilter
+from legacy_store import load_existing_data, merge_papers, remove_old_papers, save_data
+from rss import generate_rss_feed
+from store import PaperStore
+from summarizer import ModelScopeSummarizer
+from synthetic import SCALES, make_corpus
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines.json"
+
+# Case name -> setup(papers, tmp) returning the function to time
+CASES: Dict[str, Callable] = {}
+
+
+def case(name: str):
+    """Register a benchmark case."""
+
+    def register(setup):
+        CASES[name] = setup
+        return setup
+
+    return register
+
+
+@case("filter_papers")
+def _filter_papers(papers: List[Dict], tmp: Path):
+    # Fetcher output, matched against the repository's keyword rules
+    raw = [
+        {key: paper[key] for key in ("id", "title", "abstract", "authors", "published")}
+        for paper in papers
+    ]
+    keyword_filter = KeywordFilter(config_file=str(ROOT / "keywords.txt"))
+    return lambda: keyword_filter.filter_papers(raw)
+
+
+@case("merge_papers")
+def _merge_papers(papers: List[Dict], tmp: Path):
+    # A quarter of the corpus comes back as new papers, a quarter as updates
+    new = [dict(paper, id=paper["id"] + "v2") for paper in papers[::4]] + papers[1::4]
+    return lambda: merge_papers(papers, new)
+
+
+@case("remove_old_papers")
+def _remove_old_papers(papers: List[Dict], tmp: Path):
+    # Cut the 30-day corpus in half, whatever today's date is
+    newest = datetime.strptime(papers[0]["published"], "%Y-%m-%d")
+    days = (datetime.now() - newest).days + 15
+    return lambda: remove_old_papers(papers, days=days)
+
+
+@case("sort")
+def _sort(papers: List[Dict], tmp: Path):
+    # The newest-first sort main() ran on the merged list before publishing
+    shuffled = sorted(papers, key=lambda p: p["id"])
+    return lambda: sorted(shuffled, key=lambda p: p.get("published", ""), reverse=True)
+
+
+@case("store_recent")
+def _store_recent(papers: List[Dict], tmp: Path):
+    # The same ordering as read from the store by the publish stage
+    store = PaperStore(tmp / "papers.db")
+    store.upsert(papers)
+    return store.recent
+
+
+@case("generate_rss_feed")
+def _generate_rss_feed(papers: List[Dict], tmp: Path):
+    output = tmp / "feed.xml"
+    return lambda: generate_rss_feed(papers, output, site_url="https://example.org", force=True)
+
+
+@case("generate_email_report")
+def _generate_email_report(papers: List[Dict], tmp: Path):
+    output = tmp / "email_report.txt"
+    usage = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
+    return lambda: generate_email_report(
+        papers, [], [], len(papers), usage, output, "https://example.org"
+    )
+
+
+@case("parse_bilingual_summary")
+def _parse_bilingual_summary(papers: List[Dict], tmp: Path):
+    summarizer = ModelScopeSummarizer(api_key="bench")
+    responses = [
+        f"[中文摘要]\n{paper['summary_zh']}\n\n[English Summary]\n{paper['summary_en']}"
+        for paper in papers
+    ]
+    return lambda: [summarizer._parse_bilingual_summary(text) for text in responses]
+
+
+@case("json_save")
+def _json_save(papers: List[Dict], tmp: Path):
+    data = {"papers": papers, "last_updated": "2026-01-31T00:00:00", "total_count": len(papers)}
+    return lambda: save_data(tmp / "save.json", data)
+
+
+@case("json_load")
+def _json_load(papers: List[Dict], tmp: Path):
+    path = tmp / "load.json"
+    save_data(path, {"papers": papers, "last_updated": None, "total_count": len(papers)})
+    return lambda: load_existing_data(path)
+
+
+def timed(fn: Callable, repeat: int, min_time: float = 0.05) -> float:
+    """
+    Best wall time of one call over ``repeat`` samples (seconds).
+
+    Fast calls are repeated within a sample until it lasts ``min_time``, so
+    sub-millisecond cases are not dominated by timer noise. The minimum is
+    used because interference from the machine only ever adds time.
+    """
+    # Most cases print a summary line per call
+    with contextlib.redirect_stdout(io.StringIO()):
+        loops = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(loops):
+                fn()
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+            loops *= 10 if elapsed < min_time / 10 else 2
+        samples = [elapsed / loops]
+        for _ in range(repeat - 1):
+            start = time.perf_counter()
+            for _ in range(loops):
+                fn()
+            samples.append((time.perf_counter() - start) / loops)
+    return min(samples)
+
+
+def calibrate(repeat: int) -> float:
+    """
+    Time a fixed pure-Python workload (seconds).
+
+    Stored with the baseline; comparisons scale the baseline by how much
+    faster or slower this workload runs now, so a busy or throttled machine
+    is not reported as a regression of every case.
+    """
+    words = [f"word{i % 997}" for i in range(20000)]
+
+    def workload():
+        counts = {}
+        for word in words:
+            counts[word] = counts.get(word, 0) + 1
+        sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        " ".join(words).lower().split()
+
+    return timed(workload, repeat)
+
+
+def parse_size(value: str) -> int:
+    """Paper count from "10000" or a named scale such as "10k"."""
+    return SCALES.get(value.lower()) or int(value)
+
+
+def run_cases(sizes: List[int], names: List[str], repeat: int, seed: int) -> Dict[str, Dict]:
+    """
+    Time every case at every size.
+
+    Returns:
+        {size: {case: seconds per call}}, with sizes as strings (JSON keys)
+    """
+    results = {}
+    for size in sizes:
+        papers = make_corpus(size, seed=seed)
+        results[str(size)] = {}
+        print(f"\n{size} papers (best of {repeat})")
+        print(f"{'case':<26} {'time(ms)':>10} {'us/paper':>10}")
+        for name in names:
+            with tempfile.TemporaryDirectory() as tmp:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    fn = CASES[name](papers, Path(tmp))
+                elapsed = timed(fn, repeat)
+                # Close the store before the directory is removed
+                store = getattr(fn, "__self__", None)
+                if isinstance(store, PaperStore):
+                    store.close()
+            results[str(size)][name] = elapsed
+            print(f"{name:<26} {elapsed * 1000:>10.2f} {elapsed * 1e6 / size:>10.2f}")
+    return results
+
+
+def environment() -> Dict:
+    """Where the numbers were measured."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def compare(results: Dict, baseline: Dict, threshold: float, speed: float) -> List[str]:
+    """
+    Compare results with a stored baseline.
+
+    Args:
+        speed: Calibration time now; baseline times are scaled by its ratio
+            to the calibration time stored with the baseline
+
+    Returns:
+        Descriptions of the cases that are slower than the baseline by more
+        than ``threshold`` (a fraction, 0.25 = 25%)
+    """
+    if baseline.get("environment") != environment():
+        print("\nWarning: baseline was recorded in a different environment:")
+        print(f"  {baseline.get('environment')}")
+
+    scale = speed / baseline["calibration"] if baseline.get("calibration") else 1.0
+    print(f"\nCalibration: {speed * 1000:.2f} ms (baseline times scaled by {scale:.2f})")
+
+    regressions = []
+    print(f"\n{'size':>8} {'case':<26} {'baseline(ms)':>13} {'now(ms)':>10} {'change':>8}")
+    for size, cases in results.items():
+        for name, elapsed in cases.items():
+            reference = baseline.get("results", {}).get(size, {}).get(name)
+            if reference is None:
+                print(f"{size:>8} {name:<26} {'-':>13} {elapsed * 1000:>10.2f}")
+                continue
+            reference *= scale
+            change = elapsed / reference - 1
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                regressions.append(f"{name} at {size} papers: {change:+.0%}")
+            print(
+                f"{size:>8} {name:<26} {reference * 1000:>13.2f} {elapsed * 1000:>10.2f} "
+                f"{change:>+8.0%}{flag}"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the CPU hot paths")
+    parser.add_argument(
+        "--sizes",
+        default="1k,10k",
+        help=f"Comma-separated corpus sizes, as counts or {'/'.join(SCALES)}",
+    )
+    parser.add_argument(
+        "--cases", default=",".join(CASES), help="Comma-separated cases (default: all)"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline file")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Store the results as the baseline"
+    )
+    parser.add_argument(
+        "--compare", action="store_true", help="Compare with the baseline, exit 1 on regression"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown against the baseline, as a fraction (default: 0.25)",
+    )
+    args = parser.parse_args()
+
+    speed = calibrate(args.repeat)
+    sizes = [parse_size(size) for size in args.sizes.split(",")]
+    names = [name.strip() for name in args.cases.split(",")]
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)} (available: {', '.join(CASES)})")
+
+    results = run_cases(sizes, names, args.repeat, args.seed)
+    # Before and after the cases, in case the machine's speed changed meanwhile
+    speed = min(calibrate(args.repeat), speed)
+    baseline_path = Path(args.baseline)
+
+    if args.compare:
+        if not baseline_path.exists():
+            parser.error(f"no baseline at {baseline_path}; run with --save-baseline first")
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold, speed)
+        if regressions:
+            print(f"\n✗ {len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print(f"\n✓ No regressions over {args.threshold:.0%}")
+
+    if args.save_baseline:
+        baseline = {}
+        if baseline_path.exists():
+            baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        # Keep the sizes and cases that were not run this time, rescaled to
+        # the current calibration
+        scale = speed / baseline["calibration"] if baseline.get("calibration") else 1.0
+        stored = {
+            size: {name: elapsed * scale for name, elapsed in cases.items()}
+            for size, cases in baseline.get("results", {}).items()
+        }
+        for size, cases in results.items():
+            stored.setdefault(size, {}).update(cases)
+        baseline = {
+            "environment": environment(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "calibration": speed,
+            "recorded": datetime.now().isoformat(timespec="seconds"),
+            "results": stored,
+        }
+        baseline_path.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+        print(f"\n✓ Saved baseline to {baseline_path}")
+
+
+if __name__ == "__main__":
+    main()
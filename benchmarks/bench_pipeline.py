@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Batch vs streaming pipeline benchmark for Paper Pulse.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Runs pipeline.run_batch and pipeline.run_streaming over the same simulated
+sources (paged fetchers that sleep per page, like arXiv's 3 s delay) and the
+local mock DashScope server, then reports wall time of each and checks that
+both produce the same papers in the same order.
+
+Usage:
+    python benchmarks/bench_pipeline.py --papers 200 --page-size 50 --page-delay 1.0
+"""
+
+import argparse
+import copy
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from filter import KeywordFilter
+from pipeline import Source, run_batch, run_streaming
+from store import PaperStore
+from summarizer import ModelScopeSummarizer
+from bench_summarizer import make_papers
+from mock_dashscope import DEFAULT_PATH, add_mock_arguments, config_from_args, start_mock_server
+
+
+class PagedFetcher:
+    """Serves a fixed paper list in pages, sleeping before each page."""
+
+    def __init__(self, papers: List[Dict], page_size: int, page_delay: float):
+        self.papers = papers
+        self.page_size = page_size
+        self.page_delay = page_delay
+
+    def iter_papers(self) -> Iterator[Dict]:
+        for i, paper in enumerate(self.papers):
+            if i % self.page_size == 0:
+                time.sleep(self.page_delay)
+            yield copy.deepcopy(paper)
+
+    def fetch_papers(self) -> List[Dict]:
+        return list(self.iter_papers())
+
+
+def run_mode(args: argparse.Namespace, api_url: str, streaming: bool) -> Dict:
+    """Run one pipeline mode against a fresh store."""
+    papers = make_papers(args.papers, seed=args.seed or 0)
+    split = len(papers) * 4 // 5
+    sources = [
+        Source("arXiv", PagedFetcher(papers[:split], args.page_size, args.page_delay)),
+        Source("IACR", PagedFetcher(papers[split:], args.page_size, args.page_delay)),
+    ]
+    summarizer = ModelScopeSummarizer(
+        api_key="mock",
+        api_url=api_url,
+        max_retries=args.max_retries,
+        retry_delay=args.retry_delay,
+        rate_limit_delay=args.rate_limit_delay,
+        concurrency=args.concurrency,
+    )
+    # No keyword file: every paper is selected
+    keyword_filter = KeywordFilter(config_file=str(Path(tempfile.gettempdir()) / "no-keywords.txt"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PaperStore(Path(tmp) / "papers.db")
+        if streaming:
+            result = run_streaming(sources, keyword_filter, store, summarizer)
+        else:
+            result = run_batch(sources, keyword_filter, store, summarizer)
+        store.close()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare batch and streaming pipelines")
+    parser.add_argument("--papers", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--page-delay", type=float, default=1.0)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--retry-delay", type=float, default=0.1)
+    parser.add_argument("--rate-limit-delay", type=float, default=0.0)
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    server, root_url = start_mock_server(config_from_args(args))
+    api_url = root_url + DEFAULT_PATH
+    try:
+        batch = run_mode(args, api_url, streaming=False)
+        streaming = run_mode(args, api_url, streaming=True)
+    finally:
+        server.shutdown()
+
+    print(f"\n{'mode':<10} {'fetch done(s)':>13} {'total(s)':>9} {'ok':>5} {'fail':>5}")
+    for name, result in [("batch", batch), ("streaming", streaming)]:
+        print(
+            f"{name:<10} {result['timings']['fetch']:>13.2f} {result['timings']['total']:>9.2f} "
+            f"{len(result['successful']):>5} {len(result['failed']):>5}"
+        )
+
+    same = [p["id"] for p in batch["successful"] + batch["failed"]] == [
+        p["id"] for p in streaming["successful"] + streaming["failed"]
+    ]
+    print(f"\nSame papers in the same order: {'yes' if same else 'NO'}")
+    speedup = batch["timings"]["total"] / max(streaming["timings"]["total"], 1e-9)
+    print(f"Speedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Output serialization benchmark for Paper Pulse.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Compares the previous papers.json writer (json.dump with indent=2) with the
+serialize module (compact stdlib JSON and orjson, when installed) on a
+synthetic corpus, and reports encode time plus raw, gzip and Brotli sizes.
+Also measures feed.xml generation with and without precompressed siblings.
+
+Usage:
+    python benchmarks/bench_serialize.py --papers 10000 --repeat 5
+"""
+
+import argparse
+import gzip
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import serialize
+from rss import generate_feeds, generate_rss_feed
+from synthetic import make_corpus
+
+
+def timed(fn, repeat: int) -> float:
+    """Median wall time of ``repeat`` calls (seconds)."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def sizes(data: bytes) -> dict:
+    """Raw, gzip and (if available) Brotli sizes of a payload."""
+    result = {"raw": len(data), "gz": len(gzip.compress(data, compresslevel=9, mtime=0))}
+    if serialize.brotli:
+        result["br"] = len(serialize.brotli.compress(data, quality=11))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark papers.json serialization")
+    parser.add_argument("--papers", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    papers = make_corpus(args.papers, seed=args.seed)
+    data = {
+        "papers": papers,
+        "last_updated": datetime.now().isoformat(),
+        "total_count": len(papers),
+    }
+
+    variants = [
+        (
+            "json indent=2 (before)",
+            lambda: json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8"),
+        ),
+        (
+            "json compact",
+            lambda: json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        ),
+    ]
+    if serialize.orjson:
+        variants.append(("orjson compact", lambda: serialize.orjson.dumps(data)))
+
+    print(f"papers.json, {len(papers)} papers (median of {args.repeat})")
+    header = f"{'variant':<24} {'encode(ms)':>10} {'raw(KB)':>9} {'gz(KB)':>8} {'br(KB)':>8}"
+    print(header)
+    print("-" * len(header))
+    for name, fn in variants:
+        elapsed = timed(fn, args.repeat)
+        size = sizes(fn())
+        br = f"{size['br'] / 1024:>8.0f}" if "br" in size else f"{'n/a':>8}"
+        print(
+            f"{name:<24} {elapsed * 1000:>10.1f} {size['raw'] / 1024:>9.0f} "
+            f"{size['gz'] / 1024:>8.0f} {br}"
+        )
+
+    payload = serialize.dumps(data)
+    with tempfile.TemporaryDirectory() as tmp:
+        target = Path(tmp) / "papers.json"
+        formats = serialize.precompress_formats(["gz", "br"])
+        write_time = timed(
+            lambda: serialize.write_json(target, data, precompress=formats), args.repeat
+        )
+        print(
+            f"\nwrite_json ({serialize.encoder_name()}, siblings: {', '.join(formats)}): "
+            f"{write_time * 1000:.1f} ms for {len(payload) / 1024:.0f} KB"
+        )
+
+        feed = Path(tmp) / "feed.xml"
+        plain = timed(
+            lambda: generate_rss_feed(papers, feed, max_items=50, force=True), args.repeat
+        )
+        compressed = timed(
+            lambda: generate_rss_feed(
+                papers, feed, max_items=50, precompress=formats, force=True
+            ),
+            args.repeat,
+        )
+        # Same items again: rendered and hashed, but not written
+        unchanged = timed(
+            lambda: generate_rss_feed(papers, feed, max_items=50, precompress=formats),
+            args.repeat,
+        )
+        feed_size = sizes(feed.read_bytes())
+        print(
+            f"feed.xml (50 items): {plain * 1000:.1f} ms, with siblings "
+            f"{compressed * 1000:.1f} ms, unchanged {unchanged * 1000:.1f} ms; "
+            f"raw {feed_size['raw'] / 1024:.0f} KB, gz {feed_size['gz'] / 1024:.0f} KB"
+        )
+        all_feeds = timed(
+            lambda: generate_feeds(papers, feed, max_items=50, formats=["rss"], force=True),
+            args.repeat,
+        )
+        focused = len(list((Path(tmp) / "feeds").glob("*.xml")))
+        print(
+            f"feed.xml + {focused} per-source/per-keyword feeds (one pass): "
+            f"{all_feeds * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Summarization throughput benchmark for Paper Pulse.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Drives ModelScopeSummarizer.batch_summarize against the local mock server
+(or any running server, with --url and --backend) for each requested
+concurrency level and reports papers/sec, per-paper p50/p95 latency and
+retry overhead.
+
+Usage:
+    python benchmarks/bench_summarizer.py --papers 200 --concurrency 1,4,8 \\
+        --rate-429 0.05 --malformed-rate 0.1 --timeout 10 --retry-delay 0.5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from backends import BACKENDS, create_backend
+from summarizer import ModelScopeSummarizer
+from mock_dashscope import (
+    DEFAULT_PATH,
+    OPENAI_BASE_PATH,
+    add_mock_arguments,
+    config_from_args,
+    start_mock_server,
+)
+
+
+def make_papers(count: int, seed: int = 0) -> List[Dict]:
+    """Build simple synthetic papers with realistic-sized abstracts."""
+    rng = random.Random(seed)
+    words = (
+        "secure multiparty computation large language model backdoor attack "
+        "federated learning zero knowledge proof lattice encryption privacy "
+        "adversarial robustness benchmark protocol efficient scalable"
+    ).split()
+    papers = []
+    for i in range(count):
+        title = " ".join(rng.choice(words) for _ in range(8)).capitalize()
+        abstract = " ".join(rng.choice(words) for _ in range(180))
+        papers.append(
+            {
+                "id": f"bench_{i}",
+                "title": title,
+                "abstract": abstract,
+                "authors": ["Alice Example", "Bob Example"],
+                "published": "2026-01-01",
+                "source": "arXiv",
+            }
+        )
+    return papers
+
+
+def run_once(args: argparse.Namespace, api_url: str, concurrency: int) -> Dict:
+    """Summarize a fresh synthetic batch and return the measured numbers."""
+    backend = create_backend(
+        args.backend,
+        api_key="mock",
+        url=api_url,
+        stream=args.stream,
+        max_concurrency=concurrency,
+    )
+    summarizer = ModelScopeSummarizer(
+        api_key="mock",
+        backend=backend,
+        model=args.model,
+        max_retries=args.max_retries,
+        retry_delay=args.retry_delay,
+        max_tokens=args.max_tokens,
+        timeout=args.timeout,
+        rate_limit_delay=args.rate_limit_delay,
+        api_url=api_url,
+        concurrency=concurrency,
+        cascade_models=[m for m in (args.cascade or "").split(",") if m] or None,
+    )
+    papers = make_papers(args.papers, seed=args.seed or 0)
+
+    start = time.perf_counter()
+    successful, failed = summarizer.batch_summarize(papers, delay=args.rate_limit_delay)
+    wall = time.perf_counter() - start
+
+    if args.telemetry_dir:
+        summarizer.telemetry.export(
+            args.telemetry_dir / f"telemetry_c{concurrency}.ndjson",
+            args.telemetry_dir / f"telemetry_c{concurrency}.json",
+        )
+
+    retries = summarizer.total_retries
+    usage = summarizer.get_usage_stats()
+    timings = summarizer.telemetry.summary()["timings"]
+    return {
+        "concurrency": concurrency,
+        "papers": len(papers),
+        "successful": len(successful),
+        "failed": len(failed),
+        "wall": wall,
+        "papers_per_sec": len(papers) / wall if wall > 0 else 0.0,
+        "p50": timings["duration"]["p50"],
+        "p95": timings["duration"]["p95"],
+        "retries": retries,
+        "attempts_per_paper": (len(papers) + retries) / len(papers) if papers else 0.0,
+        "retry_wait": timings["retry_sleep"]["sum"],
+        "input_tokens": usage["input_tokens"],
+        "cached_input_tokens": usage["cached_input_tokens"],
+        "repairs": usage["repairs"],
+        "escalations": usage["escalations"],
+    }
+
+
+def print_report(results: List[Dict]):
+    """Print a fixed-width comparison table."""
+    header = (
+        f"{'conc':>5} {'ok':>6} {'fail':>5} {'wall(s)':>8} {'papers/s':>9} "
+        f"{'p50(s)':>7} {'p95(s)':>7} {'retries':>8} {'att/paper':>9} {'retry wait(s)':>13} "
+        f"{'cached in%':>10} {'repairs':>7} {'escal.':>6}"
+    )
+    print("\n" + header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['concurrency']:>5} {r['successful']:>6} {r['failed']:>5} "
+            f"{r['wall']:>8.2f} {r['papers_per_sec']:>9.2f} {r['p50']:>7.3f} "
+            f"{r['p95']:>7.3f} {r['retries']:>8} {r['attempts_per_paper']:>9.2f} "
+            f"{r['retry_wait']:>13.1f} "
+            f"{100 * r['cached_input_tokens'] / max(1, r['input_tokens']):>10.1f} "
+            f"{r['repairs']:>7} {r['escalations']:>6}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark batch_summarize against a mock DashScope server"
+    )
+    parser.add_argument("--papers", type=int, default=50)
+    parser.add_argument(
+        "--concurrency",
+        default="1",
+        help="Comma-separated concurrency levels to compare (e.g. 1,4,8)",
+    )
+    parser.add_argument(
+        "--url",
+        default=None,
+        help="Use an already running server (endpoint or base URL) instead of the mock",
+    )
+    parser.add_argument("--backend", choices=list(BACKENDS), default="dashscope")
+    parser.add_argument(
+        "--stream", action="store_true", help="Stream responses (openai/local backends)"
+    )
+    parser.add_argument("--model", default="qwen-plus")
+    parser.add_argument(
+        "--cascade",
+        default=None,
+        help="Comma-separated model cascade, cheapest first (e.g. qwen-turbo,qwen-plus)",
+    )
+    parser.add_argument("--max-tokens", type=int, default=1500)
+    parser.add_argument("--timeout", type=int, default=60)
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--retry-delay", type=float, default=0.5)
+    parser.add_argument("--rate-limit-delay", type=float, default=0.0)
+    parser.add_argument(
+        "--telemetry-dir",
+        type=Path,
+        default=None,
+        help="Write per-call telemetry NDJSON/JSON for each concurrency level here",
+    )
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    server = None
+    api_url = args.url
+    if not api_url:
+        server, root_url = start_mock_server(config_from_args(args))
+        api_url = root_url + (DEFAULT_PATH if args.backend == "dashscope" else OPENAI_BASE_PATH)
+        print(f"Started mock server at {api_url}")
+
+    results = []
+    try:
+        for level in [int(c) for c in args.concurrency.split(",") if c.strip()]:
+            print(f"\n▶ concurrency={level}")
+            results.append(run_once(args, api_url, level))
+    finally:
+        if server:
+            server.shutdown()
+
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Legacy papers.json storage functions, the baseline of the store benchmarks.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Before the SQLite store (scripts/store.py) every run loaded the whole of
+data/papers.json, merged and pruned the paper list in memory and wrote it
+back. The pipeline no longer uses these functions; bench_hotpaths.py keeps
+timing them so the store can be compared against what it replaced.
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from journal import atomic_write_bytes
+from serialize import dumps
+
+
+def load_existing_data(filepath: Path) -> dict:
+    """Load existing papers data."""
+    if filepath.exists():
+        with open(filepath, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {"papers": [], "last_updated": None}
+
+
+def save_data(filepath: Path, data: dict):
+    """Save papers data to JSON file (write to temp file, then rename)."""
+    atomic_write_bytes(filepath, dumps(data, compact=False))
+    print(f"✓ Saved data to {filepath}")
+
+
+def remove_old_papers(papers: list, days: int = 7) -> list:
+    """Remove papers older than specified days."""
+    cutoff = datetime.now() - timedelta(days=days)
+    filtered = []
+
+    for paper in papers:
+        try:
+            paper_date = datetime.strptime(paper["published"], "%Y-%m-%d")
+            if paper_date >= cutoff:
+                filtered.append(paper)
+        except (ValueError, KeyError):
+            filtered.append(paper)
+
+    removed = len(papers) - len(filtered)
+    if removed > 0:
+        print(f"✓ Removed {removed} papers older than {days} days")
+
+    return filtered
+
+
+def merge_papers(existing: list, new: list) -> list:
+    """Merge new papers with existing, avoiding duplicates and updating with new data."""
+    existing_dict = {p["id"]: p for p in existing}
+
+    new_count = 0
+    updated_count = 0
+    for paper in new:
+        if paper["id"] not in existing_dict:
+            existing_dict[paper["id"]] = paper
+            new_count += 1
+        else:
+            if paper.get("summary_status") == "success":
+                existing_dict[paper["id"]] = paper
+                updated_count += 1
+
+    print(f"✓ Added {new_count} new papers, updated {updated_count} papers")
+    return list(existing_dict.values())
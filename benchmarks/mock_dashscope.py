@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Local DashScope-compatible mock server for Paper Pulse load testing.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+The server answers every POST with the DashScope ``result_format=message``
+shape (``output.choices[].message.content`` plus ``usage``), so
+``ModelScopeSummarizer`` can be pointed at it via ``api_url`` without
+spending real tokens. Requests to a ``.../chat/completions`` path get the
+OpenAI chat completions shape instead (including ``stream: true`` as
+server-sent events), for the ``openai`` and ``local`` backends.
+
+Usage:
+    python benchmarks/mock_dashscope.py --port 8765 --latency-dist lognormal \\
+        --latency-mean 1.5 --rate-429 0.05 --rate-5xx 0.02 --malformed-rate 0.1
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+DEFAULT_PATH = "/api/v1/services/aigc/text-generation/generation"
+OPENAI_BASE_PATH = "/v1"
+
+
+class MockConfig:
+    """Behaviour knobs for the mock server."""
+
+    def __init__(
+        self,
+        latency_dist: str = "fixed",
+        latency_mean: float = 0.2,
+        latency_stddev: float = 0.05,
+        rate_429: float = 0.0,
+        rate_5xx: float = 0.0,
+        malformed_rate: float = 0.0,
+        output_tokens: int = 600,
+        seed: Optional[int] = None,
+        prefix_cache: bool = True,
+    ):
+        """
+        Initialize mock configuration.
+
+        Args:
+            latency_dist: One of LATENCY_DISTRIBUTIONS
+            latency_mean: Mean response latency in seconds
+            latency_stddev: Spread of the latency distribution in seconds
+                (ignored by ``fixed`` and ``exponential``)
+            rate_429: Probability of answering 429 Too Many Requests
+            rate_5xx: Probability of answering a 500/502/503
+            malformed_rate: Probability of returning a bilingual summary with
+                missing, swapped or truncated section markers
+            output_tokens: Approximate output tokens reported per response
+            seed: Random seed for reproducible runs
+            prefix_cache: Report repeated system messages as cached input
+                tokens (``usage.prompt_tokens_details.cached_tokens``)
+        """
+        if latency_dist not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {latency_dist}")
+        self.latency_dist = latency_dist
+        self.latency_mean = latency_mean
+        self.latency_stddev = latency_stddev
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.malformed_rate = malformed_rate
+        self.output_tokens = output_tokens
+        self.rng = random.Random(seed)
+        self.prefix_cache = prefix_cache
+        self.seen_prefixes = set()
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "ok": 0, "429": 0, "5xx": 0, "malformed": 0}
+
+    def sample_latency(self) -> float:
+        """Draw one response latency (seconds) from the configured distribution."""
+        mean, sd = self.latency_mean, self.latency_stddev
+        with self.lock:
+            if self.latency_dist == "fixed":
+                value = mean
+            elif self.latency_dist == "uniform":
+                value = self.rng.uniform(mean - sd, mean + sd)
+            elif self.latency_dist == "normal":
+                value = self.rng.gauss(mean, sd)
+            elif self.latency_dist == "lognormal":
+                # Parameterize by the desired mean/stddev of the latency itself
+                sigma2 = math.log(1 + (sd / mean) ** 2) if mean > 0 else 0.0
+                mu = math.log(mean) - sigma2 / 2 if mean > 0 else 0.0
+                value = self.rng.lognormvariate(mu, math.sqrt(sigma2))
+            else:
+                value = self.rng.expovariate(1 / mean) if mean > 0 else 0.0
+        return max(0.0, value)
+
+    def roll(self) -> str:
+        """Pick the outcome of one request: ok, 429, 5xx or malformed."""
+        with self.lock:
+            r = self.rng.random()
+            if r < self.rate_429:
+                outcome = "429"
+            elif r < self.rate_429 + self.rate_5xx:
+                outcome = "5xx"
+            elif self.rng.random() < self.malformed_rate:
+                outcome = "malformed"
+            else:
+                outcome = "ok"
+            self.stats["requests"] += 1
+            self.stats[outcome] += 1
+        return outcome
+
+
+def _bilingual_content(title: str, malformed_kind: Optional[str] = None) -> str:
+    """Build a summary in the format requested by _create_bilingual_prompt."""
+    zh = (
+        f"## 背景\n本文研究了《{title}》所涉及的问题。\n\n"
+        "## 方法\n作者提出了一种新方法，并在多个基准上进行了评估。\n\n"
+        "## 结论\n实验结果表明该方法优于现有基线。"
+    )
+    en = (
+        f"This paper studies {title}. The authors propose a new method "
+        "and evaluate it on several benchmarks, outperforming prior baselines."
+    )
+    if malformed_kind == "no_markers":
+        return f"{zh}\n\n{en}"
+    if malformed_kind == "zh_only":
+        return f"[中文摘要]\n{zh}"
+    if malformed_kind == "en_only":
+        return f"[English Summary]\n{en}"
+    if malformed_kind == "truncated":
+        return f"[中文摘要]\n{zh}\n\n[English Summary]\n{en[: len(en) // 3]}"
+    return f"[中文摘要]\n{zh}\n\n[English Summary]\n{en}"
+
+
+MALFORMED_KINDS = ("no_markers", "zh_only", "en_only", "truncated")
+
+
+def _extract_prompt(body: Dict) -> Tuple[str, str, str]:
+    """Return (model, system prefix, full message text) from a request body."""
+    model = body.get("model", "")
+    messages = body.get("input", {}).get("messages") or body.get("messages") or []
+    text = "\n".join(str(m.get("content", "")) for m in messages)
+    system = "".join(
+        str(m.get("content", "")) for m in messages if m.get("role") == "system"
+    )
+    return model, system, text
+
+
+def _guess_title(prompt: str) -> str:
+    for line in prompt.splitlines():
+        for prefix in ("论文标题:", "Title:"):
+            if line.startswith(prefix):
+                return line[len(prefix) :].strip()
+    return "the given topic"
+
+
+def make_handler(config: MockConfig):
+    """Create a request handler class bound to a MockConfig."""
+
+    class MockHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            # Keep benchmark output clean
+            pass
+
+        def _send_json(self, status: int, payload: Dict):
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            # Health check / live counters
+            self._send_json(200, {"stats": dict(config.stats)})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b"{}"
+            try:
+                body = json.loads(raw)
+            except ValueError:
+                self._send_json(400, {"code": "InvalidParameter", "message": "bad json"})
+                return
+
+            time.sleep(config.sample_latency())
+            outcome = config.roll()
+            request_id = str(uuid.uuid4())
+
+            if outcome == "429":
+                self._send_json(
+                    429,
+                    {
+                        "code": "Throttling.RateQuota",
+                        "message": "Requests rate limit exceeded",
+                        "request_id": request_id,
+                    },
+                )
+                return
+            if outcome == "5xx":
+                with config.lock:
+                    status = config.rng.choice([500, 502, 503])
+                self._send_json(
+                    status,
+                    {
+                        "code": "InternalError",
+                        "message": "Mock upstream failure",
+                        "request_id": request_id,
+                    },
+                )
+                return
+
+            model, system, prompt = _extract_prompt(body)
+            malformed_kind = None
+            if outcome == "malformed":
+                with config.lock:
+                    malformed_kind = config.rng.choice(MALFORMED_KINDS)
+            content = _bilingual_content(_guess_title(prompt), malformed_kind)
+
+            input_tokens = max(1, len(prompt) // 4)
+            cached_tokens = 0
+            if config.prefix_cache and system:
+                with config.lock:
+                    if system in config.seen_prefixes:
+                        cached_tokens = len(system) // 4
+                    else:
+                        config.seen_prefixes.add(system)
+            max_tokens = body.get("parameters", {}).get("max_tokens") or body.get(
+                "max_tokens"
+            )
+            output_tokens = config.output_tokens
+            if max_tokens:
+                output_tokens = min(output_tokens, int(max_tokens))
+
+            finish_reason = "length" if malformed_kind == "truncated" else "stop"
+            if self.path.rstrip("/").endswith("/chat/completions"):
+                self._send_openai(
+                    body, model, content, finish_reason,
+                    input_tokens, output_tokens, cached_tokens, request_id,
+                )
+                return
+
+            self._send_json(
+                200,
+                {
+                    "output": {
+                        "choices": [
+                            {
+                                "finish_reason": finish_reason,
+                                "message": {"role": "assistant", "content": content},
+                            }
+                        ]
+                    },
+                    "usage": {
+                        "input_tokens": input_tokens,
+                        "output_tokens": output_tokens,
+                        "total_tokens": input_tokens + output_tokens,
+                        "prompt_tokens_details": {"cached_tokens": cached_tokens},
+                    },
+                    "request_id": request_id,
+                    "model": model,
+                },
+            )
+
+        def _send_openai(
+            self, body, model, content, finish_reason,
+            input_tokens, output_tokens, cached_tokens, request_id,
+        ):
+            """Answer in OpenAI chat completions format (optionally as SSE)."""
+            usage = {
+                "prompt_tokens": input_tokens,
+                "completion_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+                "prompt_tokens_details": {"cached_tokens": cached_tokens},
+            }
+            if not body.get("stream"):
+                self._send_json(
+                    200,
+                    {
+                        "id": request_id,
+                        "object": "chat.completion",
+                        "model": model,
+                        "choices": [
+                            {
+                                "index": 0,
+                                "finish_reason": finish_reason,
+                                "message": {"role": "assistant", "content": content},
+                            }
+                        ],
+                        "usage": usage,
+                    },
+                )
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream; charset=utf-8")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            step = 64
+            for i in range(0, len(content), step):
+                delta = {"content": content[i : i + step]}
+                self._send_event({"id": request_id, "choices": [{"index": 0, "delta": delta}]})
+            self._send_event(
+                {
+                    "id": request_id,
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": finish_reason}],
+                }
+            )
+            self._send_event({"id": request_id, "choices": [], "usage": usage})
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+
+        def _send_event(self, payload: Dict):
+            data = json.dumps(payload, ensure_ascii=False)
+            self.wfile.write(f"data: {data}\n\n".encode("utf-8"))
+
+    return MockHandler
+
+
+def start_mock_server(
+    config: MockConfig, host: str = "127.0.0.1", port: int = 0
+) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    Start the mock server on a background thread.
+
+    Args:
+        config: Mock behaviour configuration
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+
+    Returns:
+        Tuple of (server, root_url); append DEFAULT_PATH for the DashScope
+        backend or OPENAI_BASE_PATH for the openai/local backends, and call
+        ``server.shutdown()`` when done
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(config))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    bound_host, bound_port = server.server_address[:2]
+    return server, f"http://{bound_host}:{bound_port}"
+
+
+def add_mock_arguments(parser: argparse.ArgumentParser):
+    """Register the mock behaviour options on an argument parser."""
+    parser.add_argument(
+        "--latency-dist", choices=LATENCY_DISTRIBUTIONS, default="lognormal"
+    )
+    parser.add_argument("--latency-mean", type=float, default=0.2)
+    parser.add_argument("--latency-stddev", type=float, default=0.1)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--rate-5xx", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--output-tokens", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--no-prefix-cache",
+        dest="prefix_cache",
+        action="store_false",
+        help="Never report cached input tokens",
+    )
+
+
+def config_from_args(args: argparse.Namespace) -> MockConfig:
+    """Build a MockConfig from parsed add_mock_arguments() options."""
+    return MockConfig(
+        latency_dist=args.latency_dist,
+        latency_mean=args.latency_mean,
+        latency_stddev=args.latency_stddev,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+        malformed_rate=args.malformed_rate,
+        output_tokens=args.output_tokens,
+        seed=args.seed,
+        prefix_cache=args.prefix_cache,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_mock_arguments(parser)
+    args = parser.parse_args()
+
+    config = config_from_args(args)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(config))
+    print(f"Mock DashScope listening on http://{args.host}:{args.port}{DEFAULT_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Served: {json.dumps(config.stats)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Compressed cold archive for expired papers.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Usage:
+    python scripts/archive.py search "zero knowledge"
+    python scripts/archive.py show arxiv_2401.01234
+"""
+
+import copy
+import gzip
+import json
+import os
+import sys
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+# Partition for papers without a usable publication date
+UNDATED = "undated"
+
+
+def _decompress_members(data: bytes) -> bytes:
+    """Decompress concatenated gzip members, stopping at a torn last member."""
+    chunks = []
+    while data:
+        decompressor = zlib.decompressobj(wbits=31)
+        try:
+            chunk = decompressor.decompress(data)
+        except zlib.error:
+            break
+        if not decompressor.eof:
+            break
+        chunks.append(chunk)
+        data = decompressor.unused_data
+    return b"".join(chunks)
+
+
+class ColdArchive:
+    """
+    Month-partitioned archive of papers that left the hot working set.
+
+    Each partition is ``<archive_dir>/YYYY-MM.ndjson.gz``: one JSON paper per
+    line, gzip-compressed. New papers are appended as an extra gzip member,
+    so archiving never rewrites existing data; readers see the concatenated
+    stream. A torn final member (crash while appending) is ignored, and when
+    a paper was archived more than once the last copy wins.
+    """
+
+    def __init__(self, archive_dir: Path):
+        self.archive_dir = Path(archive_dir)
+        # Decoded partitions, so per-paper lookups don't re-read a file
+        self._cache = {}
+
+    @staticmethod
+    def partition_for(paper: Dict) -> str:
+        """Partition key (YYYY-MM) of a paper."""
+        published = paper.get("published") or ""
+        if len(published) >= 7 and published[4] == "-" and published[:4].isdigit():
+            return published[:7]
+        return UNDATED
+
+    def path_for(self, partition: str) -> Path:
+        return self.archive_dir / f"{partition}.ndjson.gz"
+
+    def partitions(self) -> List[str]:
+        """Existing partition keys, oldest first."""
+        return sorted(p.name[: -len(".ndjson.gz")] for p in self.archive_dir.glob("*.ndjson.gz"))
+
+    def append(self, papers: Iterable[Dict]) -> Dict[str, int]:
+        """
+        Append papers to their partitions (fsync'ed before returning).
+
+        Returns:
+            Dictionary of partition key to number of papers appended
+        """
+        grouped = {}
+        for paper in papers:
+            grouped.setdefault(self.partition_for(paper), []).append(paper)
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        for partition, group in grouped.items():
+            lines = "".join(json.dumps(p, ensure_ascii=False) + "\n" for p in group)
+            member = gzip.compress(lines.encode("utf-8"), compresslevel=9, mtime=0)
+            with open(self.path_for(partition), "ab") as f:
+                f.write(member)
+                f.flush()
+                os.fsync(f.fileno())
+            self._cache.pop(partition, None)
+        return {partition: len(group) for partition, group in grouped.items()}
+
+    def read_partition(self, partition: str) -> Dict[str, Dict]:
+        """Return {id: paper} for one partition."""
+        if partition in self._cache:
+            return self._cache[partition]
+        path = self.path_for(partition)
+        if not path.exists():
+            return {}
+
+        papers = {}
+        # Split raw bytes: decoding first would let str.splitlines() break
+        # on characters like U+2028 that json.dumps leaves unescaped
+        for line in _decompress_members(path.read_bytes()).split(b"\n"):
+            if line:
+                paper = json.loads(line.decode("utf-8"))
+                papers[paper["id"]] = paper
+        self._cache[partition] = papers
+        return papers
+
+    def load(self, locations: Dict[str, str]) -> Dict[str, Dict]:
+        """
+        Load archived papers.
+
+        Args:
+            locations: Dictionary of paper id to partition key
+
+        Returns:
+            Dictionary of paper id to paper for the ids that were found
+        """
+        by_partition = {}
+        for paper_id, partition in locations.items():
+            by_partition.setdefault(partition, set()).add(paper_id)
+
+        found = {}
+        for partition, ids in by_partition.items():
+            papers = self.read_partition(partition)
+            found.update({i: copy.deepcopy(papers[i]) for i in ids if i in papers})
+        return found
+
+
+def main():
+    """Search the archive index or print an archived paper."""
+    from main import load_config
+    from store import PaperStore
+
+    if len(sys.argv) < 3 or sys.argv[1] not in ("search", "show"):
+        print(__doc__.split("Usage:")[1])
+        sys.exit(1)
+
+    config = load_config()
+    general = config.get("general", {})
+    data_dir = Path(__file__).parent.parent / general.get("data_dir", "data")
+    archive = ColdArchive(
+        data_dir / config.get("retention", {}).get("archive_dir", "archive")
+    )
+    store = PaperStore(data_dir / general.get("database_file", "papers.db"))
+
+    if sys.argv[1] == "search":
+        for row in store.search_archive(" ".join(sys.argv[2:])):
+            print(f"{row['published']}  {row['id']:<28} {row['title'][:80]}")
+    else:
+        paper = archive.load(store.archived_locations([sys.argv[2]])).get(sys.argv[2])
+        if not paper:
+            print(f"{sys.argv[2]} is not in the archive")
+            sys.exit(1)
+        print(json.dumps(paper, indent=2, ensure_ascii=False))
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Versioned intermediate artifacts exchanged by the pipeline stages.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from serialize import dumps
+from journal import atomic_write_bytes
+
+# Bump when the payload layout of any stage changes; older artifacts are
+# then treated as missing and the stage runs again
+ARTIFACT_VERSION = 1
+
+
+def content_hash(obj: Any) -> str:
+    """SHA-256 of the compact JSON encoding of obj."""
+    return hashlib.sha256(dumps(obj, compact=True)).hexdigest()
+
+
+def read_artifact(path: Path) -> Optional[Dict]:
+    """
+    Load a stage artifact.
+
+    Returns:
+        The artifact, or None if it is missing, unreadable or was written
+        with another ARTIFACT_VERSION
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            artifact = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if artifact.get("version") != ARTIFACT_VERSION:
+        return None
+    return artifact
+
+
+def write_artifact(path: Path, stage: str, input_hash: str, payload: Dict) -> Dict:
+    """
+    Write a stage artifact atomically.
+
+    The file is left untouched when its payload is unchanged, so downstream
+    stages (and git) see no change.
+
+    Args:
+        path: Destination path
+        stage: Name of the producing stage
+        input_hash: Hash of the inputs the payload was computed from
+        payload: Stage output
+
+    Returns:
+        The artifact dictionary (``content_hash`` identifies the payload)
+    """
+    digest = content_hash(payload)
+    previous = read_artifact(path)
+    if previous and previous["content_hash"] == digest and previous["input_hash"] == input_hash:
+        return previous
+
+    artifact = {
+        "version": ARTIFACT_VERSION,
+        "stage": stage,
+        "created": datetime.now().isoformat(),
+        "input_hash": input_hash,
+        "content_hash": digest,
+        "payload": payload,
+    }
+    atomic_write_bytes(Path(path), dumps(artifact, compact=True))
+    return artifact
+
+
+def is_fresh(artifact: Optional[Dict], input_hash: str) -> bool:
+    """Whether an existing artifact was computed from the same inputs."""
+    return artifact is not None and artifact.get("input_hash") == input_hash
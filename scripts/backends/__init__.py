@@ -0,0 +1,60 @@
+"""
+Summarization LLM backends for Paper Pulse.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from backends.base import LLMBackend
+from backends.dashscope import DashScopeBackend
+from backends.openai_compat import LocalServerBackend, OpenAICompatibleBackend
+
+BACKENDS = {
+    DashScopeBackend.name: DashScopeBackend,
+    OpenAICompatibleBackend.name: OpenAICompatibleBackend,
+    LocalServerBackend.name: LocalServerBackend,
+}
+
+
+def create_backend(
+    name: str = None,
+    api_key: str = None,
+    url: str = None,
+    stream: bool = False,
+    max_concurrency: int = None,
+) -> LLMBackend:
+    """
+    Create a backend by name.
+
+    Args:
+        name: "dashscope" (default), "openai" or "local"
+        api_key: Provider API key
+        url: Endpoint (dashscope) or base URL (openai/local)
+        stream: Stream responses where supported
+        max_concurrency: Parallel call limit for the local backend
+
+    Returns:
+        Configured LLMBackend instance
+    """
+    name = name or DashScopeBackend.name
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown summarizer backend '{name}' (choose from {', '.join(BACKENDS)})"
+        )
+    if name == LocalServerBackend.name:
+        return LocalServerBackend(
+            api_key=api_key, url=url, stream=stream, max_concurrency=max_concurrency or 4
+        )
+    return BACKENDS[name](api_key=api_key, url=url, stream=stream)
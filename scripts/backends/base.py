@@ -0,0 +1,121 @@
+"""
+Base class for summarization LLM backends in Paper Pulse.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+from typing import Dict, List
+
+import requests
+
+
+class LLMBackend:
+    """
+    A chat-completion provider used by ModelScopeSummarizer.
+
+    Subclasses translate a list of chat messages into the provider's request
+    format and its response back into the summarizer's result dictionary.
+    They also declare what the provider can do:
+
+    - ``supports_batching``: the server batches concurrent requests itself
+      (e.g. continuous batching in vLLM/llama.cpp), so running up to
+      ``max_concurrency`` calls in parallel is efficient
+    - ``max_concurrency``: upper bound on parallel calls the summarizer will
+      issue (None means no backend-imposed limit)
+    - ``supports_streaming``: responses can be streamed, which gives a real
+      time-to-first-token measurement
+    - ``requires_api_key``: whether a missing API key is a fatal error
+    """
+
+    name = "base"
+    DEFAULT_URL = ""
+    supports_batching = False
+    max_concurrency = None
+    supports_streaming = False
+    requires_api_key = True
+
+    def __init__(self, api_key: str = None, url: str = None, stream: bool = False):
+        """
+        Initialize backend.
+
+        Args:
+            api_key: Bearer token for the provider (may be empty for local servers)
+            url: Endpoint or base URL (default: DEFAULT_URL)
+            stream: Stream responses if the backend supports it
+        """
+        self.api_key = api_key
+        self.url = url or self.DEFAULT_URL
+        self.stream = stream and self.supports_streaming
+        # One pooled session per worker thread keeps connections warm
+        self._local = threading.local()
+
+    def capabilities(self) -> Dict:
+        """Return the declared capabilities as a dictionary."""
+        return {
+            "name": self.name,
+            "supports_batching": self.supports_batching,
+            "max_concurrency": self.max_concurrency,
+            "supports_streaming": self.supports_streaming,
+            "requires_api_key": self.requires_api_key,
+        }
+
+    def limit_concurrency(self, requested: int) -> int:
+        """Clamp a requested concurrency level to what the backend allows."""
+        requested = max(1, requested or 1)
+        if self.max_concurrency:
+            return min(requested, self.max_concurrency)
+        return requested
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def _headers(self) -> Dict:
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return headers
+
+    def complete(
+        self,
+        messages: List[Dict],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        timeout: float,
+    ) -> Dict:
+        """
+        Run one chat completion.
+
+        Args:
+            messages: Chat messages ({"role", "content"} dictionaries)
+            model: Model name
+            max_tokens: Output token limit
+            temperature: Sampling temperature
+            timeout: Request timeout in seconds
+
+        Returns:
+            Dictionary with content, finish_reason, input_tokens, output_tokens,
+            cached_tokens, status and ttfb
+
+        Raises:
+            requests.RequestException: On transport errors and non-2xx responses
+        """
+        raise NotImplementedError
@@ -0,0 +1,88 @@
+"""
+DashScope native API backend for Paper Pulse.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import Dict, List
+
+from backends.base import LLMBackend
+
+
+class DashScopeBackend(LLMBackend):
+    """DashScope text-generation API (阿里云通义千问), result_format=message."""
+
+    name = "dashscope"
+    DEFAULT_URL = (
+        "https://dashscope.aliyuncs.com/api/v1/services/aigc/text-generation/generation"
+    )
+
+    def complete(
+        self,
+        messages: List[Dict],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        timeout: float,
+    ) -> Dict:
+        payload = {
+            "model": model,
+            "input": {"messages": messages},
+            "parameters": {
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+                "result_format": "message",
+            },
+        }
+
+        response = self._session().post(
+            self.url, json=payload, headers=self._headers(), timeout=timeout
+        )
+        response.raise_for_status()
+
+        result = response.json()
+
+        # Extract summary from DashScope response format
+        content = None
+        finish_reason = None
+        if "output" in result and "choices" in result["output"]:
+            choices = result["output"]["choices"]
+            if choices and len(choices) > 0:
+                message = choices[0].get("message", {})
+                content = message.get("content", "").strip()
+                finish_reason = choices[0].get("finish_reason")
+
+        # Extract token usage information
+        input_tokens = 0
+        output_tokens = 0
+        cached_tokens = 0
+        if "usage" in result:
+            usage = result["usage"]
+            input_tokens = usage.get("input_tokens", 0)
+            output_tokens = usage.get("output_tokens", 0)
+            # Prefix-cache hits are reported as a subset of input tokens
+            details = usage.get("prompt_tokens_details") or {}
+            cached_tokens = details.get("cached_tokens", 0)
+
+        return {
+            "content": content,
+            "finish_reason": finish_reason,
+            "status": response.status_code,
+            "ttfb": response.elapsed.total_seconds(),
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "cached_tokens": cached_tokens,
+        }
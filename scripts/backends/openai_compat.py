@@ -0,0 +1,160 @@
+"""
+OpenAI-compatible chat completions backends for Paper Pulse.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import time
+from typing import Dict, List
+
+from backends.base import LLMBackend
+
+
+class OpenAICompatibleBackend(LLMBackend):
+    """
+    Generic ``POST {base_url}/chat/completions`` provider.
+
+    The default base URL is DashScope's OpenAI-compatible mode, so the same
+    API key works; any other OpenAI-style service can be used via ``url``.
+    """
+
+    name = "openai"
+    DEFAULT_URL = "https://dashscope.aliyuncs.com/compatible-mode/v1"
+    supports_streaming = True
+
+    def _endpoint(self) -> str:
+        url = self.url.rstrip("/")
+        if url.endswith("/chat/completions"):
+            return url
+        return url + "/chat/completions"
+
+    def complete(
+        self,
+        messages: List[Dict],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        timeout: float,
+    ) -> Dict:
+        payload = {
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if self.stream:
+            payload["stream"] = True
+            payload["stream_options"] = {"include_usage": True}
+
+        start = time.perf_counter()
+        response = self._session().post(
+            self._endpoint(),
+            json=payload,
+            headers=self._headers(),
+            timeout=timeout,
+            stream=self.stream,
+        )
+        response.raise_for_status()
+
+        if self.stream:
+            return self._read_stream(response, start)
+
+        result = response.json()
+        choice = (result.get("choices") or [{}])[0]
+        content = (choice.get("message") or {}).get("content") or ""
+        return self._result(
+            content,
+            choice.get("finish_reason"),
+            result.get("usage") or {},
+            response.status_code,
+            response.elapsed.total_seconds(),
+        )
+
+    def _read_stream(self, response, start: float) -> Dict:
+        """Assemble a server-sent-events response; ttfb is the first content delta."""
+        parts = []
+        finish_reason = None
+        usage = {}
+        ttfb = None
+        # Split raw bytes: decoding first would let str.splitlines() break
+        # on characters like U+0085 inside the JSON payloads
+        for raw_line in response.iter_lines():
+            line = raw_line.decode("utf-8")
+            if not line.startswith("data:"):
+                continue
+            data = line[len("data:") :].strip()
+            if data == "[DONE]":
+                break
+            chunk = json.loads(data)
+            if chunk.get("usage"):
+                usage = chunk["usage"]
+            for choice in chunk.get("choices") or []:
+                delta = (choice.get("delta") or {}).get("content")
+                if delta:
+                    if ttfb is None:
+                        ttfb = time.perf_counter() - start
+                    parts.append(delta)
+                if choice.get("finish_reason"):
+                    finish_reason = choice["finish_reason"]
+        return self._result(
+            "".join(parts),
+            finish_reason,
+            usage,
+            response.status_code,
+            ttfb if ttfb is not None else response.elapsed.total_seconds(),
+        )
+
+    @staticmethod
+    def _result(
+        content: str, finish_reason: str, usage: Dict, status: int, ttfb: float
+    ) -> Dict:
+        details = usage.get("prompt_tokens_details") or {}
+        return {
+            "content": content.strip(),
+            "finish_reason": finish_reason,
+            "status": status,
+            "ttfb": ttfb,
+            "input_tokens": usage.get("prompt_tokens", 0),
+            "output_tokens": usage.get("completion_tokens", 0),
+            "cached_tokens": details.get("cached_tokens", 0),
+        }
+
+
+class LocalServerBackend(OpenAICompatibleBackend):
+    """
+    Local inference server (llama.cpp ``llama-server``, vLLM, Ollama, ...).
+
+    These expose the OpenAI chat completions API on localhost, need no API
+    key and batch concurrent requests on the server, so the summarizer may
+    run up to ``max_concurrency`` calls in parallel (set it to the server's
+    slot count, e.g. ``llama-server --parallel 4``).
+    """
+
+    name = "local"
+    DEFAULT_URL = "http://127.0.0.1:8080/v1"
+    supports_batching = True
+    requires_api_key = False
+
+    def __init__(
+        self,
+        api_key: str = None,
+        url: str = None,
+        stream: bool = False,
+        max_concurrency: int = 4,
+    ):
+        super().__init__(api_key=api_key, url=url, stream=stream)
+        self.max_concurrency = max_concurrency
@@ -0,0 +1,448 @@
+"""
+Email digest renderer (plain text, Markdown, HTML) for Paper Pulse.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+The report is written as email_report.txt, email_report.md and
+email_report.html in one pass: every section is rendered for the three
+formats at once and appended to the three files. The text and HTML files
+are meant as the two parts of a multipart/alternative message.
+"""
+
+import os
+from datetime import datetime
+from html import escape
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from journal import make_temp_file
+from metrics import WRITE_BYTES, WRITES, file_label
+from render import render_fragments
+
+SEP = "=" * 40
+RULE = "-" * 40
+
+# Papers are written in full until the digest reaches this share of
+# max_bytes; the rest are listed by title while it stays under max_bytes
+FULL_SHARE = 0.9
+
+HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Paper Pulse Daily Report</title>
+</head>
+<body style="font-family: -apple-system, 'Segoe UI', Helvetica, Arial, sans-serif; \
+max-width: 760px; margin: 0 auto; padding: 16px; color: #222; line-height: 1.5;">
+"""
+
+# (text, markdown, html)
+Parts = Tuple[str, str, str]
+
+
+class _Output:
+    """One report file, streamed to a temp file and renamed when complete."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self.tmp_path = make_temp_file(self.path)
+        self.file = os.fdopen(fd, "w", encoding="utf-8")
+        self.size = 0
+
+    def write(self, text: str):
+        self.file.write(text)
+        self.size += len(text.encode("utf-8"))
+
+    def commit(self):
+        self.file.close()
+        os.replace(self.tmp_path, self.path)
+        WRITES.inc(file=file_label(self.path))
+        WRITE_BYTES.inc(self.size, file=file_label(self.path))
+
+    def abort(self):
+        self.file.close()
+        if os.path.exists(self.tmp_path):
+            os.unlink(self.tmp_path)
+
+
+def group_papers(papers: List[Dict], group_by: str = "keyword") -> List[Tuple[str, List[Dict]]]:
+    """
+    Group and rank the papers of a digest.
+
+    Each paper is listed once: under its first matched keyword
+    (``group_by="keyword"``), its source (``"source"``) or in a single
+    group (``"none"``). Groups are ordered by size, papers within a group by
+    keyword score and then publication date, newest first.
+
+    Returns:
+        List of (group name, papers)
+    """
+    groups: Dict[str, List[Dict]] = {}
+    for paper in papers:
+        if group_by == "keyword":
+            keywords = paper.get("keywords") or []
+            name = keywords[0] if keywords else "other"
+        elif group_by == "source":
+            name = paper.get("source") or "Unknown"
+        else:
+            name = ""
+        groups.setdefault(name, []).append(paper)
+
+    for members in groups.values():
+        members.sort(key=lambda p: p.get("published") or "", reverse=True)
+        members.sort(
+            key=lambda p: p.get("keyword_score", len(p.get("keywords") or [])), reverse=True
+        )
+    return sorted(groups.items(), key=lambda item: (-len(item[1]), item[0]))
+
+
+def _header(date_str: str) -> Parts:
+    return (
+        f"{SEP}\nPaper Pulse Daily Report\n{SEP}\nDate: {date_str}\n\n",
+        f"# Paper Pulse Daily Report\n\n**Date:** {date_str}\n\n",
+        HTML_HEAD
+        + f"<h1>Paper Pulse Daily Report</h1>\n<p><strong>Date:</strong> {date_str}</p>\n",
+    )
+
+
+def _table(title: str, rows: List[Tuple[str, str]], indent: int = 26) -> Parts:
+    text = [title.upper(), RULE]
+    text += [f"  {f'{label}:':<{indent}}{value}" for label, value in rows]
+    md = [f"## {title}", ""] + [f"- **{label}:** {value}" for label, value in rows]
+    html = [f"<h2>{escape(title)}</h2>", "<table>"]
+    html += [
+        f'<tr><td style="padding-right: 16px;">{escape(label)}</td>'
+        f"<td>{escape(str(value))}</td></tr>"
+        for label, value in rows
+    ]
+    html.append("</table>")
+    return ("\n".join(text) + "\n\n", "\n".join(md) + "\n\n", "\n".join(html) + "\n")
+
+
+def _statistics(counts: Dict[str, int], usage_stats: Dict) -> Parts:
+    stats = _table(
+        "Statistics",
+        [
+            ("New papers fetched", counts["new"]),
+            ("Retry summaries", counts["retry"]),
+            ("Failed summaries", counts["failed"]),
+            ("Total papers in database", counts["total"]),
+        ],
+    )
+    usage = (
+        "AI TOKEN USAGE\n"
+        f"{RULE}\n"
+        f"  Input tokens:  {usage_stats['input_tokens']}\n"
+        f"    Cached:      {usage_stats.get('cached_input_tokens', 0)}\n"
+        f"    Uncached:    {usage_stats.get('uncached_input_tokens', 0)}\n"
+        f"  Output tokens: {usage_stats['output_tokens']}\n"
+        f"  Total tokens:  {usage_stats['total_tokens']}\n\n"
+    )
+    rows = [
+        ("Input tokens", usage_stats["input_tokens"]),
+        ("Cached input tokens", usage_stats.get("cached_input_tokens", 0)),
+        ("Uncached input tokens", usage_stats.get("uncached_input_tokens", 0)),
+        ("Output tokens", usage_stats["output_tokens"]),
+        ("Total tokens", usage_stats["total_tokens"]),
+    ]
+    _, md, html = _table("AI Token Usage", rows)
+    return (stats[0] + usage, stats[1] + md, stats[2] + html)
+
+
+def _timings(telemetry_summary: Dict) -> Parts:
+    timings = telemetry_summary["timings"]
+    rows = [
+        (label, timings[field])
+        for label, field in [
+            ("Request latency", "latency"),
+            ("Time to 1st byte", "ttfb"),
+            ("Queue wait", "queue_wait"),
+            ("Per paper", "duration"),
+        ]
+    ]
+    status = ", ".join(f"{k}={v}" for k, v in sorted(telemetry_summary["status"].items()))
+    calls = f"API calls: {telemetry_summary['calls']} (status: {status})"
+    sleeps = [
+        ("Retry sleeps", f"{timings['retry_sleep']['sum']:.1f}s"),
+        ("Rate-limit sleeps", f"{timings['rate_limit_sleep']['sum']:.1f}s"),
+    ]
+
+    text = ["SUMMARIZER TIMINGS (seconds)", RULE, f"  {'':<18}{'p50':>7}{'p95':>7}{'p99':>7}"]
+    text += [f"  {label:<18}{t['p50']:>7.2f}{t['p95']:>7.2f}{t['p99']:>7.2f}" for label, t in rows]
+    text += [f"  {calls}"] + [f"  {f'{label}:':<19}{value}" for label, value in sleeps]
+
+    md = ["## Summarizer Timings (seconds)", "", "| | p50 | p95 | p99 |", "|---|---:|---:|---:|"]
+    md += [f"| {label} | {t['p50']:.2f} | {t['p95']:.2f} | {t['p99']:.2f} |" for label, t in rows]
+    md += ["", f"{calls}  "] + [f"{label}: {value}  " for label, value in sleeps]
+
+    html = ["<h2>Summarizer Timings (seconds)</h2>", "<table>"]
+    html.append("<tr><th></th><th>p50</th><th>p95</th><th>p99</th></tr>")
+    html += [
+        f"<tr><td>{label}</td><td>{t['p50']:.2f}</td><td>{t['p95']:.2f}</td>"
+        f"<td>{t['p99']:.2f}</td></tr>"
+        for label, t in rows
+    ]
+    html.append("</table>")
+    lines = [calls] + [f"{label}: {value}" for label, value in sleeps]
+    html.append("<p>" + "<br>".join(escape(line) for line in lines) + "</p>")
+    return ("\n".join(text) + "\n\n", "\n".join(md) + "\n\n", "\n".join(html) + "\n")
+
+
+def _group_heading(name: str, count: int, group_by: str) -> Parts:
+    label = f"{'Keyword' if group_by == 'keyword' else 'Source'}: {name} ({count})"
+    return (
+        f"{label}\n{RULE}\n\n",
+        f"## {label}\n\n",
+        f"<h2>{escape(label)}</h2>\n",
+    )
+
+
+def _entry(index: int, paper: Dict, fragments: Dict, summary_language: str) -> Parts:
+    """Full entry: metadata and the summaries in the configured language."""
+    title = paper.get("title", "Untitled")
+    url = paper.get("url", "")
+    source = paper.get("source", "Unknown")
+    published = paper.get("published", "Unknown")
+    keywords = ", ".join(paper.get("keywords", []))
+
+    text = [
+        f"[{index}] {title}",
+        f"    URL:       {url}",
+        f"    Source:    {source}",
+        f"    Published: {published}",
+    ]
+    if keywords:
+        text.append(f"    Keywords:  {keywords}")
+    text.append("")
+    md = [
+        f"### {index}. [{title}]({url})",
+        "",
+        f"**Source:** {source} | **Published:** {published}  ",
+    ]
+    if keywords:
+        md.append(f"**Keywords:** {keywords}")
+    md.append("")
+    html = [
+        f'<h3>{index}. <a href="{escape(url)}">{escape(title)}</a></h3>',
+        '<p style="color: #666; font-size: 0.9em;">'
+        f"Source: {escape(source)} | Published: {escape(published)}"
+        + (f"<br>Keywords: {escape(keywords)}" if keywords else "")
+        + "</p>",
+    ]
+
+    sections = []
+    if summary_language in ("zh", "both") and paper.get("summary_zh"):
+        sections.append(
+            ("Chinese Summary", fragments["text_zh"], paper["summary_zh"], fragments["html_zh"])
+        )
+    if summary_language in ("en", "both") and paper.get("summary_en"):
+        sections.append(
+            ("English Summary", fragments["text_en"], paper["summary_en"], fragments["html_en"])
+        )
+    if sections:
+        for heading, summary_text, summary_md, summary_html in sections:
+            if summary_language == "both":
+                text.append(f"    -- {heading} --")
+                md += [f"#### {heading}", ""]
+                html.append(f"<h4>{heading}</h4>")
+            text += ["", summary_text, ""]
+            md += [summary_md.strip(), ""]
+            html.append(summary_html.strip())
+    else:
+        text += ["    -- Abstract --", "", fragments["text_abstract"], ""]
+        md += ["#### Abstract", "", paper.get("abstract", "No summary available."), ""]
+        abstract = paper.get("abstract", "No summary available.")
+        html += ["<h4>Abstract</h4>", f"<p>{escape(abstract)}</p>"]
+
+    text += [RULE, ""]
+    md += ["---", ""]
+    html.append("<hr>")
+    return ("\n".join(text) + "\n", "\n".join(md) + "\n", "\n".join(html) + "\n")
+
+
+def _line(index: int, paper: Dict) -> Parts:
+    """Title-only entry used once the digest nears its size cap."""
+    title = paper.get("title", "Untitled")
+    url = paper.get("url", "")
+    return (
+        f"[{index}] {title}\n    {url}\n",
+        f"- {index}. [{title}]({url})\n",
+        f'<li><a href="{escape(url)}">{escape(title)}</a></li>\n',
+    )
+
+
+def _omitted(count: int, site_url: str) -> Parts:
+    note = f"{count} more papers are not included to keep this email small."
+    link = f" View all: {site_url}" if site_url else ""
+    return (
+        f"... {note}{link}\n\n",
+        f"*{note}{' [View all](' + site_url + ')' if site_url else ''}*\n\n",
+        f"<p><em>{escape(note)}"
+        + (f' <a href="{escape(site_url)}">View all</a>' if site_url else "")
+        + "</em></p>\n",
+    )
+
+
+def _footer(site_url: str) -> Parts:
+    text, md, html = "", "", ""
+    if site_url:
+        text += f"LINKS\n{RULE}\n  View Papers: {site_url}\n\n"
+        md += f"## Links\n\n- [View Papers]({site_url})\n\n"
+        html += f'<p><a href="{escape(site_url)}">View Papers</a></p>\n'
+    credit = "Powered by arXiv, IACR ePrint, and DashScope (Qwen)."
+    text += f"{SEP}\nThis is an automated report from Paper Pulse.\n{credit}\n{SEP}"
+    md += f"---\n\n*This is an automated report from Paper Pulse. {credit}*\n"
+    html += (
+        '<p style="color: #888; font-size: 0.85em;">This is an automated report from Paper Pulse. '
+        "Powered by arXiv, IACR ePrint, and DashScope (Qwen).</p>\n</body>\n</html>\n"
+    )
+    return (text, md, html)
+
+
+def generate_email_report(
+    new_papers: list,
+    retry_papers: list,
+    failed_papers: list,
+    total_count: int,
+    usage_stats: dict,
+    output_path: Path,
+    site_url: str,
+    summary_language: str = "zh",
+    telemetry_summary: dict = None,
+    renders: dict = None,
+    group_by: str = "keyword",
+    max_bytes: int = 100_000,
+) -> Dict:
+    """Write the email report as plain text, Markdown and HTML.
+
+    Args:
+        output_path: Path of the text report; the Markdown and HTML reports
+            are written next to it with the .md and .html suffixes.
+        summary_language: Which summary to include in the email.
+            "zh" = Chinese only, "en" = English only, "both" = both.
+        telemetry_summary: Output of SummaryTelemetry.summary(); adds a
+            p50/p95/p99 timing section when any calls were made.
+        renders: {id: fragments} from RenderCache; other papers are
+            rendered here.
+        group_by: Group papers by "keyword", "source" or "none".
+        max_bytes: Size cap of each report (0 for none). Papers are written
+            in full up to 90% of the cap and listed by title up to the cap;
+            the rest are only counted.
+
+    Returns:
+        Dictionary with the numbers of papers written in ``full``, listed by
+        title (``compact``) and ``omitted``, and the ``bytes`` per format
+    """
+    renders = renders or {}
+    output_path = Path(output_path)
+    paths = [output_path, output_path.with_suffix(".md"), output_path.with_suffix(".html")]
+    outputs = []
+    try:
+        for path in paths:
+            outputs.append(_Output(path))
+
+        def emit(parts: Parts):
+            for out, part in zip(outputs, parts):
+                out.write(part)
+
+        def size_after(parts: Parts) -> int:
+            return max(out.size + len(part.encode("utf-8")) for out, part in zip(outputs, parts))
+
+        papers = new_papers + retry_papers
+        emit(_header(datetime.now().strftime("%Y-%m-%d %H:%M UTC")))
+        emit(
+            _statistics(
+                {
+                    "new": len(new_papers),
+                    "retry": len(retry_papers),
+                    "failed": len(failed_papers),
+                    "total": total_count,
+                },
+                usage_stats,
+            )
+        )
+        if telemetry_summary and telemetry_summary.get("calls"):
+            emit(_timings(telemetry_summary))
+
+        footer = _footer(site_url)
+        # Room for the footer and the omission note
+        reserve = max(len(p.encode("utf-8")) for p in footer) + 512
+        cap = max_bytes - reserve if max_bytes else None
+        full = compact = omitted = 0
+
+        if papers:
+            emit(
+                (
+                    f"{SEP}\nNEW PAPERS ({len(papers)})\n{SEP}\n\n",
+                    f"## New Papers ({len(papers)})\n\n",
+                    f"<h2>New Papers ({len(papers)})</h2>\n",
+                )
+            )
+            index = 0
+            in_list = False
+            for name, members in group_papers(papers, group_by):
+                if group_by != "none" and not omitted:
+                    heading = _group_heading(name, len(members), group_by)
+                    if cap is None or size_after(heading) <= cap:
+                        if in_list:
+                            emit(("", "", "</ul>\n"))
+                            in_list = False
+                        emit(heading)
+                for paper in members:
+                    index += 1
+                    if omitted:
+                        omitted += 1
+                        continue
+                    if not compact:
+                        fragments = renders.get(paper.get("id")) or render_fragments(paper)
+                        entry = _entry(index, paper, fragments, summary_language)
+                        if cap is None or size_after(entry) <= cap * FULL_SHARE:
+                            emit(entry)
+                            full += 1
+                            continue
+                    line = _line(index, paper)
+                    if size_after(line) + len("</ul>\n") > cap:
+                        omitted += 1
+                        continue
+                    if not in_list:
+                        emit(("", "", "<ul>\n"))
+                        in_list = True
+                    emit(line)
+                    compact += 1
+            if in_list:
+                emit(("\n", "\n", "</ul>\n"))
+            if omitted:
+                emit(_omitted(omitted, site_url))
+        else:
+            none = "No new papers in this run."
+            emit((f"{none}\n\n", f"{none}\n\n", f"<p>{none}</p>\n"))
+
+        emit(footer)
+        for out in outputs:
+            out.commit()
+    except BaseException:
+        for out in outputs:
+            out.abort()
+        raise
+
+    sizes = {path.suffix.lstrip("."): out.size for path, out in zip(paths, outputs)}
+    truncated = f", {compact} listed by title, {omitted} omitted" if compact or omitted else ""
+    print(
+        f"✓ Generated email report at {output_path} (+ .md, .html; "
+        f"{full} papers in full{truncated})"
+    )
+    return {"full": full, "compact": compact, "omitted": omitted, "bytes": sizes}
@@ -20,9 +20,12 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import requests
 import time
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict
+from typing import Dict, Iterator, List
 import xml.etree.ElementTree as ET
 
+from metrics import observe_fetch
+from tracing import span
+
 
 class ArxivFetcher:
     """Fetches papers from arXiv API."""
@@ -60,6 +63,9 @@ class ArxivFetcher:
         self.categories = categories or self.DEFAULT_CATEGORIES
         self.batch_size = batch_size or self.DEFAULT_BATCH_SIZE
         self.max_results = max_results or self.DEFAULT_MAX_RESULTS
+        # Keep-alive connections are reused across categories, pages and polls
+        self.session = requests.Session()
+        self.last_error = None
 
     def fetch_papers(self) -> List[Dict]:
         """
@@ -68,25 +74,35 @@ class ArxivFetcher:
         Returns:
             List of paper dictionaries with metadata
         """
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=self.days_back)
-        all_papers = []
+        unique_papers = list(self.iter_papers())
+        print(f"Fetched {len(unique_papers)} unique papers from arXiv")
+        return unique_papers
 
-        for category in self.categories:
-            print(f"Fetching from arXiv category: {category}")
-            papers = self._fetch_category(category, cutoff_date)
-            all_papers.extend(papers)
-            time.sleep(self.delay)
+    def iter_papers(self, since: datetime = None) -> Iterator[Dict]:
+        """
+        Yield recent papers as each result page is parsed.
 
+        Papers listed in several categories are yielded once, in the same
+        order fetch_papers() returns them.
+
+        Args:
+            since: Stop at papers submitted before this (timezone-aware)
+                time instead of the start of the ``days_back`` window
+        """
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=self.days_back)
+        if since is not None:
+            cutoff_date = max(cutoff_date, since)
+        self.last_error = None
         # Remove duplicates (papers can appear in multiple categories)
         seen_ids = set()
-        unique_papers = []
-        for paper in all_papers:
-            if paper["id"] not in seen_ids:
-                seen_ids.add(paper["id"])
-                unique_papers.append(paper)
 
-        print(f"Fetched {len(unique_papers)} unique papers from arXiv")
-        return unique_papers
+        for category in self.categories:
+            print(f"Fetching from arXiv category: {category}")
+            for paper in self._iter_category(category, cutoff_date):
+                if paper["id"] not in seen_ids:
+                    seen_ids.add(paper["id"])
+                    yield paper
+            time.sleep(self.delay)
 
     def _fetch_category(self, category: str, cutoff_date: datetime) -> List[Dict]:
         """
@@ -99,7 +115,16 @@ class ArxivFetcher:
         Returns:
             List of paper dictionaries
         """
-        papers = []
+        return list(self._iter_category(category, cutoff_date))
+
+    def _iter_category(self, category: str, cutoff_date: datetime) -> Iterator[Dict]:
+        """
+        Yield papers from a specific arXiv category, page by page.
+
+        Args:
+            category: arXiv category (e.g., 'cs.CR')
+            cutoff_date: Only fetch papers after this date
+        """
         start = 0
 
         while True:
@@ -111,21 +136,27 @@ class ArxivFetcher:
                 "sortOrder": "descending",
             }
 
-            try:
-                response = requests.get(self.BASE_URL, params=params, timeout=30)
-                response.raise_for_status()
-            except requests.RequestException as e:
-                print(f"Error fetching from arXiv category {category}: {e}")
-                break
-
-            # Parse XML response
-            root = ET.fromstring(response.content)
             namespace = {
                 "atom": "http://www.w3.org/2005/Atom",
                 "arxiv": "http://arxiv.org/schemas/atom",
             }
-
-            entries = root.findall("atom:entry", namespace)
+            with span("arxiv.page", cat="fetch", category=category, start=start) as page:
+                response = None
+                started = time.perf_counter()
+                try:
+                    response = self.session.get(self.BASE_URL, params=params, timeout=30)
+                    response.raise_for_status()
+                except requests.RequestException as e:
+                    print(f"Error fetching from arXiv category {category}: {e}")
+                    self.last_error = e
+                    break
+                finally:
+                    observe_fetch("arXiv", response, time.perf_counter() - started)
+
+                # Parse XML response
+                root = ET.fromstring(response.content)
+                entries = root.findall("atom:entry", namespace)
+                page.args.update(bytes=len(response.content), entries=len(entries))
 
             if not entries:
                 break
@@ -157,7 +188,7 @@ class ArxivFetcher:
 
                     # Stop if we've gone past the cutoff date
                     if published_date < cutoff_date:
-                        return papers
+                        return
 
                     # Extract paper metadata
                     paper_id = id_elem.text.split("/abs/")[-1]
@@ -189,29 +220,27 @@ class ArxivFetcher:
                         if term and term not in categories:
                             categories.append(term)
 
-                    papers.append(
-                        {
-                            "id": f"arxiv_{paper_id}",
-                            "arxiv_id": paper_id,
-                            "title": title,
-                            "authors": authors,
-                            "abstract": abstract,
-                            "published": published_date.strftime("%Y-%m-%d"),
-                            "source": "arXiv",
-                            "pdf_link": pdf_link,
-                            "url": f"https://arxiv.org/abs/{paper_id}",
-                            "categories": categories,
-                            "published_official": True,
-                        }
-                    )
+                    paper = {
+                        "id": f"arxiv_{paper_id}",
+                        "arxiv_id": paper_id,
+                        "title": title,
+                        "authors": authors,
+                        "abstract": abstract,
+                        "published": published_date.strftime("%Y-%m-%d"),
+                        "source": "arXiv",
+                        "pdf_link": pdf_link,
+                        "url": f"https://arxiv.org/abs/{paper_id}",
+                        "categories": categories,
+                        "published_official": True,
+                    }
                 except (AttributeError, ValueError) as e:
                     print(f"Error parsing entry: {e}")
                     continue
 
+                yield paper
+
             start += self.batch_size
 
             # Limit to avoid excessive requests
             if start >= self.max_results:
                 break
-
-        return papers
@@ -20,8 +20,11 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import requests
 import feedparser
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List
+
+from metrics import observe_fetch
+from tracing import span
 
 
 class IACRFetcher:
@@ -39,6 +42,11 @@ class IACRFetcher:
         """
         self.days_back = days_back
         self.delay = delay
+        self.session = requests.Session()
+        self.last_error = None
+        # Validators of the last fetched feed, for conditional requests
+        self.etag = None
+        self.last_modified = None
 
     def fetch_papers(self) -> List[Dict]:
         """
@@ -47,8 +55,26 @@ class IACRFetcher:
         Returns:
             List of paper dictionaries with metadata
         """
+        return list(self.iter_papers())
+
+    def iter_papers(self, since: datetime = None) -> Iterator[Dict]:
+        """
+        Yield recent papers from IACR ePrint as the feed entries are parsed.
+
+        When the feed was fetched before by this instance, it is requested
+        conditionally and nothing is yielded if it has not changed.
+
+        Args:
+            since: Skip papers published before this time instead of the
+                start of the ``days_back`` window
+        """
         cutoff_date = datetime.now() - timedelta(days=self.days_back)
-        papers = []
+        if since is not None:
+            # Feed dates are parsed as naive UTC
+            since = since.astimezone(timezone.utc).replace(tzinfo=None)
+            cutoff_date = max(cutoff_date, since)
+        self.last_error = None
+        count = 0
 
         print("Fetching from IACR ePrint archive")
 
@@ -58,11 +84,25 @@ class IACRFetcher:
                 'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101 Firefox/115.0',
                 'Accept': 'application/rss+xml, application/xml, text/xml, */*',
             }
-            response = requests.get(self.RSS_URL, timeout=30, headers=headers)
-            response.raise_for_status()
-
-            # Parse RSS feed
-            feed = feedparser.parse(response.content)
+            if self.etag:
+                headers['If-None-Match'] = self.etag
+            if self.last_modified:
+                headers['If-Modified-Since'] = self.last_modified
+            with span("iacr.feed", cat="fetch") as request:
+                response = None
+                started = time.perf_counter()
+                try:
+                    response = self.session.get(self.RSS_URL, timeout=30, headers=headers)
+                finally:
+                    observe_fetch("IACR", response, time.perf_counter() - started)
+                if response.status_code == 304:
+                    print("IACR feed not modified since the last poll")
+                    return
+                response.raise_for_status()
+
+                # Parse RSS feed
+                feed = feedparser.parse(response.content)
+                request.args.update(bytes=len(response.content), entries=len(feed.entries))
 
             for entry in feed.entries:
                 # Parse publication date
@@ -104,7 +144,8 @@ class IACRFetcher:
                 # Construct PDF link
                 pdf_link = f"https://eprint.iacr.org/{paper_id}.pdf"
 
-                papers.append({
+                count += 1
+                yield {
                     'id': f'iacr_{paper_id}',
                     'iacr_id': paper_id,
                     'title': title,
@@ -116,14 +157,18 @@ class IACRFetcher:
                     'url': entry.link,
                     'categories': ['Cryptography'],
                     'published_official': True  # IACR papers are preprints
-                })
+                }
 
-            print(f"Fetched {len(papers)} papers from IACR")
+            print(f"Fetched {count} papers from IACR")
+            # Only a fully processed feed may be answered with 304 next time
+            self.etag = response.headers.get('ETag')
+            self.last_modified = response.headers.get('Last-Modified')
 
         except requests.RequestException as e:
             print(f"Error fetching from IACR: {e}")
+            self.last_error = e
         except Exception as e:
             print(f"Error parsing IACR feed: {e}")
+            self.last_error = e
 
         time.sleep(self.delay)
-        return papers
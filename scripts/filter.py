@@ -88,29 +88,46 @@ class KeywordFilter:
                 paper['keyword_score'] = 0
             return papers
 
-        filtered = []
+        filtered = [paper for paper in papers if self.match_paper(paper)]
 
-        for paper in papers:
-            # Combine title and abstract for keyword matching
-            text = f"{paper['title']} {paper['abstract']}".lower()
+        print(f"Filtered {len(filtered)} papers out of {len(papers)} (matched keywords)")
+        return filtered
 
-            # Check if any rule matches (OR logic between rules)
-            matched_keywords = set()
-            rule_matched = False
+    def match_paper(self, paper: Dict) -> bool:
+        """
+        Check a single paper against the keyword rules.
 
-            for rule in self.keyword_rules:
-                # Check if ALL keywords in this rule match (AND logic within rule)
-                if self._rule_matches(text, rule):
-                    rule_matched = True
-                    matched_keywords.update(rule)
+        Sets the 'keywords' and 'keyword_score' fields on a match. Every paper
+        matches when no rules are defined.
 
-            if rule_matched:
-                paper['keywords'] = list(matched_keywords)
-                paper['keyword_score'] = len(matched_keywords)
-                filtered.append(paper)
+        Args:
+            paper: Paper dictionary
 
-        print(f"Filtered {len(filtered)} papers out of {len(papers)} (matched keywords)")
-        return filtered
+        Returns:
+            True if the paper should be kept
+        """
+        if not self.keyword_rules:
+            paper['keywords'] = []
+            paper['keyword_score'] = 0
+            return True
+
+        # Combine title and abstract for keyword matching
+        text = f"{paper['title']} {paper['abstract']}".lower()
+
+        # Check if any rule matches (OR logic between rules)
+        matched_keywords = set()
+        rule_matched = False
+
+        for rule in self.keyword_rules:
+            # Check if ALL keywords in this rule match (AND logic within rule)
+            if self._rule_matches(text, rule):
+                rule_matched = True
+                matched_keywords.update(rule)
+
+        if rule_matched:
+            paper['keywords'] = list(matched_keywords)
+            paper['keyword_score'] = len(matched_keywords)
+        return rule_matched
 
     def _rule_matches(self, text: str, keywords: List[str]) -> bool:
         """
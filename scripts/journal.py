@@ -0,0 +1,210 @@
+"""
+Crash-safe output helpers for Paper Pulse: summary journal and atomic writes.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+from metrics import WRITE_BYTES, WRITES, file_label
+from tracing import span
+
+
+def _file_mode() -> int:
+    # os.umask() can only be read by setting it; done once, at import
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Mode of a file created by open(). mkstemp() creates 0600 files, which a
+# web server running as another user could not read.
+FILE_MODE = _file_mode()
+
+
+def make_temp_file(filepath: Path) -> tuple:
+    """
+    Create the temp file a write to ``filepath`` goes through, with the
+    permissions open() would have given the file.
+
+    Returns:
+        Tuple of (fd, temp path), as tempfile.mkstemp()
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.")
+    if hasattr(os, "fchmod"):
+        os.fchmod(fd, FILE_MODE)
+    return fd, tmp_path
+
+
+def atomic_write_bytes(filepath: Path, data: bytes):
+    """
+    Replace a file atomically: write a temp file in the same directory,
+    fsync it, then rename it over the destination.
+    """
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    with span("write", cat="io", file=filepath.name, bytes=len(data)):
+        fd, tmp_path = make_temp_file(filepath)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    WRITES.inc(file=file_label(filepath))
+    WRITE_BYTES.inc(len(data), file=file_label(filepath))
+
+
+def atomic_write_text(filepath: Path, text: str):
+    """UTF-8 text variant of atomic_write_bytes()."""
+    atomic_write_bytes(filepath, text.encode("utf-8"))
+
+
+class SummaryJournal:
+    """
+    Append-only NDJSON journal of summarization results.
+
+    batch_summarize() appends each paper as soon as it is done, so a run that
+    dies mid-way keeps every summary already paid for. Lines are flushed on
+    every append and fsync'ed in batches (every ``fsync_every`` records or
+    ``fsync_interval`` seconds, whichever comes first). On the next start
+    compact_journal() folds the journal into the paper store.
+    """
+
+    def __init__(self, path: Path, fsync_every: int = 10, fsync_interval: float = 2.0):
+        """
+        Open the journal for appending.
+
+        Args:
+            path: Journal file path
+            fsync_every: fsync after this many unsynced records
+            fsync_interval: fsync when the oldest unsynced record is this old (seconds)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self.count = 0
+
+    def append(self, paper: Dict):
+        """Record one finished paper (thread-safe)."""
+        line = json.dumps(
+            {"ts": datetime.now().isoformat(), "paper": paper}, ensure_ascii=False
+        )
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            self._pending += 1
+            self.count += 1
+            if (
+                self._pending >= self.fsync_every
+                or time.monotonic() - self._last_sync >= self.fsync_interval
+            ):
+                self._sync_locked()
+
+    def _sync_locked(self):
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def sync(self):
+        """Force pending records to disk."""
+        with self._lock:
+            if self._pending:
+                self._sync_locked()
+
+    def close(self):
+        """Sync and close the journal file."""
+        with self._lock:
+            if not self._file.closed:
+                if self._pending:
+                    self._sync_locked()
+                self._file.close()
+
+    def discard(self):
+        """Close and delete the journal once its results are committed to the store."""
+        self.close()
+        if self.path.exists():
+            self.path.unlink()
+
+
+def replay_journal(path: Path) -> List[Dict]:
+    """
+    Read every complete record from a journal.
+
+    A torn final line (the process died mid-write) is skipped. Later records
+    for the same paper id win.
+
+    Returns:
+        List of journaled papers in first-seen order
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+
+    papers = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                paper = json.loads(line)["paper"]
+            except (ValueError, KeyError):
+                continue
+            papers[paper["id"]] = paper
+    return list(papers.values())
+
+
+def compact_journal(path: Path, store) -> int:
+    """
+    Fold a journal into the paper store and remove it.
+
+    Successful summaries are upserted in one store transaction; only after
+    that commit is the journal deleted, so a crash in between just replays
+    the same (idempotent) upserts next time. Failed entries are dropped: those
+    papers are not in the store and will be summarized again.
+
+    Args:
+        path: Journal file path
+        store: PaperStore to fold into
+
+    Returns:
+        Number of summaries recovered into the store
+    """
+    path = Path(path)
+    papers = replay_journal(path)
+    recovered = [p for p in papers if p.get("summary_status") == "success"]
+    if recovered:
+        store.upsert(recovered)
+    if path.exists():
+        path.unlink()
+    return len(recovered)
@@ -18,20 +18,39 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import argparse
 import os
 import sys
-import json
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from fetchers.arxiv import ArxivFetcher
-from fetchers.iacr import IACRFetcher
+# Only lightweight modules are imported here; fetchers (requests, feedparser,
+# ElementTree), the summarizer backends and the RSS writer are imported by
+# the stages that need them, so e.g. `publish` starts quickly
 from filter import KeywordFilter
-from summarizer import ModelScopeSummarizer
-from rss import generate_rss_feed
+from shards import (
+    read_snapshot,
+    snapshot_digest,
+    write_listing,
+    write_shards,
+    write_snapshot,
+)
+from search_index import write_search_index
+from retry_queue import RetryQueue
+from archive import ColdArchive
+from store import PaperStore, profile_view
+from render import RENDER_VERSION, RenderCache, site_paper
+from digest import generate_email_report
+from profiles import Profile, ProfileFilter, load_profiles
+from artifacts import content_hash, is_fresh, read_artifact, write_artifact
+from journal import SummaryJournal, compact_journal
+from serialize import encoder_name, precompress_formats
+from tracing import StageProfiler, get_tracer, slugify, span
+import metrics
 
 # Load TOML config (Python 3.11+ has tomllib built-in)
 try:
@@ -65,199 +84,88 @@ except ImportError:
         print(f"Warning: {msg}")
 
 
-def _wrap_text(text: str, width: int = 72) -> str:
-    """Wrap text to given width, preserving existing line breaks."""
-    import textwrap
+def profile_papers(papers: list, profile: Profile) -> list:
+    """Copies of the papers that belong to a profile, as that profile publishes them."""
+    return [profile_view(dict(p), profile.name) for p in papers if profile.includes(p)]
 
-    result_lines = []
-    for paragraph in text.split("\n"):
-        if not paragraph.strip():
-            result_lines.append("")
-        else:
-            result_lines.extend(textwrap.wrap(paragraph, width=width))
-    return "\n".join(result_lines)
-
-
-def generate_email_report(
-    new_papers: list,
-    retry_papers: list,
-    failed_papers: list,
-    total_count: int,
-    usage_stats: dict,
-    output_path: Path,
-    site_url: str,
-    summary_language: str = "zh",
-):
-    """Generate a plain-text email report with paper details and summaries.
 
-    Args:
-        summary_language: Which summary to include in the email.
-            "zh" = Chinese only, "en" = English only, "both" = both.
+def publish_profile(
+    profile: Profile,
+    store: PaperStore,
+    compact: bool = True,
+    precompress: list = None,
+    rss_max_items: int = None,
+    rss_config: dict = None,
+    renders: RenderCache = None,
+    search_index: bool = True,
+    listing: bool = True,
+) -> dict:
     """
-    lines = []
-    date_str = datetime.now().strftime("%Y-%m-%d %H:%M UTC")
-    sep = "=" * 40
-
-    lines.append(sep)
-    lines.append("Paper Pulse Daily Report")
-    lines.append(sep)
-    lines.append(f"Date: {date_str}")
-    lines.append("")
-
-    # Statistics
-    lines.append("STATISTICS")
-    lines.append("-" * 40)
-    lines.append(f"  New papers fetched:       {len(new_papers)}")
-    lines.append(f"  Retry summaries:          {len(retry_papers)}")
-    lines.append(f"  Failed summaries:         {len(failed_papers)}")
-    lines.append(f"  Total papers in database: {total_count}")
-    lines.append("")
-
-    lines.append("AI TOKEN USAGE")
-    lines.append("-" * 40)
-    lines.append(f"  Input tokens:  {usage_stats['input_tokens']}")
-    lines.append(f"  Output tokens: {usage_stats['output_tokens']}")
-    lines.append(f"  Total tokens:  {usage_stats['total_tokens']}")
-    lines.append("")
-
-    # New papers section
-    all_report_papers = new_papers + retry_papers
-    if all_report_papers:
-        lines.append(sep)
-        lines.append(f"NEW PAPERS ({len(all_report_papers)})")
-        lines.append(sep)
-        lines.append("")
-
-        for i, paper in enumerate(all_report_papers, 1):
-            title = paper.get("title", "Untitled")
-            url = paper.get("url", "")
-            source = paper.get("source", "Unknown")
-            published = paper.get("published", "Unknown")
-            keywords = paper.get("keywords", [])
-            summary_zh = paper.get("summary_zh", "")
-            summary_en = paper.get("summary_en", "")
-
-            lines.append(f"[{i}] {title}")
-            lines.append(f"    URL:       {url}")
-            lines.append(f"    Source:    {source}")
-            lines.append(f"    Published: {published}")
-            if keywords:
-                lines.append(f"    Keywords:  {', '.join(keywords)}")
-            lines.append("")
-
-            has_summary = False
-
-            if summary_language in ("zh", "both") and summary_zh:
-                if summary_language == "both":
-                    lines.append("    -- Chinese Summary --")
-                lines.append("")
-                lines.append(_wrap_text(summary_zh))
-                lines.append("")
-                has_summary = True
-
-            if summary_language in ("en", "both") and summary_en:
-                if summary_language == "both":
-                    lines.append("    -- English Summary --")
-                lines.append("")
-                lines.append(_wrap_text(summary_en))
-                lines.append("")
-                has_summary = True
-
-            if not has_summary:
-                abstract = paper.get("abstract", "No summary available.")
-                lines.append("    -- Abstract --")
-                lines.append("")
-                lines.append(_wrap_text(abstract))
-                lines.append("")
-
-            lines.append("-" * 40)
-            lines.append("")
-    else:
-        lines.append("No new papers in this run.")
-        lines.append("")
-
-    # Links
-    if site_url:
-        lines.append("LINKS")
-        lines.append("-" * 40)
-        lines.append(f"  View Papers: {site_url}")
-        lines.append("")
-
-    lines.append(sep)
-    lines.append("This is an automated report from Paper Pulse.")
-    lines.append("Powered by arXiv, IACR ePrint, and DashScope (Qwen).")
-    lines.append(sep)
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-    print(f"✓ Generated email report at {output_path}")
-
-
-def load_existing_data(filepath: Path) -> dict:
-    """Load existing papers data."""
-    if filepath.exists():
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {"papers": [], "last_updated": None}
-
-
-def save_data(filepath: Path, data: dict):
-    """Save papers data to JSON file."""
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"✓ Saved data to {filepath}")
-
-
-def remove_old_papers(papers: list, days: int = 7) -> list:
-    """Remove papers older than specified days."""
-    cutoff = datetime.now() - timedelta(days=days)
-    filtered = []
+    Write one profile's papers.json, day shards, listing, search index and
+    (optionally) RSS feeds.
 
-    for paper in papers:
-        try:
-            paper_date = datetime.strptime(paper["published"], "%Y-%m-%d")
-            if paper_date >= cutoff:
-                filtered.append(paper)
-        except (ValueError, KeyError):
-            filtered.append(paper)
-
-    removed = len(papers) - len(filtered)
-    if removed > 0:
-        print(f"✓ Removed {removed} papers older than {days} days")
-
-    return filtered
-
-
-def merge_papers(existing: list, new: list) -> list:
-    """Merge new papers with existing, avoiding duplicates and updating with new data."""
-    existing_dict = {p["id"]: p for p in existing}
-
-    new_count = 0
-    updated_count = 0
-    for paper in new:
-        if paper["id"] not in existing_dict:
-            existing_dict[paper["id"]] = paper
-            new_count += 1
-        else:
-            if paper.get("summary_status") == "success":
-                existing_dict[paper["id"]] = paper
-                updated_count += 1
+    Args:
+        profile: Profile whose outputs are written
+        store: Shared paper store
+        compact: Write compact JSON
+        precompress: Compressed siblings to write, e.g. ["gz", "br"]
+        rss_max_items: Feed size; None skips the feeds
+        rss_config: The [rss] section (focused feeds, formats)
+        renders: Render cache; the summary HTML replaces the Markdown in the
+            day shards and is reused by the feeds (papers.json keeps Markdown)
+        search_index: Write search_index.json for the site's search box
+        listing: Write listing.json, the slim list the site loads first
+
+    Returns:
+        The exported papers.json data
+    """
+    from rss import generate_feeds
 
-    print(f"✓ Added {new_count} new papers, updated {updated_count} papers")
-    return list(existing_dict.values())
+    papers_data = store.export_json(
+        profile.papers_file,
+        compact=compact,
+        precompress=precompress,
+        profile=profile.name,
+    )
+    if renders:
+        renders.annotate(papers_data["papers"])
+    manifest = write_shards(
+        [site_paper(p) for p in papers_data["papers"]],
+        profile.shard_dir,
+        profile.manifest_file,
+        papers_data["last_updated"],
+        compact=compact,
+    )
+    papers = papers_data["papers"]
+    if listing:
+        write_listing(papers, manifest, profile.listing_file, precompress=precompress)
+    if search_index:
+        write_search_index(papers, profile.search_index_file, precompress=precompress)
+    if rss_max_items is not None:
+        rss_config = rss_config or {}
+        generate_feeds(
+            papers=papers_data["papers"],
+            output_path=profile.feed_path,
+            feeds_dir=profile.feed_path.parent / rss_config.get("feeds_dir", "feeds"),
+            site_url=profile.site_url,
+            max_items=rss_max_items,
+            per_source=rss_config.get("per_source", True),
+            per_keyword=rss_config.get("per_keyword", True),
+            formats=rss_config.get("formats", ["rss", "atom", "json"]),
+            precompress=precompress,
+        )
+    return papers_data
 
 
 def retry_failed_summaries(
-    failed_papers: list, summarizer: ModelScopeSummarizer
+    failed_papers: list, summarizer: "ModelScopeSummarizer", journal: SummaryJournal = None
 ) -> tuple:
     """Retry summarization for failed papers."""
     if not failed_papers:
         return [], []
 
     print(f"\nRetrying {len(failed_papers)} previously failed papers...")
-    return summarizer.batch_summarize(failed_papers)
+    return summarizer.batch_summarize(failed_papers, journal=journal)
 
 
 def load_config() -> dict:
@@ -272,297 +180,1094 @@ def load_config() -> dict:
         return {}
 
 
-def main():
-    """Main execution function."""
-    print("=" * 70)
-    print("📚 Paper Aggregator - Starting")
-    print("=" * 70)
+# Summarizer settings that change the produced summaries (endpoint, timeouts
+# and concurrency do not, so they don't invalidate summarize.json)
+SUMMARY_CONFIG_KEYS = (
+    "backend",
+    "model",
+    "max_tokens",
+    "temperature",
+    "prompt_template",
+    "cascade_models",
+    "escalate_score",
+)
 
-    # Load configuration
-    config = load_config()
+ROOT = Path(__file__).parent.parent
+
+
+class Settings:
+    """Paths and options resolved from config.toml, shared by all stages."""
+
+    def __init__(self, config: dict):
+        general = config.get("general", {})
+        keywords_config = config.get("keywords", {})
+        output_config = config.get("output", {})
+
+        self.config = config
+        self.days_back = general.get("days_back", 7)
+        self.data_dir = ROOT / general.get("data_dir", "data")
+        self.papers_file = self.data_dir / general.get("papers_file", "papers.json")
+        self.papers_db = self.data_dir / general.get("database_file", "papers.db")
+        self.failed_file = self.data_dir / general.get("failed_file", "failed.json")
+        self.dead_letter_file = self.data_dir / general.get(
+            "dead_letter_file", "dead_letter.json"
+        )
+        self.journal_file = self.data_dir / general.get("journal_file", "summaries.journal")
+        self.snapshot_dir = self.data_dir / general.get("snapshot_dir", "store")
+        self.stage_dir = self.data_dir / general.get("stage_dir", "stages")
+        self.compact_json = output_config.get("compact_json", True)
+        self.precompress = precompress_formats(output_config.get("precompress", []))
+        self.search_index = output_config.get("search_index", True)
+        self.listing = output_config.get("listing", True)
+        self.apply_to_arxiv = keywords_config.get("apply_to_arxiv", True)
+        self.apply_to_iacr = keywords_config.get("apply_to_iacr", True)
+        work_queue_config = config.get("work_queue", {})
+        self.work_queue = work_queue_config.get("enabled", False)
+        self.work_queue_file = self.data_dir / work_queue_config.get("path", "work_queue.db")
+        # Queue workers are fed in one batch, not through the streaming stages
+        self.streaming = config.get("pipeline", {}).get("streaming", True) and not self.work_queue
+
+    def stage_path(self, stage: str) -> Path:
+        return self.stage_dir / f"{stage}.json"
+
+
+def make_profiles(settings: Settings) -> tuple:
+    """
+    Keyword rules: either one set (the classic single deployment) or one per
+    [[profiles]] entry, evaluated together in a single pass.
 
-    # Configuration with defaults
-    DAYS_BACK = config.get("general", {}).get("days_back", 7)
-    DATA_DIR = Path(__file__).parent.parent / config.get("general", {}).get(
-        "data_dir", "data"
+    Returns:
+        Tuple of (profiles, keyword_filter)
+    """
+    config = settings.config
+    general = config.get("general", {})
+    profiles = load_profiles(config, ROOT)
+    if profiles:
+        print(f"Profiles: {', '.join(p.name for p in profiles)}")
+        return profiles, ProfileFilter(profiles)
+
+    keyword_filter = KeywordFilter(config_file=config.get("keywords", {}).get("file"))
+    profile = Profile(
+        name=None,
+        keyword_filter=keyword_filter,
+        output_dir=settings.data_dir,
+        feed_path=ROOT / "feed.xml",
+        site_url=general.get("site_url", ""),
+        apply_to={"arXiv": settings.apply_to_arxiv, "IACR": settings.apply_to_iacr},
+        papers_file=general.get("papers_file", "papers.json"),
+        shard_dir=general.get("shard_dir", "shards"),
+        manifest_file=general.get("manifest_file", "manifest.json"),
+    )
+    return [profile], keyword_filter
+
+
+def make_sources(settings: Settings, multi_profile: bool = False) -> list:
+    """arXiv and IACR sources with their fetchers."""
+    from fetchers.arxiv import ArxivFetcher
+    from fetchers.iacr import IACRFetcher
+    from pipeline import Source
+
+    arxiv_config = settings.config.get("fetchers", {}).get("arxiv", {})
+    iacr_config = settings.config.get("fetchers", {}).get("iacr", {})
+    arxiv_fetcher = ArxivFetcher(
+        days_back=settings.days_back,
+        delay=arxiv_config.get("delay", 3.0),
+        categories=arxiv_config.get("categories"),
+        batch_size=arxiv_config.get("batch_size"),
+        max_results=arxiv_config.get("max_results"),
+    )
+    iacr_fetcher = IACRFetcher(
+        days_back=settings.days_back, delay=iacr_config.get("delay", 2.0)
     )
-    PAPERS_FILE = DATA_DIR / config.get("general", {}).get("papers_file", "papers.json")
-    FAILED_FILE = DATA_DIR / config.get("general", {}).get("failed_file", "failed.json")
 
-    # Get API key from environment
-    api_key = os.getenv("MODELSCOPE_API_KEY") or os.getenv("DASHSCOPE_API_KEY")
-    if not api_key:
+    # With profiles, per-source toggles are applied by each profile instead
+    return [
+        Source("arXiv", arxiv_fetcher, apply_filter=multi_profile or settings.apply_to_arxiv),
+        Source("IACR", iacr_fetcher, apply_filter=multi_profile or settings.apply_to_iacr),
+    ]
+
+
+def make_summarizer(config: dict) -> "ModelScopeSummarizer":
+    """Create the summarizer on top of the configured backend (exits without an API key)."""
+    from backends import create_backend
+    from summarizer import ModelScopeSummarizer
+
+    summarizer_config = config.get("summarizer", {})
+    api_key = (
+        os.getenv("MODELSCOPE_API_KEY")
+        or os.getenv("DASHSCOPE_API_KEY")
+        or os.getenv("OPENAI_API_KEY")
+    )
+    try:
+        backend = create_backend(
+            summarizer_config.get("backend"),
+            api_key=api_key,
+            url=summarizer_config.get("api_url"),
+            stream=summarizer_config.get("stream", False),
+            max_concurrency=summarizer_config.get("local_max_concurrency"),
+        )
+    except ValueError as e:
+        print(f"::error::{e}")
+        sys.exit(1)
+    if backend.requires_api_key and not api_key:
         print(
             "::error::API key not set. Please set DASHSCOPE_API_KEY in GitHub Secrets"
         )
         print("Get your API key from: https://dashscope.console.aliyun.com/")
         sys.exit(1)
 
-    # Initialize components
-    with github_group("🔧 Initializing components"):
-        print("Creating fetchers and filter...")
+    summarizer = ModelScopeSummarizer(
+        api_key=api_key,
+        model=summarizer_config.get("model"),
+        max_tokens=summarizer_config.get("max_tokens"),
+        temperature=summarizer_config.get("temperature"),
+        timeout=summarizer_config.get("timeout"),
+        rate_limit_delay=summarizer_config.get("rate_limit_delay"),
+        max_retries=summarizer_config.get("max_retries", 3),
+        retry_delay=summarizer_config.get("retry_delay", 5.0),
+        prompt_template=summarizer_config.get("prompt_template"),
+        api_url=summarizer_config.get("api_url"),
+        concurrency=summarizer_config.get("concurrency", 1),
+        cascade_models=summarizer_config.get("cascade_models"),
+        escalate_score=summarizer_config.get("escalate_score", 0),
+        backend=backend,
+    )
+    print(
+        f"Summarizer backend: {backend.name} ({backend.url}), "
+        f"concurrency {summarizer.concurrency}"
+    )
+    return summarizer
 
-        # Get fetcher configs
-        arxiv_config = config.get("fetchers", {}).get("arxiv", {})
-        iacr_config = config.get("fetchers", {}).get("iacr", {})
 
-        arxiv_fetcher = ArxivFetcher(
-            days_back=DAYS_BACK,
-            delay=arxiv_config.get("delay", 3.0),
-            categories=arxiv_config.get("categories"),
-            batch_size=arxiv_config.get("batch_size"),
-            max_results=arxiv_config.get("max_results"),
-        )
-        iacr_fetcher = IACRFetcher(
-            days_back=DAYS_BACK, delay=iacr_config.get("delay", 2.0)
-        )
+def make_work_queue(settings: Settings) -> "WorkQueue":
+    from work_queue import WorkQueue
 
-        # Get keyword filter config
-        keywords_config = config.get("keywords", {})
-        keyword_filter = KeywordFilter(config_file=keywords_config.get("file"))
+    work_queue_config = settings.config.get("work_queue", {})
+    return WorkQueue(
+        settings.work_queue_file,
+        lease_seconds=work_queue_config.get("lease_seconds", 300),
+        max_claims=work_queue_config.get("max_claims", 3),
+    )
 
-        # Get summarizer config
-        summarizer_config = config.get("summarizer", {})
-        summarizer = ModelScopeSummarizer(
-            api_key=api_key,
-            model=summarizer_config.get("model"),
-            max_tokens=summarizer_config.get("max_tokens"),
-            temperature=summarizer_config.get("temperature"),
-            timeout=summarizer_config.get("timeout"),
-            rate_limit_delay=summarizer_config.get("rate_limit_delay"),
-            max_retries=summarizer_config.get("max_retries", 3),
-            retry_delay=summarizer_config.get("retry_delay", 5.0),
-            prompt_template=summarizer_config.get("prompt_template"),
-        )
-        print("✓ All components initialized")
+
+def make_pipeline_summarizer(settings: Settings):
+    """
+    The summarizer used by run, summarize and watch: the configured one, or
+    with [work_queue] enabled a QueueSummarizer that hands papers to
+    `main.py worker` processes (and summarizes locally too if local_worker).
+    """
+    if not settings.work_queue:
+        return make_summarizer(settings.config)
+
+    from work_queue import QueueSummarizer
+
+    work_queue_config = settings.config.get("work_queue", {})
+    local = make_summarizer(settings.config) if work_queue_config.get("local_worker", True) else None
+    queue = make_work_queue(settings)
+    # Jobs of papers that left the window are never collected
+    purged = queue.purge(older_than_days=settings.days_back)
+    if purged:
+        print(f"✓ Dropped {purged} stale jobs from the work queue")
+    state = ", ".join(f"{count} {status}" for status, count in queue.counts().items())
+    print(
+        f"Work queue: {queue.db_path} ({state or 'empty'})"
+        + (", summarizing locally as well" if local else "")
+    )
+    return QueueSummarizer(
+        queue,
+        local=local,
+        poll_interval=work_queue_config.get("poll_interval", 2.0),
+        wait_timeout=work_queue_config.get("wait_timeout") or None,
+    )
+
+
+def open_store(settings: Settings) -> PaperStore:
+    """
+    Open the paper store (with the cold archive).
+
+    The database itself is not committed. When it is missing, or older than
+    the committed snapshot (e.g. restored from a stale CI cache), the
+    snapshot's papers are loaded into it; without a snapshot an empty
+    database is bootstrapped from papers.json.
+    """
+    retention_config = settings.config.get("retention", {})
+    archive = None
+    if retention_config.get("mode", "archive") == "archive":
+        archive = ColdArchive(settings.data_dir / retention_config.get("archive_dir", "archive"))
+    store = PaperStore(settings.papers_db, archive=archive)
+    papers, manifest = read_snapshot(settings.snapshot_dir)
+    digest = snapshot_digest(manifest)
+    if manifest.get("shards") and store.get_meta("snapshot") != digest:
+        fresh = store.count() == 0
+        store.import_papers(papers, manifest.get("last_updated"))
+        store.set_meta("snapshot", digest)
+        store.conn.commit()
+        print(f"✓ Loaded {len(papers)} papers from the snapshot in {settings.snapshot_dir}")
+        if fresh and archive:
+            print(f"✓ Indexed {store.reindex_archive()} archived papers")
+    elif store.count() == 0 and settings.papers_file.exists():
+        # First run with the database: bootstrap it from the exported view
+        store.import_json(settings.papers_file)
+    return store
+
+
+def save_snapshot(settings: Settings, store: PaperStore):
+    """Write the committed snapshot of the store (see open_store())."""
+    manifest = write_snapshot(store.all_papers(), settings.snapshot_dir)
+    store.set_meta("snapshot", snapshot_digest(manifest))
+    store.conn.commit()
+
+
+def make_retry_queue(settings: Settings) -> RetryQueue:
+    retry_config = settings.config.get("retry", {})
+    return RetryQueue(
+        settings.failed_file,
+        settings.dead_letter_file,
+        max_attempts=retry_config.get("max_attempts", 5),
+        base_delay_hours=retry_config.get("base_delay_hours", 6),
+        max_delay_hours=retry_config.get("max_delay_hours", 72),
+        quota=retry_config.get("per_run_quota", 20),
+        dead_letter_errors=retry_config.get("dead_letter_errors", ["empty_abstract"]),
+        # Dead letters expire with the papers they stand for
+        dead_letter_days=settings.days_back,
+    )
+
+
+def requeue_dead_letters(settings: Settings, ids: list):
+    """
+    Put dead-lettered papers back on the retry queue (``--requeue-dead``).
+
+    Args:
+        settings: Resolved configuration
+        ids: Paper ids to requeue (empty: all dead-lettered papers)
+    """
+    retry_queue = make_retry_queue(settings)
+    requeued = retry_queue.requeue_dead(ids or None)
+    missing = sorted(set(ids) - set(requeued))
+    if missing:
+        print(f"::warning::Not in the dead-letter file: {', '.join(missing)}")
+    if requeued:
+        retry_queue.save()
+    print(f"✓ Requeued {len(requeued)} dead-lettered papers")
+
+
+class ArtifactFetcher:
+    """Replays the papers of a stage artifact as a pipeline source."""
+
+    def __init__(self, papers: list):
+        self.papers = papers
+
+    def iter_papers(self):
+        return iter(self.papers)
+
+    def fetch_papers(self) -> list:
+        return list(self.papers)
+
+
+def summarize_papers(
+    settings: Settings, sources: list, keyword_filter, summarizer, streaming: bool
+) -> dict:
+    """
+    Summarize selected papers through the store cache and commit them.
+
+    Loads the store, journal and retry queue, retries due failures, runs the
+    pipeline over ``sources``, and merges the results into the store.
+
+    Returns:
+        Report payload: new/retry/failed papers, counts, token usage and
+        timings (consumed by the publish stage)
+    """
+    from pipeline import run_batch, run_streaming
+
+    multi_profile = isinstance(keyword_filter, ProfileFilter)
 
     # Load existing data
     with github_group("💾 Loading existing data"):
-        existing_data = load_existing_data(PAPERS_FILE)
-        existing_failed = load_existing_data(FAILED_FILE)
-        print(f"✓ Loaded {len(existing_data.get('papers', []))} existing papers")
-        print(f"✓ Loaded {len(existing_failed.get('papers', []))} failed papers")
+        store = open_store(settings)
+        # Resume: fold summaries journaled by an interrupted run into the store
+        recovered = compact_journal(settings.journal_file, store)
+        if recovered:
+            github_notice(f"Recovered {recovered} summaries from an interrupted run")
+        journal = SummaryJournal(
+            settings.journal_file,
+            fsync_every=settings.config.get("summarizer", {}).get("journal_fsync_every", 10),
+        )
+        retry_queue = make_retry_queue(settings)
+        # Retries recovered from the journal are already in the store
+        retry_queue.record_success(list(store.get_many(retry_queue.entries).values()))
+        expired = retry_queue.expire_dead()
+        if expired:
+            print(f"✓ Dropped {expired} expired papers from the dead-letter file")
+        print(
+            f"✓ Store has {store.count()} existing papers"
+            + (f", {store.archive_count()} archived" if store.archive else "")
+        )
+        print(
+            f"✓ Loaded {len(retry_queue)} failed papers "
+            f"({len(retry_queue.dead)} dead-lettered)"
+        )
 
-    # Retry previously failed papers
+    # Retry previously failed papers that are due, within the per-run quota
     retry_successful = []
     retry_failed = []
-    if existing_failed.get("papers"):
+    # Papers owned by the retry queue are not summarized again by the
+    # pipeline, even when a source lists them again
+    queued_ids = retry_queue.ids()
+    due = retry_queue.due()
+    if due:
         with github_group("🔄 Retrying failed summaries"):
+            print(f"{len(due)} of {len(retry_queue)} queued papers are due")
             retry_successful, retry_failed = retry_failed_summaries(
-                existing_failed["papers"], summarizer
+                due, summarizer, journal=journal
             )
+            retry_queue.record_success(retry_successful)
+            retry_queue.record_failure(retry_failed)
             if retry_successful:
                 github_notice(
                     f"Successfully summarized {len(retry_successful)} previously failed papers"
                 )
-
-    # Fetch papers from sources
-    with github_group("📥 Fetching papers from sources"):
-        print("Fetching from arXiv...")
-        arxiv_papers = arxiv_fetcher.fetch_papers()
-
-        print("\nFetching from IACR...")
-        iacr_papers = iacr_fetcher.fetch_papers()
-
-        all_fetched = arxiv_papers + iacr_papers
-        print(f"\n✓ Total fetched: {len(all_fetched)} papers")
-        print(f"  - arXiv: {len(arxiv_papers)} papers")
-        print(f"  - IACR: {len(iacr_papers)} papers")
-
-    # Filter by keywords with source-specific control
-    with github_group("🔍 Filtering by keywords"):
-        keywords_config = config.get("keywords", {})
-        apply_to_arxiv = keywords_config.get("apply_to_arxiv", True)
-        apply_to_iacr = keywords_config.get("apply_to_iacr", True)
-
-        # Separate papers by source
-        arxiv_papers_to_filter = [p for p in all_fetched if p.get("source") == "arXiv"]
-        iacr_papers_to_filter = [p for p in all_fetched if p.get("source") == "IACR"]
-
-        filtered_papers = []
-
-        # Apply filtering based on configuration
-        if apply_to_arxiv:
-            print(
-                f"Applying keyword filter to arXiv papers ({len(arxiv_papers_to_filter)} papers)..."
+    elif len(retry_queue):
+        print(f"✓ {len(retry_queue)} failed papers are waiting for their backoff to expire")
+
+    # Fetch, filter, check the cache and summarize new papers. The streaming
+    # pipeline overlaps these stages; the batch runner does them in turn.
+    with github_group("📥 Fetching, filtering and summarizing papers"):
+        if streaming:
+            result = run_streaming(
+                sources,
+                keyword_filter,
+                store,
+                summarizer,
+                journal=journal,
+                queue_size=settings.config.get("pipeline", {}).get("queue_size", 256),
+                skip_ids=queued_ids,
             )
-            filtered_arxiv = keyword_filter.filter_papers(arxiv_papers_to_filter)
-            filtered_papers.extend(filtered_arxiv)
-            print(f"  Matched {len(filtered_arxiv)} arXiv papers")
         else:
-            print(
-                f"Skipping keyword filter for arXiv (fetching all {len(arxiv_papers_to_filter)} papers)"
+            result = run_batch(
+                sources, keyword_filter, store, summarizer, journal=journal, skip_ids=queued_ids
             )
-            filtered_papers.extend(arxiv_papers_to_filter)
 
-        if apply_to_iacr:
-            print(
-                f"Applying keyword filter to IACR papers ({len(iacr_papers_to_filter)} papers)..."
-            )
-            filtered_iacr = keyword_filter.filter_papers(iacr_papers_to_filter)
-            filtered_papers.extend(filtered_iacr)
-            print(f"  Matched {len(filtered_iacr)} IACR papers")
-        else:
-            print(
-                f"Skipping keyword filter for IACR (fetching all {len(iacr_papers_to_filter)} papers)"
+        print(f"\n✓ Total fetched: {sum(result['fetched'].values())} papers")
+        for name, count in result["fetched"].items():
+            print(f"  - {name}: {count} papers, {result['selected'][name]} selected")
+        selected_count = sum(result["selected"].values())
+        if selected_count and multi_profile:
+            github_notice(
+                f"Selected {selected_count} papers for {len(keyword_filter.profiles)} profiles"
             )
-            filtered_papers.extend(iacr_papers_to_filter)
-
-        print(f"\n✓ Total papers after filtering: {len(filtered_papers)}")
-        if filtered_papers:
+        elif selected_count:
             github_notice(
-                f"Selected {len(filtered_papers)} papers (arXiv filter: {apply_to_arxiv}, IACR filter: {apply_to_iacr})"
+                f"Selected {selected_count} papers (arXiv filter: {settings.apply_to_arxiv}, "
+                f"IACR filter: {settings.apply_to_iacr})"
             )
         else:
             github_warning("No papers selected")
+        print(f"✓ Found {len(result['new'])} new papers (need summarization)")
+        print(f"✓ Reusing {len(result['cached'])} cached summaries")
+        if result["deferred"]:
+            print(f"✓ Left {result['deferred']} papers to the retry queue")
+        if store.restored_count:
+            print(f"✓ Restored {store.restored_count} papers from the cold archive")
+        print(
+            f"✓ {'Streaming' if streaming else 'Batch'} pipeline: fetch finished after "
+            f"{result['timings']['fetch']:.1f}s, all stages after {result['timings']['total']:.1f}s"
+        )
 
-    # Separate new papers from cached ones (to avoid re-summarizing)
-    with github_group("📋 Checking cache"):
-        existing_dict = {p["id"]: p for p in existing_data.get("papers", [])}
-        new_papers = []
-        cached_papers = []
-
-        for paper in filtered_papers:
-            if paper["id"] in existing_dict:
-                # Paper already exists, reuse cached summary
-                cached_papers.append(existing_dict[paper["id"]])
-            else:
-                # New paper, needs summarization
-                new_papers.append(paper)
-
-        print(f"✓ Found {len(new_papers)} new papers (need summarization)")
-        print(f"✓ Reusing {len(cached_papers)} cached summaries")
-
-    # Summarize only new papers
-    with github_group("🤖 Generating AI summaries"):
-        if new_papers:
-            successful, failed = summarizer.batch_summarize(new_papers)
-        else:
-            successful, failed = [], []
-
-        new_summary_count = len(successful)
-        newly_summarized = list(successful)  # save before combining with cache
+        successful = result["successful"]
+        failed = result["failed"]
+        retry_queue.record_failure(failed)
+        newly_summarized = [p for p in result["new"] if p.get("summary_status") == "success"]
+        # Cached papers whose profile membership changed (e.g. new keywords)
+        rematched = keyword_filter.refresh(result["cached"]) if multi_profile else []
+        if multi_profile:
+            for profile in keyword_filter.profiles:
+                print(
+                    f"  - profile {profile.name}: "
+                    f"{sum(profile.includes(p) for p in successful + failed)} papers"
+                )
 
-        # Combine newly summarized papers with cached ones
-        successful = successful + cached_papers
+        summarizer.telemetry.export(
+            settings.data_dir / "summarize_telemetry.ndjson",
+            settings.data_dir / "summarize_telemetry.json",
+        )
 
     # Combine with retry results
     all_successful = successful + retry_successful
-
     all_failed = failed + retry_failed
 
     if not all_successful:
         print("\n⚠️  No new papers to add")
-        existing_data["last_updated"] = datetime.now().isoformat()
-        save_data(PAPERS_FILE, existing_data)
-        if all_failed:
-            failed_data = {
-                "papers": all_failed,
-                "last_updated": datetime.now().isoformat(),
-                "count": len(all_failed),
-            }
-            save_data(FAILED_FILE, failed_data)
-        # Still generate email report (even with no new papers)
-        usage_stats = summarizer.get_usage_stats()
-        site_url = config.get("general", {}).get("site_url", "")
-        summary_language = config.get("email", {}).get("summary_language", "zh")
-        email_report_path = DATA_DIR / "email_report.txt"
-        generate_email_report(
-            new_papers=[],
-            retry_papers=[],
-            failed_papers=all_failed,
-            total_count=len(existing_data.get("papers", [])),
-            usage_stats=usage_stats,
-            output_path=email_report_path,
-            site_url=site_url,
-            summary_language=summary_language,
+        journal.discard()
+    else:
+        # Merge with existing papers: only changed rows are written; cached
+        # papers are already stored as-is
+        with github_group("📦 Merging with existing data"):
+            store.upsert(newly_summarized + retry_successful + rematched)
+            # Everything journaled is now committed to the store
+            journal.discard()
+            # Expired papers move to the cold archive (or are deleted when
+            # retention.mode = "delete")
+            store.archive_older_than(settings.days_back)
+
+    # Also after runs without new papers: recovered journals and restored
+    # archive papers change the store too (unchanged days are not rewritten)
+    save_snapshot(settings, store)
+    retry_queue.save()
+    store.close()
+    record_pipeline_metrics(result, all_successful, all_failed, retry_queue)
+
+    return {
+        "run_at": datetime.now().isoformat(),
+        "new": newly_summarized,
+        "retry": retry_successful,
+        "failed": all_failed,
+        "counts": {
+            "fetched": result["fetched"],
+            "selected": result["selected"],
+            "cached": len(result["cached"]),
+            "deferred": result["deferred"],
+        },
+        "retry_queue": {"waiting": len(retry_queue), "newly_dead": len(retry_queue.newly_dead)},
+        "usage": summarizer.get_usage_stats(),
+        "telemetry": summarizer.telemetry.summary(),
+    }
+
+
+def record_pipeline_metrics(result: dict, successful: list, failed: list, retry_queue: RetryQueue):
+    """Set the per-stage paper counts, filter hit rates and cache lookups of a run."""
+    for name, fetched in result["fetched"].items():
+        selected = result["selected"][name]
+        metrics.PAPERS.set(fetched, stage="fetched", source=name)
+        metrics.PAPERS.set(selected, stage="selected", source=name)
+        metrics.FILTER_HIT_RATIO.set(selected / fetched if fetched else 0.0, source=name)
+    for stage, count in [
+        ("new", len(result["new"])),
+        ("cached", len(result["cached"])),
+        ("deferred", result["deferred"]),
+        ("summarized", len(successful)),
+        ("failed", len(failed)),
+    ]:
+        metrics.PAPERS.set(count, stage=stage, source="all")
+    metrics.CACHE_LOOKUPS.inc(len(result["cached"]), result="hit")
+    metrics.CACHE_LOOKUPS.inc(len(result["new"]), result="miss")
+    metrics.RETRY_QUEUE.set(len(retry_queue), state="waiting")
+    metrics.RETRY_QUEUE.set(len(retry_queue.dead), state="dead")
+
+
+def write_metrics(settings: Settings, tracer, command: str):
+    """Write the OpenMetrics textfile and push to a Pushgateway if configured."""
+    metrics_config = settings.config.get("metrics", {})
+    # Only the stages of this run (watch mode writes after every round)
+    metrics.STAGE_SECONDS.clear()
+    for name, seconds in tracer.totals(cat="stage").items():
+        metrics.STAGE_SECONDS.set(round(seconds, 3), stage=slugify(name))
+    metrics.LAST_RUN.set(int(datetime.now().timestamp()), command=command)
+
+    textfile = metrics_config.get("textfile", "metrics.prom")
+    if textfile:
+        path = settings.data_dir / textfile
+        metrics.REGISTRY.write_textfile(path)
+        print(f"✓ Wrote metrics to {path}")
+
+    push_url = os.getenv("PUSHGATEWAY_URL") or metrics_config.get("pushgateway_url")
+    if push_url:
+        job = metrics_config.get("job", "paper_pulse")
+        try:
+            metrics.REGISTRY.push(push_url, job, grouping={"command": command})
+            print(f"✓ Pushed metrics to {push_url} (job {job})")
+        except OSError as e:
+            # Metrics must never fail the run
+            github_warning(f"Could not push metrics to {push_url}: {e}")
+
+
+def _require_artifact(settings: Settings, stage: str) -> dict:
+    artifact = read_artifact(settings.stage_path(stage))
+    if artifact is None:
+        print(f"::error::No {stage} artifact at {settings.stage_path(stage)}; run `{stage}` first")
+        sys.exit(1)
+    return artifact
+
+
+def stage_fetch(settings: Settings, force: bool = False) -> dict:
+    """
+    Fetch papers from every source into fetch.json.
+
+    Fetching always runs (its input is the remote feeds); the artifact is
+    only rewritten when the fetched content changed, so later stages can
+    skip.
+    """
+    with github_group("📥 Fetching papers"):
+        sources = make_sources(settings)
+        payload = {"sources": {s.name: s.fetcher.fetch_papers() for s in sources}}
+        input_hash = content_hash(
+            {"days_back": settings.days_back, "fetchers": settings.config.get("fetchers", {})}
+        )
+        artifact = write_artifact(settings.stage_path("fetch"), "fetch", input_hash, payload)
+        total = sum(len(papers) for papers in payload["sources"].values())
+        print(f"✓ Fetched {total} papers into {settings.stage_path('fetch')}")
+    return artifact
+
+
+def stage_filter(settings: Settings, force: bool = False) -> dict:
+    """Apply the keyword rules (of every profile) to fetch.json, writing filter.json."""
+    fetched = _require_artifact(settings, "fetch")
+    with github_group("🔍 Filtering papers"):
+        profiles, keyword_filter = make_profiles(settings)
+        multi_profile = isinstance(keyword_filter, ProfileFilter)
+        rules = [
+            {"name": p.name, "apply_to": p.apply_to, "rules": p.keyword_filter.keyword_rules}
+            for p in profiles
+        ]
+        input_hash = content_hash({"fetch": fetched["content_hash"], "rules": rules})
+        previous = read_artifact(settings.stage_path("filter"))
+        if not force and is_fresh(previous, input_hash):
+            print("✓ Fetched papers and keyword rules unchanged, keeping filter.json")
+            return previous
+
+        selected = {}
+        for name, papers in fetched["payload"]["sources"].items():
+            if multi_profile or profiles[0].apply_to.get(name, True):
+                selected[name] = [p for p in papers if keyword_filter.match_paper(p)]
+            else:
+                selected[name] = papers
+            print(f"  - {name}: {len(papers)} papers, {len(selected[name])} selected")
+        artifact = write_artifact(
+            settings.stage_path("filter"), "filter", input_hash, {"sources": selected}
         )
-        return
+        print(f"✓ Wrote {settings.stage_path('filter')}")
+    return artifact
+
+
+def stage_summarize(settings: Settings, force: bool = False) -> dict:
+    """Summarize the papers of filter.json into the store, writing summarize.json."""
+    from pipeline import Source
+
+    filtered = _require_artifact(settings, "filter")
+    summarizer_config = settings.config.get("summarizer", {})
+    input_hash = content_hash(
+        {
+            "filter": filtered["content_hash"],
+            "summarizer": {k: summarizer_config.get(k) for k in SUMMARY_CONFIG_KEYS},
+        }
+    )
+    previous = read_artifact(settings.stage_path("summarize"))
+    if (
+        not force
+        and is_fresh(previous, input_hash)
+        and not make_retry_queue(settings).due()
+        # Papers left on the work queue by an earlier run still need collecting
+        and not (settings.work_queue and make_work_queue(settings).counts())
+    ):
+        print("✓ Selected papers unchanged and no retries due, keeping summarize.json")
+        return previous
+
+    summarizer = make_pipeline_summarizer(settings)
+    profiles, keyword_filter = make_profiles(settings)
+    selected = filtered["payload"]["sources"]
+    if isinstance(keyword_filter, ProfileFilter):
+        keyword_filter.matches = {
+            p["id"]: p["profiles"] for papers in selected.values() for p in papers if "profiles" in p
+        }
+    sources = [
+        Source(name, ArtifactFetcher(papers), apply_filter=False)
+        for name, papers in selected.items()
+    ]
+    report = summarize_papers(settings, sources, keyword_filter, summarizer, streaming=False)
+    return write_artifact(settings.stage_path("summarize"), "summarize", input_hash, report)
+
+
+def empty_report() -> dict:
+    """Report used by publish when nothing has been summarized yet."""
+    return {
+        "new": [],
+        "retry": [],
+        "failed": [],
+        "usage": {
+            "input_tokens": 0,
+            "cached_input_tokens": 0,
+            "uncached_input_tokens": 0,
+            "output_tokens": 0,
+            "total_tokens": 0,
+        },
+        "telemetry": None,
+    }
+
+
+def stage_publish(
+    settings: Settings, force: bool = False, profiles: list = None, store: PaperStore = None
+) -> dict:
+    """
+    Write papers.json, shards, feed.xml and the email report of every profile.
 
-    # Merge with existing papers
-    with github_group("📦 Merging with existing data"):
-        all_papers = merge_papers(existing_data.get("papers", []), all_successful)
-        all_papers = remove_old_papers(all_papers, days=DAYS_BACK)
-        all_papers.sort(key=lambda p: p.get("published", "0000-00-00"), reverse=True)
+    Site outputs are rebuilt only when the store (or output config) changed,
+    email reports only when summarize.json did. ``profiles`` defaults to the
+    configured ones; an open ``store`` (watch mode) is used and left open.
 
-    # Save data
+    Returns:
+        Dictionary with per-profile totals, total_count and last_updated
+    """
+    config = settings.config
     with github_group("💾 Saving data"):
-        papers_data = {
-            "papers": all_papers,
-            "last_updated": datetime.now().isoformat(),
-            "total_count": len(all_papers),
+        if profiles is None:
+            profiles, _ = make_profiles(settings)
+        summarized = read_artifact(settings.stage_path("summarize"))
+        report = summarized["payload"] if summarized else empty_report()
+        owns_store = store is None
+        if owns_store:
+            store = open_store(settings)
+        renders = RenderCache(store)
+
+        site_hash = content_hash(
+            {
+                "store": store.fingerprint(),
+                "render": RENDER_VERSION,
+                "config": {k: config.get(k) for k in ("general", "output", "rss", "profiles")},
+            }
+        )
+        report_hash = content_hash(
+            {
+                "summarize": summarized["content_hash"] if summarized else None,
+                "config": {k: config.get(k) for k in ("general", "email", "profiles")},
+            }
+        )
+        previous = read_artifact(settings.stage_path("publish"))
+        done = previous["payload"] if previous else {}
+
+        totals = {}
+        if (
+            force
+            or done.get("site_hash") != site_hash
+            or not all(p.papers_file.exists() for p in profiles)
+        ):
+            # papers.json, shards and feed.xml of every profile
+            for profile in profiles:
+                papers_data = publish_profile(
+                    profile,
+                    store,
+                    compact=settings.compact_json,
+                    precompress=settings.precompress,
+                    rss_max_items=config.get("rss", {}).get("max_items", 50),
+                    rss_config=config.get("rss", {}),
+                    renders=renders,
+                    search_index=settings.search_index,
+                    listing=settings.listing,
+                )
+                totals[profile.label] = papers_data["total_count"]
+            store.prune_renders(keep=[p["id"] for p in report["new"] + report["retry"]])
+            print(
+                f"  JSON encoder: {encoder_name()}"
+                + (
+                    f", precompressed: {', '.join(settings.precompress)}"
+                    if settings.precompress
+                    else ""
+                )
+            )
+        else:
+            print("✓ Papers unchanged, keeping papers.json, shards and feeds")
+            totals = {p.label: store.count(profile=p.name) for p in profiles}
+
+        if (
+            force
+            or done.get("report_hash") != report_hash
+            or not all(p.email_report_path.exists() for p in profiles)
+        ):
+            # Generate an email report with paper details for every profile
+            email_config = config.get("email", {})
+            report_renders = renders.get_many(report["new"] + report["retry"])
+            for profile in profiles:
+                generate_email_report(
+                    new_papers=profile_papers(report["new"], profile),
+                    retry_papers=profile_papers(report["retry"], profile),
+                    failed_papers=profile_papers(report["failed"], profile),
+                    total_count=totals[profile.label],
+                    usage_stats=report["usage"],
+                    output_path=profile.email_report_path,
+                    site_url=profile.site_url,
+                    summary_language=email_config.get("summary_language", "zh"),
+                    telemetry_summary=report["telemetry"],
+                    renders=report_renders,
+                    group_by=email_config.get("group_by", "keyword"),
+                    max_bytes=email_config.get("max_bytes", 100_000),
+                )
+        else:
+            print("✓ Summaries unchanged, keeping email reports")
+
+        if renders.hits or renders.misses:
+            print(renders.report())
+            metrics.RENDER_CACHE.inc(renders.hits, result="hit")
+            metrics.RENDER_CACHE.inc(renders.misses, result="miss")
+        for label, count in totals.items():
+            metrics.STORE_PAPERS.set(count, profile=label)
+        outcome = {
+            "totals": totals,
+            "total_count": store.count(),
+            "last_updated": store.get_meta("last_updated"),
         }
-        save_data(PAPERS_FILE, papers_data)
-
-        # Generate RSS feed
-        rss_config = config.get("rss", {})
-        site_url = config.get("general", {}).get("site_url", "")
-        feed_path = Path(__file__).parent.parent / "feed.xml"
-        generate_rss_feed(
-            papers=all_papers,
-            output_path=feed_path,
-            site_url=site_url,
-            max_items=rss_config.get("max_items", 50),
+        if owns_store:
+            store.close()
+        write_artifact(
+            settings.stage_path("publish"),
+            "publish",
+            content_hash([site_hash, report_hash]),
+            {"site_hash": site_hash, "report_hash": report_hash, **outcome},
         )
+    return outcome
 
-        if all_failed:
-            failed_data = {
-                "papers": all_failed,
-                "last_updated": datetime.now().isoformat(),
-                "count": len(all_failed),
-            }
-            save_data(FAILED_FILE, failed_data)
-        elif FAILED_FILE.exists():
-            FAILED_FILE.unlink()
-            print("✓ Cleared failed papers file (all succeeded)")
 
-    # Get token usage statistics
-    usage_stats = summarizer.get_usage_stats()
+def run(settings: Settings, force: bool = False):
+    """Full run: streaming fetch → filter → summarize, then publish."""
+    # Initialize components
+    with github_group("🔧 Initializing components"):
+        print("Creating fetchers and filter...")
+        profiles, keyword_filter = make_profiles(settings)
+        multi_profile = isinstance(keyword_filter, ProfileFilter)
+        sources = make_sources(settings, multi_profile=multi_profile)
+        for source in sources:
+            if not source.apply_filter:
+                print(f"Skipping keyword filter for {source.name} (keeping all papers)")
+        summarizer = make_pipeline_summarizer(settings)
+        print("✓ All components initialized")
+
+    report = summarize_papers(settings, sources, keyword_filter, summarizer, settings.streaming)
+    write_artifact(settings.stage_path("summarize"), "summarize", "run", report)
+    outcome = stage_publish(settings, force=force, profiles=profiles)
 
     # Summary
+    usage_stats = report["usage"]
     print("\n" + "=" * 70)
     print("✅ Paper Aggregator - Complete")
     print("=" * 70)
     print(f"📊 Statistics:")
-    print(f"  Total papers in database: {len(all_papers)}")
-    print(f"  New summaries: {new_summary_count}")
-    print(f"  Retry summaries: {len(retry_successful)}")
-    print(f"  Failed summaries: {len(all_failed)}")
-    print(f"  Last updated: {papers_data['last_updated']}")
+    print(f"  Total papers in database: {outcome['total_count']}")
+    if multi_profile:
+        for label, count in outcome["totals"].items():
+            print(f"    {label}: {count}")
+    print(f"  New summaries: {len(report['new'])}")
+    print(f"  Retry summaries: {len(report['retry'])}")
+    print(f"  Failed summaries: {len(report['failed'])}")
+    print(
+        f"  Retry queue: {report['retry_queue']['waiting']} waiting, "
+        f"{report['retry_queue']['newly_dead']} newly dead-lettered"
+    )
+    print(f"  Last updated: {outcome['last_updated']}")
     print(f"\n🤖 Token Usage:")
     print(f"  Input tokens: {usage_stats['input_tokens']}")
+    print(f"    Cached: {usage_stats['cached_input_tokens']}")
+    print(f"    Uncached: {usage_stats['uncached_input_tokens']}")
     print(f"  Output tokens: {usage_stats['output_tokens']}")
     print(f"  Total tokens: {usage_stats['total_tokens']}")
+    print(f"  Section repairs: {usage_stats['repairs']}")
+    print(f"  Model escalations: {usage_stats['escalations']}")
     print("=" * 70)
 
     # Output statistics for GitHub Actions to capture
     github_output = os.getenv("GITHUB_OUTPUT")
     if github_output:
         with open(github_output, "a") as f:
-            f.write(f"new_papers={new_summary_count}\n")
-            f.write(f"retry_papers={len(retry_successful)}\n")
-            f.write(f"failed_papers={len(all_failed)}\n")
-            f.write(f"total_papers={len(all_papers)}\n")
+            f.write(f"new_papers={len(report['new'])}\n")
+            f.write(f"retry_papers={len(report['retry'])}\n")
+            f.write(f"failed_papers={len(report['failed'])}\n")
+            f.write(f"total_papers={outcome['total_count']}\n")
             f.write(f"input_tokens={usage_stats['input_tokens']}\n")
+            f.write(f"cached_input_tokens={usage_stats['cached_input_tokens']}\n")
+            f.write(f"uncached_input_tokens={usage_stats['uncached_input_tokens']}\n")
             f.write(f"output_tokens={usage_stats['output_tokens']}\n")
             f.write(f"total_tokens={usage_stats['total_tokens']}\n")
 
-    github_notice(f"Successfully updated {len(all_papers)} papers")
-
-    # Generate email report with paper details
-    site_url = config.get("general", {}).get("site_url", "")
-    summary_language = config.get("email", {}).get("summary_language", "zh")
-    email_report_path = DATA_DIR / "email_report.txt"
-    generate_email_report(
-        new_papers=newly_summarized,
-        retry_papers=retry_successful,
-        failed_papers=all_failed,
-        total_count=len(all_papers),
-        usage_stats=usage_stats,
-        output_path=email_report_path,
-        site_url=site_url,
-        summary_language=summary_language,
+    github_notice(f"Successfully updated {outcome['total_count']} papers")
+
+
+def watch(settings: Settings, max_cycles: int = None):
+    """
+    Long-running mode: poll each source on its own interval, publish on change.
+
+    The store, keyword rules, summarizer and fetcher sessions stay in memory
+    between rounds. The first round covers the whole ``days_back`` window
+    like `run`; later rounds only process papers that were not seen before.
+    Config and keyword changes are picked up on restart.
+
+    Args:
+        settings: Resolved configuration
+        max_cycles: Stop after this many rounds (None: until SIGINT/SIGTERM)
+    """
+    from pipeline import run_batch, run_streaming
+    from watch import IncrementalFetcher, PollSchedule, run_forever
+
+    config = settings.config
+    watch_config = config.get("watch", {})
+    fetcher_config = config.get("fetchers", {})
+    fsync_every = config.get("summarizer", {}).get("journal_fsync_every", 10)
+
+    with github_group("🔧 Initializing components"):
+        profiles, keyword_filter = make_profiles(settings)
+        multi_profile = isinstance(keyword_filter, ProfileFilter)
+        sources = make_sources(settings, multi_profile=multi_profile)
+        overlap = timedelta(days=watch_config.get("overlap_days", 2))
+        for source in sources:
+            source.fetcher = IncrementalFetcher(source.fetcher, overlap)
+        summarizer = make_pipeline_summarizer(settings)
+        store = open_store(settings)
+        recovered = compact_journal(settings.journal_file, store)
+        if recovered:
+            github_notice(f"Recovered {recovered} summaries from an interrupted run")
+        retry_queue = make_retry_queue(settings)
+        retry_queue.record_success(list(store.get_many(retry_queue.entries).values()))
+
+        schedule = PollSchedule()
+        for source in sources:
+            minutes = fetcher_config.get(source.name.lower(), {}).get("poll_interval_minutes", 60)
+            schedule.add(source.name, minutes * 60)
+            print(f"  - Polling {source.name} every {minutes} minutes")
+        schedule.add("retry", watch_config.get("retry_interval_minutes", 60) * 60)
+        schedule.add("archive", watch_config.get("archive_interval_hours", 24) * 3600)
+        print("✓ All components initialized")
+
+    tracer = get_tracer()
+
+    def tick(due: list):
+        print(f"\n🔁 {datetime.now().isoformat(timespec='seconds')}: {', '.join(due)}")
+        # Summaries journaled by a round that raised are stored before this
+        # round appends to (and finally discards) the same journal
+        recovered = compact_journal(settings.journal_file, store)
+        if recovered:
+            print(f"✓ Recovered {recovered} summaries from the previous round")
+            retry_queue.record_success(list(store.get_many(retry_queue.entries).values()))
+        journal = SummaryJournal(settings.journal_file, fsync_every=fsync_every)
+        try:
+            poll_round(due, journal, recovered)
+        finally:
+            journal.close()
+
+    def poll_round(due: list, journal: SummaryJournal, recovered: int):
+        retry_successful = []
+        retry_failed = []
+        papers = retry_queue.due() if "retry" in due else []
+        if papers:
+            with github_group("🔄 Retrying failed summaries"):
+                retry_successful, retry_failed = retry_failed_summaries(
+                    papers, summarizer, journal=journal
+                )
+                retry_queue.record_success(retry_successful)
+                retry_queue.record_failure(retry_failed)
+
+        polled = [s for s in sources if s.name in due]
+        result = None
+        new = []
+        rematched = []
+        if polled:
+            with github_group("📥 Polling sources"):
+                if settings.streaming:
+                    result = run_streaming(
+                        polled,
+                        keyword_filter,
+                        store,
+                        summarizer,
+                        journal=journal,
+                        queue_size=config.get("pipeline", {}).get("queue_size", 256),
+                        skip_ids=retry_queue.ids(),
+                    )
+                else:
+                    result = run_batch(
+                        polled,
+                        keyword_filter,
+                        store,
+                        summarizer,
+                        journal=journal,
+                        skip_ids=retry_queue.ids(),
+                    )
+                for name, count in result["fetched"].items():
+                    print(f"  - {name}: {count} unseen papers, {result['selected'][name]} selected")
+                retry_queue.record_failure(result["failed"])
+                new = [p for p in result["new"] if p.get("summary_status") == "success"]
+                rematched = keyword_filter.refresh(result["cached"]) if multi_profile else []
+
+        failed = (result["failed"] if result else []) + retry_failed
+        changed = new + retry_successful + rematched
+        if changed:
+            with github_group("📦 Merging with existing data"):
+                store.upsert(changed)
+        journal.discard()
+        archived = store.archive_older_than(settings.days_back) if "archive" in due else 0
+        if changed or archived or recovered:
+            save_snapshot(settings, store)
+        expired = retry_queue.expire_dead() if "archive" in due else 0
+        newly_dead = len(retry_queue.newly_dead)
+        if papers or failed or expired or recovered:
+            retry_queue.save()
+            retry_queue.newly_dead.clear()
+        if result:
+            record_pipeline_metrics(result, new + retry_successful, failed, retry_queue)
+
+        if changed or failed or archived or recovered:
+            report = {
+                "run_at": datetime.now().isoformat(),
+                "new": new,
+                "retry": retry_successful,
+                "failed": failed,
+                "retry_queue": {"waiting": len(retry_queue), "newly_dead": newly_dead},
+                "usage": summarizer.get_usage_stats(),
+                "telemetry": summarizer.telemetry.summary(),
+            }
+            write_artifact(settings.stage_path("summarize"), "summarize", "watch", report)
+            stage_publish(settings, profiles=profiles, store=store)
+        else:
+            print("✓ Nothing new")
+
+        # Per-round outputs; the in-memory records are dropped so a long
+        # watch does not grow without bound
+        if summarizer.telemetry.calls:
+            summarizer.telemetry.export(
+                settings.data_dir / "summarize_telemetry.ndjson",
+                settings.data_dir / "summarize_telemetry.json",
+            )
+            summarizer.telemetry.clear()
+        write_trace(tracer, settings)
+        write_metrics(settings, tracer, "watch")
+        tracer.clear()
+        # Only a completed round marks its papers as seen; after an error
+        # the next poll of these sources yields them again
+        for source in polled:
+            source.fetcher.commit()
+
+    try:
+        cycles = run_forever(schedule, tick, max_cycles=max_cycles)
+    finally:
+        store.close()
+    github_notice(f"Watch stopped after {cycles} rounds")
+
+
+def worker(settings: Settings, worker_id: str = None, idle_exit: float = None):
+    """
+    Summarize papers from the shared work queue until SIGINT/SIGTERM.
+
+    Args:
+        settings: Resolved configuration (the queue file must be the one
+            `run`/`summarize` use, e.g. on a shared mount)
+        worker_id: Lease owner name (default: host-pid)
+        idle_exit: Exit after the queue was empty this many seconds
+    """
+    from watch import stop_on_signals
+    from work_queue import default_worker_id, run_worker
+
+    summarizer = make_summarizer(settings.config)
+    queue = make_work_queue(settings)
+    worker_id = worker_id or default_worker_id()
+    print(
+        f"✓ Worker {worker_id} on {queue.db_path}, {summarizer.concurrency} parallel papers, "
+        f"lease {queue.lease_seconds:.0f}s"
+    )
+    stop = threading.Event()
+    with stop_on_signals(stop):
+        completed = run_worker(
+            queue,
+            summarizer,
+            worker_id,
+            poll_interval=settings.config.get("work_queue", {}).get("poll_interval", 2.0),
+            idle_timeout=idle_exit,
+            stop=stop,
+        )
+    queue.close()
+    github_notice(f"Worker {worker_id} completed {completed} papers")
+
+
+def main(argv: list = None):
+    """Command-line entry point: run one stage, or the whole pipeline (default)."""
+    parser = argparse.ArgumentParser(
+        description="Fetch, filter, summarize and publish papers.",
+        epilog="Without a command, `run` is executed.",
     )
+    profile_help = "Profile each stage (cProfile + tracemalloc) into <data_dir>/profile/"
+    parser.add_argument("--profile", action="store_true", help=profile_help)
+    subparsers = parser.add_subparsers(dest="command")
+    for name, help_text in [
+        ("run", "Full pipeline (streaming), then publish"),
+        ("fetch", "Fetch papers into fetch.json"),
+        ("filter", "Apply keyword rules, fetch.json -> filter.json"),
+        ("summarize", "Summarize into the store, filter.json -> summarize.json"),
+        ("publish", "Write papers.json, shards, feeds and email reports (no API key needed)"),
+        ("watch", "Keep running: poll each source on its interval, publish on change"),
+        ("worker", "Summarize papers from the shared work queue ([work_queue])"),
+    ]:
+        subparser = subparsers.add_parser(name, help=help_text)
+        if name == "watch":
+            subparser.add_argument(
+                "--cycles", type=int, default=None, help="Stop after this many polling rounds"
+            )
+        elif name == "worker":
+            subparser.add_argument("--id", default=None, help="Worker name (default: host-pid)")
+            subparser.add_argument(
+                "--idle-exit",
+                type=float,
+                default=None,
+                help="Exit after the queue was empty this many seconds",
+            )
+        elif name != "fetch":
+            subparser.add_argument(
+                "--force", action="store_true", help="Run even if the inputs are unchanged"
+            )
+        if name in ("run", "summarize", "watch"):
+            subparser.add_argument(
+                "--requeue-dead",
+                nargs="*",
+                metavar="ID",
+                default=None,
+                help="Put dead-lettered papers (all, or the given ids) back on the retry queue",
+            )
+        subparser.add_argument(
+            "--profile", action="store_true", default=argparse.SUPPRESS, help=profile_help
+        )
+    args = parser.parse_args(argv)
+    command = args.command or "run"
+
+    print("=" * 70)
+    print(f"📚 Paper Aggregator - {'Starting' if command == 'run' else command}")
+    print("=" * 70)
+
+    # Load configuration
+    settings = Settings(load_config())
+    force = getattr(args, "force", False)
+    tracer = get_tracer()
+    if args.profile:
+        tracer.profiler = StageProfiler(settings.data_dir / "profile")
+    if getattr(args, "requeue_dead", None) is not None:
+        requeue_dead_letters(settings, args.requeue_dead)
+    try:
+        with span(f"main.py {command}", cat="run"):
+            if command == "run":
+                run(settings, force=force)
+            elif command == "watch":
+                watch(settings, max_cycles=args.cycles)
+            elif command == "worker":
+                worker(settings, worker_id=args.id, idle_exit=args.idle_exit)
+            else:
+                stages = {
+                    "fetch": stage_fetch,
+                    "filter": stage_filter,
+                    "summarize": stage_summarize,
+                    "publish": stage_publish,
+                }
+                stages[command](settings, force=force)
+    finally:
+        # Written even when a stage fails, to see where it got stuck (watch
+        # writes them after every round; workers leave them to `run`)
+        if command not in ("watch", "worker"):
+            write_trace(tracer, settings)
+            write_metrics(settings, tracer, command)
+
+
+def write_trace(tracer, settings: Settings):
+    """Print stage timings and write the Chrome trace (and profile summary)."""
+    stage_totals = tracer.totals(cat="stage")
+    if stage_totals:
+        print("\n⏱️  Stage timings:")
+        for name, seconds in stage_totals.items():
+            print(f"  {seconds:8.2f}s  {name}")
+    trace_path = settings.data_dir / "trace.json"
+    count = tracer.export_chrome_trace(trace_path)
+    print(f"✓ Wrote {count} trace events to {trace_path} (open in https://ui.perfetto.dev)")
+    if tracer.profiler:
+        summary_path = tracer.profiler.write_summary()
+        print(f"✓ Wrote per-stage CPU/memory profiles to {summary_path.parent}")
 
 
 if __name__ == "__main__":
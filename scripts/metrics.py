@@ -0,0 +1,315 @@
+"""
+Pipeline metrics in OpenMetrics / Prometheus text format.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+A minimal, dependency-free registry: counters, gauges and histograms with
+labels. Modules update the metrics defined at the bottom of this file; at
+the end of a run main.py writes them as an OpenMetrics textfile (e.g. for
+node_exporter's textfile collector) and optionally pushes them to a
+Pushgateway-compatible endpoint.
+"""
+
+import math
+import re
+import threading
+import urllib.parse
+import urllib.request
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+# Same buckets and bucketing as the telemetry summary, so a latency falls
+# into the same bucket in both exports
+from telemetry import LATENCY_BUCKETS, bucket_counts, cumulative_counts
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Tuple, extra: Dict = None) -> str:
+    pairs = list(zip(names, values)) + list((extra or {}).items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class: a named family of samples keyed by label values."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict) -> Tuple:
+        if set(labels) != set(self.label_names):
+            raise ValueError(
+                f"{self.name} expects labels {self.label_names}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count (exposed with a ``_total`` suffix)."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            return [
+                (f"{self.name}_total", _format_labels(self.label_names, key), value)
+                for key, value in sorted(self._values.items())
+            ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down (last write wins)."""
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def samples(self):
+        with self._lock:
+            return [
+                (self.name, _format_labels(self.label_names, key), value)
+                for key, value in sorted(self._values.items())
+            ]
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts plus count and sum of observations."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labels=(), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = sorted(buckets)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {
+                    "buckets": [0] * (len(self.buckets) + 1),
+                    "count": 0,
+                    "sum": 0.0,
+                }
+            for i, count in enumerate(bucket_counts([value], self.buckets)):
+                state["buckets"][i] += count
+            state["count"] += 1
+            state["sum"] += value
+
+    def samples(self):
+        samples = []
+        bounds = self.buckets + [math.inf]
+        with self._lock:
+            for key, state in sorted(self._values.items()):
+                for bound, count in zip(bounds, cumulative_counts(state["buckets"])):
+                    labels = _format_labels(self.label_names, key, {"le": _format_value(bound)})
+                    samples.append((f"{self.name}_bucket", labels, count))
+                labels = _format_labels(self.label_names, key)
+                samples.append((f"{self.name}_count", labels, state["count"]))
+                samples.append((f"{self.name}_sum", labels, state["sum"]))
+        return samples
+
+
+class Registry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labels))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def render(self, openmetrics: bool = True) -> str:
+        """
+        Render every metric that has samples.
+
+        Args:
+            openmetrics: OpenMetrics 1.0 text (ends with ``# EOF``); False
+                renders the Prometheus 0.0.4 text format used by Pushgateway
+        """
+        lines = []
+        for metric in self._metrics.values():
+            samples = metric.samples()
+            if not samples:
+                continue
+            family = metric.name
+            if not openmetrics and metric.kind == "counter":
+                family = f"{metric.name}_total"
+            lines.append(f"# HELP {family} {metric.documentation}")
+            lines.append(f"# TYPE {family} {metric.kind}")
+            for sample_name, labels, value in samples:
+                lines.append(f"{sample_name}{labels} {_format_value(value)}")
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: Path):
+        """Atomically write the OpenMetrics textfile."""
+        from journal import atomic_write_text
+
+        atomic_write_text(Path(path), self.render(openmetrics=True))
+
+    def push(self, url: str, job: str, grouping: Dict[str, str] = None, timeout: float = 10.0):
+        """
+        Replace this job's metrics on a Pushgateway (HTTP PUT).
+
+        Args:
+            url: Base URL, e.g. http://localhost:9091
+            job: Job label
+            grouping: Extra grouping labels (e.g. {"instance": "ci"})
+        """
+        path = f"/metrics/job/{urllib.parse.quote(job, safe='')}"
+        for key, value in (grouping or {}).items():
+            path += f"/{urllib.parse.quote(key, safe='')}/{urllib.parse.quote(str(value), safe='')}"
+        request = urllib.request.Request(
+            url.rstrip("/") + path,
+            data=self.render(openmetrics=False).encode("utf-8"),
+            method="PUT",
+            headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"},
+        )
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+
+
+def observe_fetch(source: str, response, seconds: float):
+    """Record one fetcher request (``response`` is None when it raised)."""
+    status = str(response.status_code) if response is not None else "error"
+    FETCH_REQUESTS.inc(source=source, status=status)
+    FETCH_SECONDS.observe(seconds, source=source)
+    if response is not None:
+        FETCH_BYTES.inc(len(response.content), source=source)
+
+
+def file_label(filepath: Path) -> str:
+    """Bounded-cardinality label for a written file (dates collapsed)."""
+    return re.sub(r"\d{4}-\d{2}(-\d{2})?", "DATE", Path(filepath).name)
+
+
+REGISTRY = Registry()
+
+# Fetchers
+FETCH_REQUESTS = REGISTRY.counter(
+    "paperpulse_fetch_requests", "HTTP requests made by the fetchers.", ["source", "status"]
+)
+FETCH_BYTES = REGISTRY.counter(
+    "paperpulse_fetch_bytes", "Response bytes received by the fetchers.", ["source"]
+)
+FETCH_SECONDS = REGISTRY.histogram(
+    "paperpulse_fetch_request_seconds", "Fetcher request latency.", ["source"]
+)
+
+# Pipeline
+PAPERS = REGISTRY.gauge(
+    "paperpulse_papers",
+    "Papers per pipeline stage in the last run (fetched, selected, new, cached, deferred, "
+    "summarized, failed).",
+    ["stage", "source"],
+)
+FILTER_HIT_RATIO = REGISTRY.gauge(
+    "paperpulse_filter_hit_ratio", "Share of fetched papers kept by the keyword filter.", ["source"]
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "paperpulse_cache_lookups", "Selected papers checked against the summary cache.", ["result"]
+)
+
+# Summarizer
+SUMMARIZE_CALLS = REGISTRY.counter(
+    "paperpulse_summarize_calls", "LLM API calls by model and status.", ["model", "status"]
+)
+SUMMARIZE_LATENCY = REGISTRY.histogram(
+    "paperpulse_summarize_call_seconds", "LLM API call latency.", ["model"]
+)
+SUMMARIZE_PAPER_SECONDS = REGISTRY.histogram(
+    "paperpulse_summarize_paper_seconds", "Wall time per summarized paper.", ["outcome"]
+)
+SUMMARIZE_RETRIES = REGISTRY.counter(
+    "paperpulse_summarize_retries", "LLM call retries after a failed attempt."
+)
+LLM_TOKENS = REGISTRY.counter(
+    "paperpulse_llm_tokens", "Tokens reported by the LLM API.", ["model", "type"]
+)
+
+# Outputs
+RENDER_CACHE = REGISTRY.counter(
+    "paperpulse_render_cache_lookups", "Per-paper render fragments reused or rendered.", ["result"]
+)
+WRITES = REGISTRY.counter("paperpulse_writes", "Atomic file writes.", ["file"])
+WRITE_BYTES = REGISTRY.counter("paperpulse_write_bytes", "Bytes written atomically.", ["file"])
+
+# Run
+RETRY_QUEUE = REGISTRY.gauge(
+    "paperpulse_retry_queue_papers", "Papers waiting for a retry or dead-lettered.", ["state"]
+)
+STORE_PAPERS = REGISTRY.gauge(
+    "paperpulse_store_papers", "Papers published per profile after the run.", ["profile"]
+)
+STAGE_SECONDS = REGISTRY.gauge(
+    "paperpulse_stage_seconds", "Wall time of each stage in the last run.", ["stage"]
+)
+LAST_RUN = REGISTRY.gauge(
+    "paperpulse_last_run_timestamp_seconds", "Unix time the last run finished.", ["command"]
+)
@@ -0,0 +1,349 @@
+"""
+Fetch → filter → cache → summarize pipeline for Paper Pulse.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Set, Tuple
+
+from tracing import span
+
+# End-of-stream marker passed between stages
+_DONE = object()
+
+
+class Source:
+    """A paper source: display name, fetcher and whether keyword filtering applies."""
+
+    def __init__(self, name: str, fetcher, apply_filter: bool = True):
+        self.name = name
+        self.fetcher = fetcher
+        self.apply_filter = apply_filter
+
+
+def _result(sources: List[Source]) -> Dict:
+    return {
+        "fetched": {s.name: 0 for s in sources},
+        "selected": {s.name: 0 for s in sources},
+        "new": [],
+        "cached": [],
+        "deferred": 0,
+        "successful": [],
+        "failed": [],
+        "timings": {},
+    }
+
+
+def run_batch(
+    sources: List[Source],
+    keyword_filter,
+    store,
+    summarizer,
+    journal=None,
+    skip_ids: Set[str] = None,
+) -> Dict:
+    """
+    Run the stages one after another: fetch everything, filter, check the
+    cache, then summarize.
+
+    Args:
+        sources: Paper sources in output order
+        keyword_filter: KeywordFilter instance
+        store: PaperStore used as the summary cache
+        summarizer: ModelScopeSummarizer instance
+        journal: Optional SummaryJournal for finished summaries
+        skip_ids: Ids owned by the retry queue; counted as ``deferred`` and
+            not summarized again here
+
+    A paper id selected more than once (e.g. on overlapping result pages) is
+    only processed at its first occurrence in source order.
+
+    Returns:
+        Dictionary with per-source ``fetched``/``selected`` counts, the ``new``
+        and ``cached`` papers, the ``successful`` (new successes followed by
+        cached papers) and ``failed`` papers, the ``deferred`` count and stage
+        ``timings``
+    """
+    skip_ids = skip_ids or set()
+    result = _result(sources)
+    started = time.perf_counter()
+
+    selected = []
+    for source in sources:
+        print(f"Fetching from {source.name}...")
+        with span(f"fetch {source.name}", cat="fetch"):
+            papers = source.fetcher.fetch_papers()
+        result["fetched"][source.name] = len(papers)
+        if source.apply_filter:
+            with span(f"filter {source.name}", cat="filter", papers=len(papers)):
+                papers = keyword_filter.filter_papers(papers)
+        result["selected"][source.name] = len(papers)
+        selected.extend(papers)
+    result["timings"]["fetch"] = time.perf_counter() - started
+
+    existing = store.get_many(p["id"] for p in selected)
+    seen = set()
+    for paper in selected:
+        if paper["id"] in seen:
+            continue
+        seen.add(paper["id"])
+        if paper["id"] in skip_ids:
+            result["deferred"] += 1
+        elif paper["id"] in existing:
+            # Paper already exists, reuse cached summary
+            result["cached"].append(existing[paper["id"]])
+        else:
+            result["new"].append(paper)
+
+    if result["new"]:
+        successful, failed = summarizer.batch_summarize(result["new"], journal=journal)
+    else:
+        successful, failed = [], []
+    result["successful"] = successful + result["cached"]
+    result["failed"] = failed
+    result["timings"]["total"] = time.perf_counter() - started
+    return result
+
+
+class StreamingPipeline:
+    """
+    Stages connected by bounded queues so summarization overlaps fetching.
+
+    One thread per source pages through its fetcher and pushes papers into
+    the ``fetched`` queue; a filter thread applies the keyword rules and feeds
+    the ``selected`` queue; the calling thread (which owns the SQLite
+    connection) drops duplicates, answers cache hits from the store and
+    submits new papers to the summarizer's worker pool, which journals each
+    paper as it finishes. When the summarizer falls behind, the bounded
+    queues fill up and the fetchers block (back-pressure).
+
+    Every paper is tagged with its (source, position) sequence number and the
+    results are sorted by it at the end, so the output is the same as
+    run_batch() no matter in which order summaries complete. Each paper is
+    submitted once the next one is known, so the last paper skips the
+    rate-limit sleep as in run_batch(). If a fetch or filter stage fails, no
+    further papers are submitted: the summaries in flight are finished (and
+    journaled) and the error is raised, as run_batch() raises before
+    summarizing anything.
+    """
+
+    def __init__(
+        self,
+        sources: List[Source],
+        keyword_filter,
+        store,
+        summarizer,
+        journal=None,
+        queue_size: int = 256,
+        skip_ids: Set[str] = None,
+    ):
+        """
+        Args:
+            sources: Paper sources in output order
+            keyword_filter: KeywordFilter instance
+            store: PaperStore used as the summary cache
+            summarizer: ModelScopeSummarizer instance
+            journal: Optional SummaryJournal for finished summaries
+            queue_size: Capacity of each inter-stage queue (papers)
+            skip_ids: Ids owned by the retry queue (see run_batch())
+        """
+        self.sources = sources
+        self.keyword_filter = keyword_filter
+        self.store = store
+        self.summarizer = summarizer
+        self.journal = journal
+        self.skip_ids = skip_ids or set()
+        self.fetched = queue.Queue(maxsize=queue_size)
+        self.selected = queue.Queue(maxsize=queue_size)
+        self.errors = []
+        self.result = _result(sources)
+        self._lock = threading.Lock()
+        self._failed = threading.Event()
+        self._started = None
+        self._cached = []
+        # Paper id -> lowest sequence number it was selected with
+        self._first = {}
+
+    def run(self) -> Dict:
+        """Run all stages to completion; same return value as run_batch()."""
+        self._started = time.perf_counter()
+        threads = [
+            threading.Thread(
+                target=self._fetch_stage,
+                args=(rank, source),
+                name=f"fetch-{source.name}",
+                daemon=True,
+            )
+            for rank, source in enumerate(self.sources)
+        ]
+        threads.append(
+            threading.Thread(target=self._filter_stage, name="filter", daemon=True)
+        )
+        for thread in threads:
+            thread.start()
+
+        summarized = self._summarize_stage()
+
+        # A failed filter stage leaves fetchers blocked on a full queue; they
+        # are daemon threads, so raise without joining them
+        if self.errors:
+            raise self.errors[0]
+        for thread in threads:
+            thread.join()
+
+        result = self.result
+        summarized.sort(key=lambda item: self._first[item[1]["id"]])
+        cached = sorted(self._cached, key=lambda item: self._first[item[1]["id"]])
+        new = [paper for _, paper, _ in summarized]
+        result["new"] = new
+        result["cached"] = [paper for _, paper in cached]
+        result["successful"] = [p for _, p, ok in summarized if ok] + result["cached"]
+        result["failed"] = [p for _, p, ok in summarized if not ok]
+        result["timings"]["total"] = time.perf_counter() - self._started
+        print(
+            f"\n✓ Summarization complete: {len(new) - len(result['failed'])} successful, "
+            f"{len(result['failed'])} failed"
+        )
+        return result
+
+    def _fail(self, error: Exception):
+        """Record the exception of a stage thread and stop the pipeline."""
+        self.errors.append(error)
+        self._failed.set()
+
+    def _fetch_stage(self, rank: int, source: Source):
+        count = 0
+        try:
+            with span(f"fetch {source.name}", cat="fetch"):
+                for position, paper in enumerate(source.fetcher.iter_papers()):
+                    if self._failed.is_set():
+                        break
+                    self.fetched.put((rank, position, paper))
+                    count += 1
+        except Exception as e:
+            # Recorded before the end marker, so the error is known downstream
+            # by the time the stream ends
+            self._fail(e)
+        finally:
+            self.result["fetched"][source.name] = count
+            self.fetched.put((rank, None, _DONE))
+
+    def _filter_stage(self):
+        remaining = len(self.sources)
+        try:
+            while remaining:
+                rank, position, paper = self.fetched.get()
+                if paper is _DONE:
+                    remaining -= 1
+                    continue
+                source = self.sources[rank]
+                if source.apply_filter and not self.keyword_filter.match_paper(paper):
+                    continue
+                self.result["selected"][source.name] += 1
+                self.selected.put(((rank, position), paper))
+        except Exception as e:
+            self._fail(e)
+        finally:
+            self.result["timings"]["fetch"] = time.perf_counter() - self._started
+            self.selected.put((None, _DONE))
+
+    def _summarize_stage(self) -> List[Tuple]:
+        """Dedup and cache stage on the calling thread, feeding the worker pool."""
+        summarizer = self.summarizer
+        workers = max(1, summarizer.concurrency)
+        # At most this many papers are submitted but unfinished
+        slots = threading.BoundedSemaphore(workers * 2)
+        futures = []
+        counter = [0]
+        # (seq, paper, enqueued) waiting for the next paper, which decides
+        # whether it gets the rate-limit sleep
+        pending = None
+
+        def summarize(seq, paper, enqueued, delay):
+            try:
+                with self._lock:
+                    counter[0] += 1
+                    print(f"[{counter[0]}] Summarizing: {paper['title'][:60]}...")
+                ok = summarizer.summarize_one(
+                    paper, journal=self.journal, delay=delay, enqueued=enqueued
+                )
+                return seq, paper, ok
+            finally:
+                slots.release()
+
+        def submit(item, delay):
+            slots.acquire()
+            futures.append(pool.submit(summarize, *item, delay))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="summarize") as pool:
+            while not self._failed.is_set():
+                try:
+                    seq, paper = self.selected.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if paper is _DONE:
+                    break
+                if paper["id"] in self._first:
+                    self._first[paper["id"]] = min(self._first[paper["id"]], seq)
+                    continue
+                self._first[paper["id"]] = seq
+                if paper["id"] in self.skip_ids:
+                    self.result["deferred"] += 1
+                    continue
+
+                existing = self.store.get(paper["id"])
+                if existing is not None:
+                    self._cached.append((seq, existing))
+                    continue
+
+                if pending is not None:
+                    submit(pending, summarizer.rate_limit_delay)
+                pending = (seq, paper, time.perf_counter())
+
+            if self._failed.is_set():
+                # Stop here; papers not yet started are dropped
+                for future in futures:
+                    future.cancel()
+                return []
+            if pending is not None:
+                submit(pending, 0.0)
+
+        return [future.result() for future in futures]
+
+
+def run_streaming(
+    sources: List[Source],
+    keyword_filter,
+    store,
+    summarizer,
+    journal=None,
+    queue_size: int = 256,
+    skip_ids: Set[str] = None,
+) -> Dict:
+    """Run StreamingPipeline; same arguments and return value as run_batch()."""
+    return StreamingPipeline(
+        sources,
+        keyword_filter,
+        store,
+        summarizer,
+        journal=journal,
+        queue_size=queue_size,
+        skip_ids=skip_ids,
+    ).run()
@@ -0,0 +1,185 @@
+"""
+Multiple deployments (profiles) sharing one fetch and one summary cache.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from filter import KeywordFilter
+
+
+class Profile:
+    """
+    One deployment: keyword rules, per-source filter toggles and output paths.
+
+    The implicit single deployment (no ``[[profiles]]`` in config.toml) is a
+    Profile with ``name=None`` whose outputs are the classic locations
+    (``data/papers.json``, ``feed.xml`` in the project root, ...).
+    """
+
+    def __init__(
+        self,
+        name: Optional[str],
+        keyword_filter: KeywordFilter,
+        output_dir: Path,
+        feed_path: Path,
+        site_url: str = "",
+        apply_to: Dict[str, bool] = None,
+        papers_file: str = "papers.json",
+        shard_dir: str = "shards",
+        manifest_file: str = "manifest.json",
+    ):
+        self.name = name
+        self.keyword_filter = keyword_filter
+        self.output_dir = Path(output_dir)
+        self.feed_path = Path(feed_path)
+        self.site_url = site_url
+        self.apply_to = apply_to or {}
+        self.papers_file = self.output_dir / papers_file
+        self.shard_dir = self.output_dir / shard_dir
+        self.manifest_file = self.output_dir / manifest_file
+        self.email_report_path = self.output_dir / "email_report.txt"
+        self.search_index_file = self.output_dir / "search_index.json"
+        self.listing_file = self.output_dir / "listing.json"
+
+    @property
+    def label(self) -> str:
+        return self.name or "default"
+
+    def select(self, paper: Dict) -> Optional[List[str]]:
+        """
+        Match a paper against this profile without modifying it.
+
+        Returns:
+            Matched keywords (empty when filtering is off for the paper's
+            source), or None if the profile does not want the paper
+        """
+        if not self.apply_to.get(paper.get("source"), True):
+            return []
+        probe = {"title": paper.get("title", ""), "abstract": paper.get("abstract", "")}
+        if not self.keyword_filter.match_paper(probe):
+            return None
+        return probe["keywords"]
+
+    def includes(self, paper: Dict) -> bool:
+        """Whether a (filtered) paper belongs to this profile."""
+        return self.name is None or self.name in paper.get("profiles", {})
+
+
+class ProfileFilter:
+    """
+    Keyword filter that evaluates every profile in one pass.
+
+    A paper is kept when at least one profile selects it. Its ``profiles``
+    field maps each selecting profile to the keywords it matched; the
+    ``keywords``/``keyword_score`` fields get the union and the best
+    per-profile score, so summarizer escalation and retry priority see the
+    strongest match. Drop-in replacement for KeywordFilter in the pipeline.
+    """
+
+    def __init__(self, profiles: List[Profile]):
+        self.profiles = profiles
+        # Latest matches per paper id, used to refresh cached papers
+        self.matches = {}
+
+    def match_paper(self, paper: Dict) -> bool:
+        matches = {}
+        for profile in self.profiles:
+            keywords = profile.select(paper)
+            if keywords is not None:
+                matches[profile.name] = keywords
+        if not matches:
+            return False
+
+        paper["profiles"] = matches
+        paper["keywords"] = sorted(set().union(*matches.values()))
+        paper["keyword_score"] = max(len(k) for k in matches.values())
+        self.matches[paper["id"]] = matches
+        return True
+
+    def filter_papers(self, papers: List[Dict]) -> List[Dict]:
+        filtered = [paper for paper in papers if self.match_paper(paper)]
+        print(
+            f"Filtered {len(filtered)} papers out of {len(papers)} "
+            f"(any of {len(self.profiles)} profiles)"
+        )
+        return filtered
+
+    def refresh(self, papers: List[Dict]) -> List[Dict]:
+        """
+        Apply this run's matches to cached papers.
+
+        Returns:
+            The papers whose profile membership changed (to be re-stored)
+        """
+        changed = []
+        for paper in papers:
+            matches = self.matches.get(paper["id"])
+            if matches is not None and matches != paper.get("profiles"):
+                paper["profiles"] = matches
+                paper["keywords"] = sorted(set().union(*matches.values()))
+                paper["keyword_score"] = max(len(k) for k in matches.values())
+                changed.append(paper)
+        return changed
+
+
+def load_profiles(config: dict, root: Path) -> List[Profile]:
+    """
+    Build the profiles listed under ``[[profiles]]`` in config.toml.
+
+    Args:
+        config: Parsed configuration
+        root: Project root that relative paths are resolved against
+
+    Returns:
+        List of profiles (empty when none are configured)
+    """
+    general = config.get("general", {})
+    keywords_config = config.get("keywords", {})
+    profiles = []
+    for entry in config.get("profiles", []):
+        name = entry["name"]
+        output_dir = root / entry.get("output_dir", f"profiles/{name}")
+        keywords_file = entry.get("keywords_file")
+        profiles.append(
+            Profile(
+                name=name,
+                keyword_filter=KeywordFilter(
+                    config_file=str(root / keywords_file) if keywords_file else None
+                ),
+                output_dir=output_dir,
+                feed_path=output_dir / "feed.xml",
+                site_url=entry.get("site_url", general.get("site_url", "")),
+                apply_to={
+                    "arXiv": entry.get(
+                        "apply_to_arxiv", keywords_config.get("apply_to_arxiv", True)
+                    ),
+                    "IACR": entry.get(
+                        "apply_to_iacr", keywords_config.get("apply_to_iacr", True)
+                    ),
+                },
+                papers_file=general.get("papers_file", "papers.json"),
+                shard_dir=general.get("shard_dir", "shards"),
+                manifest_file=general.get("manifest_file", "manifest.json"),
+            )
+        )
+
+    names = [p.name for p in profiles]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate profile names in config: {names}")
+    return profiles
@@ -19,6 +19,8 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import sys
 
+from tracing import span
+
 
 class ProgressBar:
     """Simple progress bar that works in GitHub Actions."""
@@ -59,6 +61,9 @@ def github_group(name: str):
     """
     Context manager for GitHub Actions collapsible groups.
 
+    Each group is also a tracing span (category "stage"), so its duration
+    shows up in the exported trace and --profile reports.
+
     Usage:
         with github_group("Fetching papers"):
             # ... code ...
@@ -66,13 +71,16 @@ def github_group(name: str):
     class GitHubGroup:
         def __init__(self, group_name):
             self.name = group_name
+            self.span = span(group_name, cat="stage")
 
         def __enter__(self):
             print(f"::group::{self.name}")
             sys.stdout.flush()
+            self.span.__enter__()
             return self
 
         def __exit__(self, *args):
+            self.span.__exit__(*args)
             print("::endgroup::")
             sys.stdout.flush()
 
@@ -0,0 +1,274 @@
+"""
+Per-paper render cache for Paper Pulse.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Fragments derived from a paper's text (wrapped plain text for the email
+report, HTML of the Markdown summaries for the site and the feeds) are
+rendered once and kept in the store's ``renders`` table under a hash of the
+fields they depend on. Later runs only render papers that are new or whose
+summaries changed.
+
+papers.json keeps the Markdown summaries only. The day shards the site loads
+carry the HTML in their place (see site_paper()), so no paper is shipped in
+both forms.
+"""
+
+import hashlib
+import re
+import textwrap
+from html import escape
+from typing import Dict, List
+
+from serialize import dumps
+from tracing import span
+
+# Bump when the output of a renderer changes, so cached fragments are redone
+RENDER_VERSION = 2
+
+# Paper fields the fragments are derived from
+RENDER_FIELDS = (
+    "title",
+    "authors",
+    "published",
+    "source",
+    "url",
+    "arxiv_id",
+    "iacr_id",
+    "summary_zh",
+    "summary_en",
+    "summary",
+    "abstract",
+)
+
+# Fragment name -> field added to the papers for the site and the feeds
+SITE_FIELDS = {
+    "html_zh": "summary_zh_html",
+    "html_en": "summary_en_html",
+}
+
+# Markdown summary -> the HTML field that replaces it in the day shards
+SITE_HTML = {
+    "summary_zh": "summary_zh_html",
+    "summary_en": "summary_en_html",
+}
+
+
+def content_key(paper: Dict, wrap_width: int = 72) -> str:
+    """Hash of everything a paper's fragments depend on."""
+    fields = {name: paper.get(name) for name in RENDER_FIELDS}
+    return hashlib.sha256(dumps([RENDER_VERSION, wrap_width, fields])).hexdigest()
+
+
+def wrap_text(text: str, width: int = 72) -> str:
+    """Wrap text to given width, preserving existing line breaks."""
+    result_lines = []
+    for paragraph in text.split("\n"):
+        if not paragraph.strip():
+            result_lines.append("")
+        else:
+            result_lines.extend(textwrap.wrap(paragraph, width=width))
+    return "\n".join(result_lines)
+
+
+# Markdown subset used by the summaries (headings, lists, emphasis, code,
+# links). All text is escaped before tags are added, so the output cannot
+# contain markup from the summary itself.
+_INLINE = re.compile(
+    r"`([^`]+)`"
+    r"|\[([^\]]+)\]\(([^)\s]+)\)"
+    r"|\*\*(.+?)\*\*|__(.+?)__"
+    r"|\*([^*\s](?:[^*]*[^*\s])?)\*|(?<!\w)_([^_\s](?:[^_]*[^_\s])?)_(?!\w)"
+)
+_SAFE_URL = re.compile(r"(https?:|mailto:)", re.IGNORECASE)
+_HEADING = re.compile(r"(#{1,6})\s+(.*?)\s*#*\s*$")
+_BULLET = re.compile(r"\s*[-*+]\s+(.*)")
+_ORDERED = re.compile(r"\s*\d+[.)]\s+(.*)")
+_RULE = re.compile(r"\s*([-*_])(\s*\1){2,}\s*$")
+
+
+def _inline(text: str) -> str:
+    out = []
+    pos = 0
+    for match in _INLINE.finditer(text):
+        out.append(escape(text[pos : match.start()]))
+        code, label, href, strong, strong_alt, em, em_alt = match.groups()
+        if code is not None:
+            out.append(f"<code>{escape(code)}</code>")
+        elif label is not None:
+            if _SAFE_URL.match(href):
+                out.append(f'<a href="{escape(href)}">{_inline(label)}</a>')
+            else:
+                out.append(_inline(label))
+        elif strong or strong_alt:
+            out.append(f"<strong>{_inline(strong or strong_alt)}</strong>")
+        else:
+            out.append(f"<em>{_inline(em or em_alt)}</em>")
+        pos = match.end()
+    out.append(escape(text[pos:]))
+    return "".join(out)
+
+
+def markdown_to_html(text: str) -> str:
+    """
+    Render a Markdown summary to sanitized HTML.
+
+    Covers what the summarizer prompt asks for (``##`` headings, bold and
+    italic, bullet and numbered lists) plus inline code, fenced code blocks,
+    quotes, rules and http(s)/mailto links. Raw HTML in the input is escaped.
+    """
+    if not text:
+        return ""
+    blocks = []
+    paragraph = []
+    items = []
+    list_tag = None
+    code = None
+
+    def flush():
+        nonlocal list_tag
+        if paragraph:
+            blocks.append(f"<p>{_inline(chr(10).join(paragraph))}</p>")
+            paragraph.clear()
+        if items:
+            body = "\n".join(f"<li>{_inline(item)}</li>" for item in items)
+            blocks.append(f"<{list_tag}>\n{body}\n</{list_tag}>")
+            items.clear()
+            list_tag = None
+
+    for line in text.split("\n"):
+        if code is not None:
+            if line.strip().startswith("```"):
+                blocks.append(f"<pre><code>{escape(chr(10).join(code))}\n</code></pre>")
+                code = None
+            else:
+                code.append(line)
+            continue
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            flush()
+            code = []
+        elif not stripped:
+            flush()
+        elif _RULE.match(line):
+            flush()
+            blocks.append("<hr>")
+        elif _HEADING.match(stripped):
+            flush()
+            hashes, title = _HEADING.match(stripped).groups()
+            blocks.append(f"<h{len(hashes)}>{_inline(title)}</h{len(hashes)}>")
+        elif _BULLET.match(line) or _ORDERED.match(line):
+            tag = "ul" if _BULLET.match(line) else "ol"
+            if paragraph or (items and tag != list_tag):
+                flush()
+            list_tag = tag
+            items.append((_BULLET.match(line) or _ORDERED.match(line)).group(1))
+        elif stripped.startswith(">"):
+            flush()
+            blocks.append(f"<blockquote>\n<p>{_inline(stripped.lstrip('> '))}</p>\n</blockquote>")
+        elif items and line[:1].isspace():
+            # Continuation of the previous list item
+            items[-1] += "\n" + stripped
+        else:
+            if items:
+                flush()
+            paragraph.append(stripped)
+    if code is not None:
+        blocks.append(f"<pre><code>{escape(chr(10).join(code))}\n</code></pre>")
+    flush()
+    return "\n".join(blocks) + "\n"
+
+
+def render_fragments(paper: Dict, wrap_width: int = 72) -> Dict[str, str]:
+    """All fragments of one paper."""
+    summary_zh = paper.get("summary_zh", "")
+    summary_en = paper.get("summary_en", "")
+    fallback = paper.get("summary") or paper.get("abstract")
+    return {
+        "text_zh": wrap_text(summary_zh or "", wrap_width),
+        "text_en": wrap_text(summary_en or "", wrap_width),
+        "text_abstract": wrap_text(paper.get("abstract", "No summary available."), wrap_width),
+        "html_zh": markdown_to_html(summary_zh or fallback),
+        "html_en": markdown_to_html(summary_en or fallback),
+    }
+
+
+def site_paper(paper: Dict) -> Dict:
+    """
+    Copy of a paper for the day shards: the rendered HTML of each summary
+    replaces its Markdown. Summaries the paper lacks are left out (the HTML
+    fragments fall back to the abstract, which the shard already holds), and
+    papers that were not rendered keep their Markdown.
+    """
+    view = {k: v for k, v in paper.items() if k not in SITE_HTML and k not in SITE_HTML.values()}
+    for markdown, html in SITE_HTML.items():
+        if not paper.get(markdown):
+            continue
+        if paper.get(html) is not None:
+            view[html] = paper[html]
+        else:
+            view[markdown] = paper[markdown]
+    return view
+
+
+class RenderCache:
+    """Content-hash-keyed fragments of the papers, stored next to them."""
+
+    def __init__(self, store, wrap_width: int = 72):
+        """
+        Args:
+            store: Open PaperStore holding the ``renders`` table
+            wrap_width: Column width of the plain-text fragments
+        """
+        self.store = store
+        self.wrap_width = wrap_width
+        self.hits = 0
+        self.misses = 0
+
+    def get_many(self, papers: List[Dict]) -> Dict[str, Dict]:
+        """
+        Return {id: fragments}, rendering only new or changed papers.
+        """
+        keys = {paper["id"]: content_key(paper, self.wrap_width) for paper in papers}
+        cached = self.store.get_renders(keys)
+        fragments = {}
+        rendered = []
+        with span("render", cat="render", papers=len(keys)):
+            for paper in papers:
+                paper_id = paper["id"]
+                if paper_id in fragments:
+                    continue
+                key, data = cached.get(paper_id, (None, None))
+                if key == keys[paper_id]:
+                    fragments[paper_id] = data
+                    self.hits += 1
+                    continue
+                fragments[paper_id] = render_fragments(paper, self.wrap_width)
+                rendered.append((paper_id, keys[paper_id], fragments[paper_id]))
+                self.misses += 1
+        if rendered:
+            self.store.put_renders(rendered)
+        return fragments
+
+    def annotate(self, papers: List[Dict]):
+        """Add the summary HTML fragments to papers in place."""
+        fragments = self.get_many(papers)
+        for paper in papers:
+            for name, field in SITE_FIELDS.items():
+                paper[field] = fragments[paper["id"]][name]
+
+    def report(self) -> str:
+        return f"✓ Render cache: {self.hits} reused, {self.misses} rendered"
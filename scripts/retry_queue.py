@@ -0,0 +1,243 @@
+"""
+Retry queue for failed summaries with backoff and dead-lettering.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Set
+
+from serialize import dumps
+from journal import atomic_write_bytes
+
+
+class RetryQueue:
+    """
+    Failed papers waiting for another summarization attempt.
+
+    ``failed.json`` keeps its ``{"papers": [...], "last_updated", "count"}``
+    layout; each paper carries a ``retry`` record::
+
+        {"attempts": 2, "last_error": "http_429",
+         "first_failed": "...", "last_attempt": "...", "next_eligible": "..."}
+
+    After the n-th failure a paper waits ``base_delay_hours * 2**(n-1)``
+    (capped at ``max_delay_hours``) before it is eligible again. A paper that
+    reaches ``max_attempts``, or fails with one of ``dead_letter_errors``, is
+    moved to the dead-letter file and never retried automatically; it is
+    dropped from there ``dead_letter_days`` after its last attempt (like an
+    expired paper), or put back on the queue with requeue_dead(). Each run
+    retries at most ``quota`` eligible papers, fewest attempts first, then by
+    keyword score and publication date.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        dead_letter_path: Path,
+        max_attempts: int = 5,
+        base_delay_hours: float = 6.0,
+        max_delay_hours: float = 72.0,
+        quota: int = 20,
+        dead_letter_errors: List[str] = None,
+        dead_letter_days: float = None,
+    ):
+        """
+        Load the queue and the dead-letter file.
+
+        Args:
+            path: Queue file (failed.json)
+            dead_letter_path: Dead-letter file
+            max_attempts: Failures after which a paper is dead-lettered
+            base_delay_hours: Backoff after the first failure
+            max_delay_hours: Upper bound of the backoff
+            quota: Maximum number of retries per run
+            dead_letter_errors: Error classes that are never retried
+            dead_letter_days: Drop dead-lettered papers this many days after
+                their last attempt (None: keep them)
+        """
+        self.path = Path(path)
+        self.dead_letter_path = Path(dead_letter_path)
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = timedelta(hours=base_delay_hours)
+        self.max_delay = timedelta(hours=max_delay_hours)
+        self.quota = quota
+        self.dead_letter_errors = set(dead_letter_errors or [])
+        self.dead_letter_age = (
+            timedelta(days=dead_letter_days) if dead_letter_days is not None else None
+        )
+
+        self.entries = {p["id"]: p for p in self._load(self.path)}
+        self.dead = {p["id"]: p for p in self._load(self.dead_letter_path)}
+        self.newly_dead = []
+
+    @staticmethod
+    def _load(path: Path) -> List[Dict]:
+        if not path.exists():
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("papers", [])
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def ids(self) -> Set[str]:
+        """Ids owned by the queue or the dead-letter file (skipped by the pipeline)."""
+        return set(self.entries) | set(self.dead)
+
+    def _retry_record(self, paper: Dict) -> Dict:
+        # Entries written before the queue existed have failed once and are due now
+        return paper.get("retry") or {"attempts": 1, "last_error": paper.get("summary_error")}
+
+    def _backoff(self, attempts: int) -> timedelta:
+        return min(self.base_delay * (2 ** max(0, attempts - 1)), self.max_delay)
+
+    def due(self, now: datetime = None) -> List[Dict]:
+        """
+        Eligible papers for this run, highest priority first, limited to the quota.
+
+        Returns:
+            Papers to retry; they stay queued until record_success() or
+            record_failure() reports the outcome
+        """
+        now = now or datetime.now()
+        eligible = []
+        for paper in self.entries.values():
+            next_eligible = self._retry_record(paper).get("next_eligible")
+            if not next_eligible or datetime.fromisoformat(next_eligible) <= now:
+                eligible.append(paper)
+
+        # Newest first, then (stable) fewest attempts and highest keyword score
+        eligible.sort(key=lambda p: p.get("published", ""), reverse=True)
+        eligible.sort(
+            key=lambda p: (self._retry_record(p)["attempts"], -p.get("keyword_score", 0))
+        )
+        return eligible[: self.quota] if self.quota is not None else eligible
+
+    def record_success(self, papers: List[Dict]):
+        """Drop successfully summarized papers from the queue and clear their retry data."""
+        for paper in papers:
+            self.entries.pop(paper["id"], None)
+            paper.pop("retry", None)
+            paper.pop("summary_error", None)
+
+    def record_failure(self, papers: List[Dict], now: datetime = None):
+        """
+        Count a failed attempt for each paper and schedule its next try.
+
+        Papers that exhaust ``max_attempts`` or fail with a dead-letter error
+        class move to the dead-letter file.
+        """
+        now = now or datetime.now()
+        for paper in papers:
+            previous = self.entries.get(paper["id"])
+            record = dict(self._retry_record(previous)) if previous else {}
+            attempts = record.get("attempts", 0) + 1
+            error = paper.pop("summary_error", None) or "unknown"
+            record.update(
+                {
+                    "attempts": attempts,
+                    "last_error": error,
+                    "first_failed": record.get("first_failed", now.isoformat()),
+                    "last_attempt": now.isoformat(),
+                    "next_eligible": (now + self._backoff(attempts)).isoformat(),
+                }
+            )
+            paper["retry"] = record
+
+            if attempts >= self.max_attempts or error in self.dead_letter_errors:
+                self.entries.pop(paper["id"], None)
+                self.dead[paper["id"]] = paper
+                self.newly_dead.append(paper)
+            else:
+                self.entries[paper["id"]] = paper
+
+    def expire_dead(self, now: datetime = None) -> int:
+        """
+        Drop dead-lettered papers whose last attempt is older than ``dead_letter_days``.
+
+        Expired ids are no longer skipped by the pipeline.
+
+        Returns:
+            Number of dropped papers
+        """
+        if self.dead_letter_age is None:
+            return 0
+        cutoff = ((now or datetime.now()) - self.dead_letter_age).isoformat()
+        expired = [
+            paper_id
+            for paper_id, paper in self.dead.items()
+            if self._retry_record(paper).get("last_attempt", cutoff) < cutoff
+        ]
+        for paper_id in expired:
+            del self.dead[paper_id]
+        return len(expired)
+
+    def requeue_dead(self, ids: List[str] = None, now: datetime = None) -> List[str]:
+        """
+        Move dead-lettered papers back to the queue, due immediately.
+
+        Their attempt count starts over; the first failure time is kept.
+
+        Args:
+            ids: Papers to requeue (None: all dead-lettered papers)
+
+        Returns:
+            Ids that were requeued
+        """
+        now = now or datetime.now()
+        requeued = []
+        for paper_id in list(self.dead) if ids is None else ids:
+            paper = self.dead.pop(paper_id, None)
+            if paper is None:
+                continue
+            record = self._retry_record(paper)
+            paper["retry"] = {
+                "attempts": 0,
+                "last_error": record.get("last_error"),
+                "first_failed": record.get("first_failed", now.isoformat()),
+                "requeued": now.isoformat(),
+            }
+            self.entries[paper_id] = paper
+            requeued.append(paper_id)
+        return requeued
+
+    def save(self):
+        """Write the queue (removed when empty) and the dead-letter file."""
+        now = datetime.now().isoformat()
+        if self.entries:
+            papers = list(self.entries.values())
+            data = {"papers": papers, "last_updated": now, "count": len(papers)}
+            atomic_write_bytes(self.path, dumps(data, compact=False))
+            print(f"✓ Saved {len(papers)} papers to retry queue {self.path}")
+        elif self.path.exists():
+            self.path.unlink()
+            print("✓ Cleared retry queue (nothing left to retry)")
+
+        if self.dead:
+            papers = list(self.dead.values())
+            data = {"papers": papers, "last_updated": now, "count": len(papers)}
+            atomic_write_bytes(self.dead_letter_path, dumps(data, compact=False))
+            if self.newly_dead:
+                print(
+                    f"✓ Moved {len(self.newly_dead)} papers to dead-letter file "
+                    f"{self.dead_letter_path}"
+                )
+        elif self.dead_letter_path.exists():
+            self.dead_letter_path.unlink()
+            print("✓ Cleared dead-letter file")
@@ -1,5 +1,5 @@
 """
-RSS feed generator for Paper Pulse.
+Feed generator (RSS 2.0, Atom 1.0, JSON Feed 1.1) for Paper Pulse.
 
 Copyright (C) 2024-2026 Paper Pulse Contributors
 
@@ -15,88 +15,436 @@ GNU General Public License for more details.
 
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Each paper is converted once into a FeedItem (dates, summary fallback,
+categories); the item caches its serialization per format, so a paper that
+appears in several feeds (feed.xml, feeds/source-iacr.xml, feeds/kw-backdoor.xml) and
+several formats is formatted once per format.
 """
 
-import xml.etree.ElementTree as ET
-from datetime import datetime
-from pathlib import Path
+import hashlib
+import re
+from datetime import datetime, timezone
 from email.utils import format_datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+from journal import atomic_write_bytes
+from serialize import dumps, write_precompressed
+from tracing import slugify
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+JSON_FEED_VERSION = "https://jsonfeed.org/version/1.1"
+DEFAULT_DESCRIPTION = "Keyword-based research paper aggregation from arXiv and IACR"
+DEFAULT_FORMATS = ("rss", "atom", "json")
 
+# Digest of everything but the build timestamp, written right after the XML
+# declaration of RSS and Atom documents
+_HASH_COMMENT = "<!-- content-sha256: {} -->\n"
+_HASH_PATTERN = re.compile(rb"<!-- content-sha256: ([0-9a-f]{64}) -->")
 
-def _date_to_rfc822(date_str: str) -> str:
-    """Convert YYYY-MM-DD date string to RFC 822 format for RSS."""
+
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """YYYY-MM-DD publication date as a UTC datetime, or None."""
     try:
-        dt = datetime.strptime(date_str, "%Y-%m-%d")
-        return format_datetime(dt)
+        return datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
     except (ValueError, TypeError):
-        return format_datetime(datetime.now())
+        return None
 
 
-def generate_rss_feed(
+def _rfc3339(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _element(name: str, text: str, indent: str, attrs: str = "") -> str:
+    return f"{indent}<{name}{attrs}>{escape(text or '')}</{name}>\n"
+
+
+class FeedItem:
+    """Format-independent view of one paper, shared by every feed and format."""
+
+    def __init__(self, paper: Dict):
+        self.title = paper.get("title", "Untitled")
+        self.url = paper.get("url", "")
+        self.id = self.url or f"urn:paper-pulse:{paper.get('id', '')}"
+        # Use English summary, fall back to abstract
+        self.summary = paper.get("summary_en") or paper.get("summary") or paper.get("abstract", "")
+        # Same summary as HTML, when the render cache has added it
+        self.html = paper.get("summary_en_html")
+        self.published = paper.get("published", "")
+        self.date = _parse_date(self.published)
+        self.authors = [a for a in paper.get("authors") or [] if a]
+        self.source = paper.get("source")
+        self.keywords = list(paper.get("keywords", []))
+        # Source and the first keywords as categories
+        self.categories = ([self.source] if self.source else []) + self.keywords[:5]
+        self._rendered = {}
+
+    def render(self, fmt: str) -> str:
+        """Serialized item in ``fmt`` ("rss", "atom" or "json"), cached."""
+        text = self._rendered.get(fmt)
+        if text is None:
+            text = self._rendered[fmt] = FORMATS[fmt]["item"](self)
+        return text
+
+
+def _rss_item(item: FeedItem) -> str:
+    parts = ["    <item>\n"]
+    parts.append(_element("title", item.title, "      "))
+    parts.append(_element("link", item.url, "      "))
+    parts.append(_element("guid", item.url, "      ", ' isPermaLink="true"'))
+    parts.append(_element("description", item.html or item.summary, "      "))
+    if item.published:
+        date = item.date or datetime.now(timezone.utc)
+        parts.append(_element("pubDate", format_datetime(date), "      "))
+    for category in item.categories:
+        parts.append(_element("category", category, "      "))
+    parts.append("    </item>\n")
+    return "".join(parts)
+
+
+def _atom_entry(item: FeedItem) -> str:
+    parts = ["  <entry>\n"]
+    parts.append(_element("title", item.title, "    "))
+    if item.url:
+        parts.append(f"    <link href={quoteattr(item.url)} />\n")
+    parts.append(_element("id", item.id, "    "))
+    if item.date:
+        stamp = _rfc3339(item.date)
+        parts.append(_element("published", stamp, "    "))
+        parts.append(_element("updated", stamp, "    "))
+    for author in item.authors:
+        parts.append(f"    <author><name>{escape(author)}</name></author>\n")
+    if item.html:
+        parts.append(_element("summary", item.html, "    ", ' type="html"'))
+    else:
+        parts.append(_element("summary", item.summary, "    "))
+    for category in item.categories:
+        parts.append(f"    <category term={quoteattr(category)} />\n")
+    parts.append("  </entry>\n")
+    return "".join(parts)
+
+
+def _json_item(item: FeedItem) -> str:
+    entry = {"id": item.id, "url": item.url, "title": item.title, "content_text": item.summary}
+    if item.html:
+        entry["content_html"] = item.html
+    if item.date:
+        entry["date_published"] = _rfc3339(item.date)
+    if item.authors:
+        entry["authors"] = [{"name": a} for a in item.authors]
+    if item.categories:
+        entry["tags"] = item.categories
+    return dumps(entry).decode("utf-8")
+
+
+class Feed:
+    """
+    One channel (main, per-source or per-keyword) collecting up to
+    ``max_items`` FeedItems, written in each requested format.
+    """
+
+    def __init__(
+        self,
+        stem: Path,
+        title: str,
+        site_url: str = "",
+        description: str = DEFAULT_DESCRIPTION,
+        self_url: str = "",
+        max_items: int = 50,
+    ):
+        """
+        Args:
+            stem: Output path without suffix, e.g. ``feeds/iacr``
+            title: Channel title
+            site_url: Link of the channel
+            description: Channel description
+            self_url: Public URL of the feed without suffix ("" to omit)
+            max_items: Maximum number of items
+        """
+        self.stem = Path(stem)
+        self.title = title
+        self.site_url = site_url
+        self.description = description
+        self.self_url = self_url
+        self.max_items = max_items
+        self.items: List[FeedItem] = []
+
+    @property
+    def full(self) -> bool:
+        return len(self.items) >= self.max_items
+
+    def add(self, item: FeedItem):
+        if not self.full:
+            self.items.append(item)
+
+    def path(self, fmt: str) -> Path:
+        return self.stem.with_name(self.stem.name + FORMATS[fmt]["suffix"])
+
+    def write(self, fmt: str, precompress: List[str] = None, force: bool = False) -> bool:
+        """
+        Write the feed in one format unless its content is unchanged.
+
+        The build timestamp (RSS ``lastBuildDate``, Atom feed ``updated``) is
+        left out of the comparison, so it records when the items last
+        changed rather than when the pipeline last ran.
+
+        Returns:
+            True if the file was (re)written
+        """
+        document = FORMATS[fmt]["document"]
+        items = [item.render(fmt) for item in self.items]
+        path = self.path(fmt)
+
+        stable = document(self, items, built=None, digest=None)
+        digest = hashlib.sha256(stable.encode("utf-8")).hexdigest()
+        if not force and path.exists() and _stored_digest(path, fmt) == digest:
+            return False
+
+        data = document(self, items, built=datetime.now(timezone.utc), digest=digest)
+        data = data.encode("utf-8")
+        # Atomically, readers never see a partial feed
+        atomic_write_bytes(path, data)
+        if precompress:
+            write_precompressed(path, data, precompress)
+        return True
+
+
+def _stored_digest(path: Path, fmt: str) -> str:
+    """Content digest of an existing feed file, or "" if unknown."""
+    try:
+        if fmt == "json":
+            # JSON Feed has no build timestamp: the digest covers the file
+            return hashlib.sha256(path.read_bytes()).hexdigest()
+        with open(path, "rb") as f:
+            match = _HASH_PATTERN.search(f.read(256))
+    except OSError:
+        return ""
+    return match.group(1).decode() if match else ""
+
+
+def _rss_document(feed: Feed, items: List[str], built, digest) -> str:
+    parts = ["<?xml version='1.0' encoding='utf-8'?>\n"]
+    if digest:
+        parts.append(_HASH_COMMENT.format(digest))
+    parts.append(f'<rss xmlns:atom="{ATOM_NS}" version="2.0">\n  <channel>\n')
+    parts.append(_element("title", feed.title, "    "))
+    parts.append(_element("link", feed.site_url or "https://github.com", "    "))
+    parts.append(_element("description", feed.description, "    "))
+    if feed.self_url:
+        parts.append(
+            f"    <atom:link href={quoteattr(feed.self_url + '.xml')} rel=\"self\" "
+            f'type="application/rss+xml" />\n'
+        )
+    if built:
+        parts.append(_element("lastBuildDate", format_datetime(built), "    "))
+    parts.extend(items)
+    parts.append("  </channel>\n</rss>\n")
+    return "".join(parts)
+
+
+def _atom_document(feed: Feed, items: List[str], built, digest) -> str:
+    parts = ["<?xml version='1.0' encoding='utf-8'?>\n"]
+    if digest:
+        parts.append(_HASH_COMMENT.format(digest))
+    parts.append(f'<feed xmlns="{ATOM_NS}">\n')
+    parts.append(_element("title", feed.title, "  "))
+    parts.append(_element("subtitle", feed.description, "  "))
+    parts.append(f"  <link href={quoteattr(feed.site_url or 'https://github.com')} />\n")
+    if feed.self_url:
+        parts.append(
+            f"  <link href={quoteattr(feed.self_url + '.atom')} rel=\"self\" "
+            f'type="application/atom+xml" />\n'
+        )
+    feed_id = feed.self_url + ".atom" if feed.self_url else f"urn:paper-pulse:{feed.stem.name}"
+    parts.append(_element("id", feed_id, "  "))
+    if built:
+        parts.append(_element("updated", _rfc3339(built), "  "))
+    # Entries without authors inherit the feed author
+    parts.append(f"  <author><name>{escape(feed.title)}</name></author>\n")
+    parts.extend(items)
+    parts.append("</feed>\n")
+    return "".join(parts)
+
+
+def _json_document(feed: Feed, items: List[str], built, digest) -> str:
+    head = {
+        "version": JSON_FEED_VERSION,
+        "title": feed.title,
+        "home_page_url": feed.site_url or "https://github.com",
+        "description": feed.description,
+    }
+    if feed.self_url:
+        head["feed_url"] = feed.self_url + ".json"
+    # Items are already serialized; splice them into the document
+    return dumps(head).decode("utf-8")[:-1] + ',"items":[' + ",".join(items) + "]}\n"
+
+
+FORMATS = {
+    "rss": {"suffix": ".xml", "item": _rss_item, "document": _rss_document},
+    "atom": {"suffix": ".atom", "item": _atom_entry, "document": _atom_document},
+    "json": {"suffix": ".json", "item": _json_item, "document": _json_document},
+}
+
+
+def feed_formats(requested: List[str]) -> List[str]:
+    """Known formats among ``requested`` (all formats when None)."""
+    if requested is None:
+        return list(DEFAULT_FORMATS)
+    unknown = [fmt for fmt in requested if fmt not in FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown feed formats {unknown}; choose from {list(FORMATS)}")
+    return list(requested)
+
+
+def generate_feeds(
     papers: list,
     output_path: Path,
+    feeds_dir: Path = None,
     site_url: str = "",
     title: str = "Paper Pulse",
-    description: str = "Keyword-based research paper aggregation from arXiv and IACR",
     max_items: int = 50,
-):
-    """Generate an RSS 2.0 feed XML file from papers.
+    per_source: bool = True,
+    per_keyword: bool = True,
+    formats: List[str] = None,
+    precompress: list = None,
+    force: bool = False,
+) -> Dict[str, int]:
+    """
+    Write the main feed and the per-source / per-keyword feeds in one pass.
+
+    Each paper becomes a FeedItem at most once and is shared by all feeds it
+    belongs to (``feeds/source-iacr.xml``, ``feeds/kw-backdoor.xml``, ...);
+    the prefixes keep a keyword from overwriting a source's feed. Every feed
+    is written as ``.xml`` (RSS 2.0), ``.atom`` (Atom 1.0) and ``.json``
+    (JSON Feed 1.1), as selected by ``formats``. Files whose content did not
+    change are not rewritten, and feeds of sources or keywords that no
+    longer have papers are removed.
 
     Args:
         papers: List of paper dicts, assumed already sorted by date descending.
-        output_path: Path to write the feed.xml file.
+        output_path: Path of the main feed.xml (other formats use the same stem).
+        feeds_dir: Directory of the focused feeds (default: ``feeds`` next to
+            output_path).
         site_url: Base URL of the site (e.g. "https://user.github.io/paper-pulse").
-        title: Feed title.
-        description: Feed description.
-        max_items: Maximum number of items to include in the feed.
+        title: Title of the main feed; focused feeds append their topic.
+        max_items: Maximum number of items per feed.
+        per_source: Write one feed per source.
+        per_keyword: Write one feed per matched keyword.
+        formats: Any of "rss", "atom", "json" (default: all three).
+        precompress: Compressed siblings to write next to each file, e.g. ["gz", "br"].
+        force: Rewrite files even if unchanged.
+
+    Returns:
+        Dictionary with the number of files ``written`` and ``unchanged``
     """
-    ET.register_namespace("atom", "http://www.w3.org/2005/Atom")
-    rss = ET.Element("rss", version="2.0")
-    channel = ET.SubElement(rss, "channel")
-
-    ET.SubElement(channel, "title").text = title
-    ET.SubElement(channel, "link").text = site_url or "https://github.com"
-    ET.SubElement(channel, "description").text = description
-    ET.SubElement(channel, "lastBuildDate").text = format_datetime(datetime.now())
-
-    if site_url:
-        feed_url = site_url.rstrip("/") + "/feed.xml"
-        atom_link = ET.SubElement(
-            channel,
-            "{http://www.w3.org/2005/Atom}link",
-            href=feed_url,
-            rel="self",
-            type="application/rss+xml",
-        )
+    formats = feed_formats(formats)
+    output_path = Path(output_path)
+    feeds_dir = Path(feeds_dir) if feeds_dir else output_path.parent / "feeds"
+    base_url = site_url.rstrip("/")
+    main = Feed(
+        output_path.with_suffix(""),
+        title,
+        site_url=site_url,
+        self_url=f"{base_url}/{output_path.stem}" if site_url else "",
+        max_items=max_items,
+    )
+    focused: Dict[str, Feed] = {}
 
-    for paper in papers[:max_items]:
-        item = ET.SubElement(channel, "item")
+    def focused_feed(kind: str, topic: str) -> Feed:
+        slug = f"{kind}-{slugify(topic)}"
+        feed = focused.get(slug)
+        if feed is None:
+            feed = focused[slug] = Feed(
+                feeds_dir / slug,
+                f"{title} — {topic}",
+                site_url=site_url,
+                description=f"{DEFAULT_DESCRIPTION} — {topic}",
+                self_url=f"{base_url}/{feeds_dir.name}/{slug}" if site_url else "",
+                max_items=max_items,
+            )
+        return feed
 
-        ET.SubElement(item, "title").text = paper.get("title", "Untitled")
-        ET.SubElement(item, "link").text = paper.get("url", "")
-        ET.SubElement(item, "guid", isPermaLink="true").text = paper.get("url", "")
+    for paper in papers:
+        targets = [] if main.full else [main]
+        if per_source and paper.get("source"):
+            targets.append(focused_feed("source", paper["source"]))
+        if per_keyword:
+            targets.extend(focused_feed("kw", kw) for kw in paper.get("keywords", []))
+        targets = [feed for feed in targets if not feed.full]
+        if targets:
+            item = FeedItem(paper)
+            for feed in targets:
+                feed.add(item)
 
-        # Use English summary, fall back to abstract
-        desc = paper.get("summary_en") or paper.get("summary") or paper.get("abstract", "")
-        ET.SubElement(item, "description").text = desc
+    feeds = [main] + list(focused.values())
+    written = 0
+    for feed in feeds:
+        for fmt in formats:
+            written += feed.write(fmt, precompress=precompress, force=force)
+    total = len(feeds) * len(formats)
 
-        pub_date = paper.get("published", "")
-        if pub_date:
-            ET.SubElement(item, "pubDate").text = _date_to_rfc822(pub_date)
+    # Topics that disappeared (e.g. a removed keyword) and disabled formats.
+    # Only names this function generates are removed: feeds_dir comes from
+    # the config and may be shared with other files (e.g. the site root).
+    if feeds_dir.exists():
+        current = {feed.path(fmt).name for feed in focused.values() for fmt in formats}
+        suffixes = "|".join(re.escape(spec["suffix"]) for spec in FORMATS.values())
+        generated = re.compile(rf"(source|kw)-[^/]+({suffixes})(\.gz|\.br)?")
+        for stale in feeds_dir.iterdir():
+            name = re.sub(r"\.(gz|br)$", "", stale.name)
+            if stale.is_file() and generated.fullmatch(stale.name) and name not in current:
+                stale.unlink()
 
-        # Source as category
-        source = paper.get("source")
-        if source:
-            ET.SubElement(item, "category").text = source
+    print(
+        f"✓ Feeds ({', '.join(formats)}): {written} files written, {total - written} unchanged "
+        f"({output_path.stem}: {len(main.items)} items"
+        + (f", {len(focused)} focused feeds in {feeds_dir}" if focused else "")
+        + ")"
+    )
+    return {"written": written, "unchanged": total - written}
 
-        # Keywords as categories
-        for kw in paper.get("keywords", [])[:5]:
-            ET.SubElement(item, "category").text = kw
 
-    # Write XML with declaration
-    tree = ET.ElementTree(rss)
-    ET.indent(tree, space="  ")
-    with open(output_path, "wb") as f:
-        tree.write(f, encoding="utf-8", xml_declaration=True)
+def generate_rss_feed(
+    papers: list,
+    output_path: Path,
+    site_url: str = "",
+    title: str = "Paper Pulse",
+    description: str = DEFAULT_DESCRIPTION,
+    max_items: int = 50,
+    precompress: list = None,
+    force: bool = False,
+) -> bool:
+    """Generate a single RSS 2.0 feed XML file from papers.
 
-    print(f"✓ Generated RSS feed at {output_path} ({min(len(papers), max_items)} items)")
+    Args:
+        papers: List of paper dicts, assumed already sorted by date descending.
+        output_path: Path to write the feed.xml file.
+        site_url: Base URL of the site (e.g. "https://user.github.io/paper-pulse").
+        title: Feed title.
+        description: Feed description.
+        max_items: Maximum number of items to include in the feed.
+        precompress: Compressed siblings to write next to the feed, e.g. ["gz", "br"].
+        force: Rewrite the feed even if its items are unchanged.
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    output_path = Path(output_path)
+    feed = Feed(
+        output_path.with_suffix(""),
+        title,
+        site_url=site_url,
+        description=description,
+        self_url=site_url.rstrip("/") + "/feed" if site_url else "",
+        max_items=max_items,
+    )
+    for paper in papers[:max_items]:
+        feed.add(FeedItem(paper))
+    written = feed.write("rss", precompress=precompress, force=force)
+    if written:
+        print(f"✓ Generated RSS feed at {output_path} ({len(feed.items)} items)")
+    else:
+        print(f"✓ RSS feed {output_path} unchanged")
+    return written
@@ -0,0 +1,141 @@
+"""
+Prebuilt client-side search index for the Paper Pulse site.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+search_index.json holds an inverted index over the fields the site
+searches (title, authors, summary, abstract, keywords) and the paper order
+of every sort option, so app.js answers a query with binary searches and
+set intersections instead of scanning and re-sorting every paper:
+
+    {
+      "version": 1,
+      "ids": ["2401.00001", ...],          # ordinal -> paper id
+      "tokens": ["attack", "backdoor", ...],  # sorted
+      "postings": [[0, 3, 1], ...],        # ordinals per token, delta-encoded
+      "orders": {"date-desc": [...], "date-asc": [...], "title": [...]}
+    }
+
+Tokens are lowercase runs of letters and digits; CJK runs are indexed as
+character bigrams (single characters when the run has one). tokenize() in
+app.js must split text the same way.
+"""
+
+import re
+from operator import add
+from pathlib import Path
+from typing import Dict, List
+
+from journal import atomic_write_bytes
+from serialize import dumps, write_precompressed
+
+INDEX_VERSION = 1
+
+SEARCH_FIELDS = ("title", "summary", "abstract")
+
+# Kana, CJK ideographs, Hangul
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af"
+_CJK_RUN = re.compile(f"[{_CJK}]+")
+_WORD = re.compile(rf"[^\W_{_CJK}]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into index tokens (see the module docstring)."""
+    text = text.lower()
+    tokens = _WORD.findall(text)
+    for run in _CJK_RUN.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(map(add, run, run[1:]))
+    return tokens
+
+
+def paper_tokens(paper: Dict) -> set:
+    """Distinct tokens of the searchable fields of one paper."""
+    texts = [paper.get(field) or "" for field in SEARCH_FIELDS]
+    texts += paper.get("authors") or []
+    texts += paper.get("keywords") or []
+    tokens = set()
+    for text in texts:
+        tokens.update(tokenize(text))
+    return tokens
+
+
+def _delta(ordinals: List[int]) -> List[int]:
+    return [o - p for o, p in zip(ordinals, [0] + ordinals[:-1])]
+
+
+def build_search_index(papers: List[Dict]) -> Dict:
+    """
+    Build the index of papers in display order (ordinal = list position).
+
+    Returns:
+        The search_index.json document
+    """
+    postings: Dict[str, List[int]] = {}
+    for ordinal, paper in enumerate(papers):
+        for token in paper_tokens(paper):
+            postings.setdefault(token, []).append(ordinal)
+    # UTF-16 order, as compared by the binary search in app.js
+    tokens = sorted(postings, key=lambda token: token.encode("utf-16-be"))
+
+    ordinals = range(len(papers))
+    published = [p.get("published") or "" for p in papers]
+    titles = [p.get("title") or "" for p in papers]
+    # Stable sorts, like Array.prototype.sort in app.js
+    orders = {
+        "date-desc": sorted(ordinals, key=lambda i: published[i], reverse=True),
+        "date-asc": sorted(ordinals, key=lambda i: published[i]),
+        "title": sorted(ordinals, key=lambda i: (titles[i].casefold(), titles[i])),
+    }
+    return {
+        "version": INDEX_VERSION,
+        "ids": [p["id"] for p in papers],
+        "tokens": tokens,
+        "postings": [_delta(postings[token]) for token in tokens],
+        "orders": orders,
+    }
+
+
+def write_search_index(
+    papers: List[Dict], filepath: Path, precompress: List[str] = None
+) -> bool:
+    """
+    Write search_index.json unless its content is unchanged.
+
+    Args:
+        papers: Published papers, in the order of papers.json and the shards
+        filepath: Destination path
+        precompress: Compressed siblings to write, e.g. ["gz", "br"]
+
+    Returns:
+        True if the file was written
+    """
+    filepath = Path(filepath)
+    index = build_search_index(papers)
+    data = dumps(index)
+    if filepath.exists() and filepath.read_bytes() == data:
+        print(f"✓ Search index unchanged ({len(index['tokens'])} tokens)")
+        return False
+    atomic_write_bytes(filepath, data)
+    if precompress:
+        write_precompressed(filepath, data, precompress)
+    print(
+        f"✓ Wrote search index to {filepath} "
+        f"({len(index['tokens'])} tokens, {len(data) / 1024:.0f} KB)"
+    )
+    return True
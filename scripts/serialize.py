@@ -0,0 +1,117 @@
+"""
+JSON serialization and precompressed static artifacts for Paper Pulse.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any, List
+
+from journal import atomic_write_bytes
+
+# Optional fast encoder
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional Brotli support for .br siblings
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def encoder_name() -> str:
+    """Name of the JSON encoder in use ("orjson" or "json")."""
+    return "orjson" if orjson else "json"
+
+
+def dumps(obj: Any, compact: bool = True) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes.
+
+    Uses orjson when it is installed, otherwise the standard library. Both
+    produce the same document (non-ASCII characters are written as-is).
+
+    Args:
+        obj: JSON-serializable object
+        compact: No whitespace when True, 2-space indentation otherwise
+    """
+    if orjson:
+        return orjson.dumps(obj) if compact else orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    if compact:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    else:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def precompress_formats(requested: List[str]) -> List[str]:
+    """Requested sibling formats ("gz", "br") that can be produced here."""
+    available = []
+    for fmt in requested or []:
+        if fmt == "gz" or (fmt == "br" and brotli):
+            available.append(fmt)
+    return available
+
+
+def write_precompressed(filepath: Path, data: bytes, formats: List[str]) -> List[Path]:
+    """
+    Write compressed siblings (``file.gz``, ``file.br``) next to a file.
+
+    Gzip output uses a fixed mtime so unchanged content produces identical
+    bytes (and no git churn). Brotli is skipped when the module is missing.
+    Stale siblings of formats that are not written are left alone.
+
+    Returns:
+        Paths of the siblings written
+    """
+    filepath = Path(filepath)
+    written = []
+    for fmt in precompress_formats(formats):
+        if fmt == "gz":
+            payload = gzip.compress(data, compresslevel=9, mtime=0)
+        else:
+            payload = brotli.compress(data, quality=11)
+        sibling = filepath.with_name(f"{filepath.name}.{fmt}")
+        atomic_write_bytes(sibling, payload)
+        written.append(sibling)
+    return written
+
+
+def write_json(
+    filepath: Path, obj: Any, compact: bool = True, precompress: List[str] = None
+) -> bytes:
+    """
+    Atomically write a JSON file and, optionally, its compressed siblings.
+
+    Args:
+        filepath: Destination path
+        obj: JSON-serializable object
+        compact: Write compact JSON (see dumps())
+        precompress: Sibling formats to write, e.g. ["gz", "br"]
+
+    Returns:
+        The serialized bytes
+    """
+    data = dumps(obj, compact=compact)
+    atomic_write_bytes(filepath, data)
+    if precompress:
+        write_precompressed(filepath, data, precompress)
+    return data
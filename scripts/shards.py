@@ -0,0 +1,296 @@
+"""
+Day-partitioned JSON shards and manifest for the static site.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+from journal import atomic_write_bytes, atomic_write_text
+from serialize import dumps, write_precompressed
+
+# Shard key for papers without a usable publication date
+UNDATED = "undated"
+
+MANIFEST_VERSION = 1
+LISTING_VERSION = 1
+
+# Fields the site needs to list, filter and sort papers (and to build BibTeX)
+LISTING_FIELDS = (
+    "id",
+    "title",
+    "authors",
+    "source",
+    "published",
+    "keywords",
+    "url",
+    "pdf_link",
+    "arxiv_id",
+    "iacr_id",
+)
+
+
+def shard_key(paper: Dict) -> str:
+    """Publication day (YYYY-MM-DD) a paper is filed under."""
+    published = (paper.get("published") or "")[:10]
+    try:
+        datetime.strptime(published, "%Y-%m-%d")
+    except ValueError:
+        return UNDATED
+    return published
+
+
+def partition_by_day(papers: List[Dict]) -> Dict[str, List[Dict]]:
+    """
+    Group papers by publication day, keeping their input order within a day.
+
+    Returns:
+        Dictionary of shard key to papers, newest day first (undated last)
+    """
+    shards = {}
+    for paper in papers:
+        shards.setdefault(shard_key(paper), []).append(paper)
+    dated = sorted((k for k in shards if k != UNDATED), reverse=True)
+    ordered = {k: shards[k] for k in dated}
+    if UNDATED in shards:
+        ordered[UNDATED] = shards[UNDATED]
+    return ordered
+
+
+def load_manifest(manifest_path: Path) -> Dict:
+    """Load an existing manifest (empty manifest if missing or unreadable)."""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"shards": []}
+
+
+def write_shards(
+    papers: List[Dict],
+    shard_dir: Path,
+    manifest_path: Path,
+    last_updated: str = None,
+    compact: bool = True,
+) -> Dict:
+    """
+    Write one JSON file per publication day plus a manifest describing them.
+
+    Each shard is serialized deterministically and hashed; a shard file is
+    only rewritten when its hash differs from the previous manifest (or the
+    file is missing), so a daily run touches the days that actually changed
+    instead of the whole corpus. Shards for days that no longer hold any
+    paper (e.g. after retention) are deleted. When no shard was written or
+    removed, the previous manifest (and its ``last_updated``) is kept as is.
+
+    Args:
+        papers: Papers to publish, in display order (newest first)
+        shard_dir: Directory for the shard files
+        manifest_path: Destination of the manifest
+        last_updated: Timestamp to record when shards changed (default: now)
+        compact: Write compact JSON shards instead of indented
+
+    Returns:
+        The manifest dictionary
+    """
+    shard_dir = Path(shard_dir)
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    last_updated = last_updated or datetime.now().isoformat()
+
+    old_manifest = load_manifest(manifest_path)
+    previous = {s["date"]: s for s in old_manifest.get("shards", [])}
+    entries = []
+    written = 0
+
+    for day, day_papers in partition_by_day(papers).items():
+        data = dumps({"date": day, "papers": day_papers}, compact=compact)
+        digest = hashlib.sha256(data).hexdigest()
+        filename = f"{day}.json"
+        shard_path = shard_dir / filename
+
+        old = previous.get(day)
+        if not old or old.get("sha256") != digest or not shard_path.exists():
+            atomic_write_bytes(shard_path, data)
+            written += 1
+
+        sources = {}
+        for paper in day_papers:
+            source = paper.get("source", "unknown")
+            sources[source] = sources.get(source, 0) + 1
+
+        entries.append(
+            {
+                "date": day,
+                "file": f"{shard_dir.name}/{filename}",
+                "count": len(day_papers),
+                "sources": sources,
+                "sha256": digest,
+            }
+        )
+
+    current = {e["date"] for e in entries}
+    removed = 0
+    for stale in shard_dir.glob("*.json"):
+        if stale.stem not in current:
+            stale.unlink()
+            removed += 1
+
+    unchanged = (
+        not written
+        and not removed
+        and old_manifest.get("version") == MANIFEST_VERSION
+        and old_manifest.get("shards") == entries
+        and old_manifest.get("last_updated")
+    )
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "last_updated": old_manifest["last_updated"] if unchanged else last_updated,
+        "total_count": len(papers),
+        "shards": entries,
+    }
+    if manifest != old_manifest:
+        atomic_write_text(manifest_path, json.dumps(manifest, indent=2, ensure_ascii=False))
+
+    print(
+        f"✓ Wrote {written} of {len(entries)} day shards to {shard_dir}"
+        + (f", removed {removed} stale" if removed else "")
+    )
+    return manifest
+
+
+def build_listing(papers: List[Dict], manifest: Dict) -> Dict:
+    """
+    Slim, column-oriented view of the papers for the site's list pages.
+
+    Every listing field is stored as one array in display order, so key
+    names are not repeated per paper; sources and keywords are stored once
+    and referenced by position. The ``chunk`` column points into
+    ``chunks``, the day shard holding the paper's summaries and abstract,
+    which the site fetches when the paper is displayed.
+
+    Args:
+        papers: Papers to publish, in display order (newest first)
+        manifest: Manifest returned by write_shards() for the same papers
+
+    Returns:
+        The listing.json document
+    """
+    chunk_of = {entry["date"]: i for i, entry in enumerate(manifest["shards"])}
+    tables = {"sources": {}, "keywords": {}}
+
+    def code(table: str, value: str) -> int:
+        return tables[table].setdefault(value, len(tables[table]))
+
+    columns = {name: [] for name in LISTING_FIELDS + ("chunk",)}
+    for paper in papers:
+        for name in LISTING_FIELDS:
+            value = paper.get(name)
+            if name == "source":
+                value = code("sources", value or "unknown")
+            elif name == "keywords":
+                value = [code("keywords", kw) for kw in value or []]
+            elif name == "authors":
+                value = value or []
+            columns[name].append(value)
+        columns["chunk"].append(chunk_of.get(shard_key(paper)))
+
+    return {
+        "version": LISTING_VERSION,
+        "last_updated": manifest.get("last_updated"),
+        "total_count": len(papers),
+        "chunks": [entry["file"] for entry in manifest["shards"]],
+        "sources": list(tables["sources"]),
+        "keywords": list(tables["keywords"]),
+        "columns": columns,
+    }
+
+
+def write_listing(
+    papers: List[Dict], manifest: Dict, listing_path: Path, precompress: List[str] = None
+) -> Dict:
+    """
+    Write listing.json (see build_listing()).
+
+    Args:
+        papers: Papers to publish, in display order (newest first)
+        manifest: Manifest returned by write_shards() for the same papers
+        listing_path: Destination path
+        precompress: Compressed siblings to write, e.g. ["gz", "br"]
+
+    Returns:
+        The listing dictionary
+    """
+    listing = build_listing(papers, manifest)
+    data = dumps(listing)
+    atomic_write_bytes(listing_path, data)
+    if precompress:
+        write_precompressed(listing_path, data, precompress)
+    print(
+        f"✓ Wrote listing of {len(papers)} papers to {listing_path} ({len(data) / 1024:.0f} KB)"
+    )
+    return listing
+
+
+# Committed copy of the paper database: the same day shards, holding the
+# complete papers as indented JSON so that git stores line diffs
+SNAPSHOT_SHARDS = "days"
+SNAPSHOT_MANIFEST = "manifest.json"
+
+
+def snapshot_digest(manifest: Dict) -> str:
+    """Digest of a manifest's shard hashes, identifying one snapshot."""
+    hashes = [entry["sha256"] for entry in manifest.get("shards", [])]
+    return hashlib.sha256(json.dumps(hashes).encode("utf-8")).hexdigest()
+
+
+def write_snapshot(papers: List[Dict], snapshot_dir: Path) -> Dict:
+    """
+    Write every paper into per-day files under ``snapshot_dir``.
+
+    Papers are ordered by id within a day, so the files do not depend on
+    the database's insertion order; unchanged days are not rewritten.
+
+    Returns:
+        The snapshot manifest
+    """
+    snapshot_dir = Path(snapshot_dir)
+    return write_shards(
+        sorted(papers, key=lambda p: p["id"]),
+        snapshot_dir / SNAPSHOT_SHARDS,
+        snapshot_dir / SNAPSHOT_MANIFEST,
+        compact=False,
+    )
+
+
+def read_snapshot(snapshot_dir: Path) -> tuple:
+    """
+    Load the papers of a snapshot written by write_snapshot().
+
+    Returns:
+        Tuple of (papers, manifest); no papers and an empty manifest if
+        there is no snapshot
+    """
+    snapshot_dir = Path(snapshot_dir)
+    manifest = load_manifest(snapshot_dir / SNAPSHOT_MANIFEST)
+    papers = []
+    for entry in manifest.get("shards", []):
+        with open(snapshot_dir / entry["file"], "r", encoding="utf-8") as f:
+            papers.extend(json.load(f)["papers"])
+    return papers, manifest
@@ -0,0 +1,587 @@
+"""
+SQLite-backed paper store for Paper Pulse.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from serialize import write_json
+from tracing import span
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    id TEXT PRIMARY KEY,
+    published TEXT,
+    source TEXT,
+    summary_status TEXT,
+    data TEXT NOT NULL,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_papers_published ON papers(published);
+CREATE INDEX IF NOT EXISTS idx_papers_source ON papers(source);
+CREATE INDEX IF NOT EXISTS idx_papers_status ON papers(summary_status);
+
+CREATE TABLE IF NOT EXISTS paper_keywords (
+    paper_id TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    PRIMARY KEY (paper_id, keyword)
+);
+CREATE INDEX IF NOT EXISTS idx_keywords_keyword ON paper_keywords(keyword);
+
+CREATE TABLE IF NOT EXISTS paper_profiles (
+    paper_id TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    PRIMARY KEY (paper_id, profile)
+);
+CREATE INDEX IF NOT EXISTS idx_profiles_profile ON paper_profiles(profile);
+
+CREATE TABLE IF NOT EXISTS archive_index (
+    id TEXT PRIMARY KEY,
+    partition TEXT NOT NULL,
+    published TEXT,
+    source TEXT,
+    title TEXT,
+    keywords TEXT,
+    archived_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_archive_published ON archive_index(published);
+
+CREATE TABLE IF NOT EXISTS renders (
+    paper_id TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _chunks(items: List, size: int = 500):
+    """Split a list to stay well below SQLite's bound-parameter limit."""
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def profile_view(paper: Dict, profile: Optional[str]) -> Dict:
+    """
+    Strip multi-profile bookkeeping from a paper for publishing.
+
+    With a profile name, keywords and keyword_score are narrowed to what that
+    profile matched; the ``profiles`` map itself is never published.
+    """
+    matches = paper.pop("profiles", None) or {}
+    if profile is not None and profile in matches:
+        paper["keywords"] = matches[profile]
+        paper["keyword_score"] = len(matches[profile])
+    return paper
+
+
+# Rows that expire at a retention cutoff. Comparing strings alone would also
+# expire papers with an empty or malformed date, which sort first; those are
+# kept, like the legacy remove_old_papers() (benchmarks/legacy_store.py) did.
+EXPIRED = "published <= ? AND published GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'"
+
+
+def retention_cutoff(days: int) -> str:
+    """
+    Newest publication date (YYYY-MM-DD) that is considered expired.
+
+    Matches the legacy remove_old_papers(): a paper is kept while its publication day
+    (at midnight) is not earlier than ``now - days``.
+    """
+    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+class PaperStore:
+    """
+    Indexed paper database with a small repository API.
+
+    Each paper is stored as its full JSON document plus indexed columns
+    (id, published, source, summary_status) and a keyword table, so lookups,
+    upserts and retention touch only the affected rows. ``papers.json`` is an
+    exported view produced by export_json().
+    """
+
+    SCHEMA_VERSION = 4
+
+    def __init__(self, db_path: Path, archive=None):
+        """
+        Open (and create if needed) the store.
+
+        Args:
+            db_path: Path to the SQLite database file
+            archive: Optional ColdArchive; expired papers are moved there by
+                archive_older_than() and lookups fall back to it
+        """
+        self.db_path = Path(db_path)
+        self.archive = archive
+        self.restored_count = 0
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.executescript(SCHEMA)
+        self.set_meta("schema_version", str(self.SCHEMA_VERSION))
+        self.conn.commit()
+
+    def close(self):
+        """Commit and close the connection."""
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    # Metadata
+
+    def get_meta(self, key: str, default: str = None) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key: str, value: str):
+        self.conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    # Lookups
+
+    def count(self, profile: str = None) -> int:
+        """Number of papers in the store (or selected by one profile)."""
+        if profile is not None:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM paper_profiles WHERE profile = ?", (profile,)
+            ).fetchone()[0]
+        return self.conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    def get(self, paper_id: str) -> Optional[Dict]:
+        """Return one paper by id (restoring it from the archive if needed), or None."""
+        return self.get_many([paper_id]).get(paper_id)
+
+    def get_many(self, paper_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Return {id: paper} for the ids that exist in the store.
+
+        With a cold archive attached, archived papers are restored into the
+        hot set and returned as well, so their summaries are reused.
+        """
+        found = {}
+        ids = list(paper_ids)
+        for chunk in _chunks(ids):
+            placeholders = ",".join("?" * len(chunk))
+            for paper_id, data in self.conn.execute(
+                f"SELECT id, data FROM papers WHERE id IN ({placeholders})", chunk
+            ):
+                found[paper_id] = json.loads(data)
+
+        if self.archive is not None and len(found) < len(ids):
+            missing = [i for i in ids if i not in found]
+            found.update(self.restore(missing))
+        return found
+
+    def recent(self, limit: int = None, offset: int = 0, profile: str = None) -> List[Dict]:
+        """
+        Papers ordered by publication date, newest first.
+
+        Ties keep insertion order, matching the stable sort main() used on
+        the merged list.
+
+        Args:
+            limit: Maximum number of papers (None for all)
+            offset: Number of papers to skip
+            profile: Only papers selected by this profile (None for all)
+        """
+        sql = "SELECT data FROM papers"
+        params = []
+        if profile is not None:
+            sql += " WHERE id IN (SELECT paper_id FROM paper_profiles WHERE profile = ?)"
+            params.append(profile)
+        sql += " ORDER BY published DESC, rowid ASC"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        return [json.loads(data) for (data,) in self.conn.execute(sql, params)]
+
+    def all_papers(self) -> List[Dict]:
+        """Every paper, newest first."""
+        return self.recent()
+
+    def fingerprint(self) -> str:
+        """
+        Digest of the hot set's ids and update times.
+
+        Changes whenever a paper is written, archived or restored, so callers
+        can tell whether a published view is stale without exporting it.
+        """
+        digest = hashlib.sha256()
+        for row in self.conn.execute("SELECT id, updated_at FROM papers ORDER BY id"):
+            digest.update("\x1f".join(str(v) for v in row).encode("utf-8"))
+            digest.update(b"\n")
+        return digest.hexdigest()
+
+    def ids_with_keyword(self, keyword: str) -> List[str]:
+        """Ids of papers tagged with a keyword."""
+        return [
+            row[0]
+            for row in self.conn.execute(
+                "SELECT paper_id FROM paper_keywords WHERE keyword = ?", (keyword,)
+            )
+        ]
+
+    # Writes
+
+    def upsert(self, papers: List[Dict]) -> tuple:
+        """
+        Insert new papers and update existing ones with successful summaries.
+
+        Same rules as the legacy merge_papers(): an unknown id is always inserted, a known
+        id is only overwritten when the incoming paper has
+        ``summary_status == "success"``.
+
+        Returns:
+            Tuple of (new_count, updated_count)
+        """
+        existing = self.get_many(p["id"] for p in papers)
+        now = datetime.now().isoformat()
+        new_count = 0
+        updated_count = 0
+
+        with span("store.upsert", cat="io", papers=len(papers)):
+            for paper in papers:
+                if paper["id"] in existing:
+                    if paper.get("summary_status") != "success":
+                        continue
+                    updated_count += 1
+                else:
+                    new_count += 1
+                existing[paper["id"]] = paper
+                self._write(paper, now)
+
+            self.conn.commit()
+        print(f"✓ Added {new_count} new papers, updated {updated_count} papers")
+        return new_count, updated_count
+
+    def _write(self, paper: Dict, now: str):
+        self.conn.execute(
+            "INSERT INTO papers (id, published, source, summary_status, data, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET published = excluded.published, "
+            "source = excluded.source, summary_status = excluded.summary_status, "
+            "data = excluded.data, updated_at = excluded.updated_at",
+            (
+                paper["id"],
+                paper.get("published"),
+                paper.get("source"),
+                paper.get("summary_status"),
+                json.dumps(paper, ensure_ascii=False),
+                now,
+            ),
+        )
+        self.conn.execute("DELETE FROM paper_keywords WHERE paper_id = ?", (paper["id"],))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO paper_keywords (paper_id, keyword) VALUES (?, ?)",
+            [(paper["id"], kw) for kw in paper.get("keywords", [])],
+        )
+        self.conn.execute("DELETE FROM paper_profiles WHERE paper_id = ?", (paper["id"],))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO paper_profiles (paper_id, profile) VALUES (?, ?)",
+            [(paper["id"], name) for name in paper.get("profiles", {})],
+        )
+
+    def _delete_index_rows(self, cutoff: str):
+        """Drop keyword/profile rows of papers published on or before cutoff."""
+        for table in ("paper_keywords", "paper_profiles"):
+            self.conn.execute(
+                f"DELETE FROM {table} WHERE paper_id IN "
+                f"(SELECT id FROM papers WHERE {EXPIRED})",
+                (cutoff,),
+            )
+
+    def remove_older_than(self, days: int) -> int:
+        """
+        Delete papers published more than ``days`` days ago.
+
+        Uses the published index; papers with a missing date are kept.
+
+        Returns:
+            Number of papers removed
+        """
+        cutoff = retention_cutoff(days)
+        self._delete_index_rows(cutoff)
+        removed = self.conn.execute(
+            f"DELETE FROM papers WHERE {EXPIRED}", (cutoff,)
+        ).rowcount
+        self.conn.commit()
+        if removed > 0:
+            print(f"✓ Removed {removed} papers older than {days} days")
+        return removed
+
+    # Cold archive
+
+    def archive_older_than(self, days: int) -> int:
+        """
+        Move papers published more than ``days`` days ago to the cold archive.
+
+        Expired rows are read through the published index (oldest first),
+        appended to the compressed archive partitions and indexed in
+        ``archive_index`` before they are deleted from the hot set, so a crash
+        in between only leaves a duplicate archive copy. Falls back to
+        remove_older_than() when no archive is attached.
+
+        Returns:
+            Number of papers archived
+        """
+        if self.archive is None:
+            return self.remove_older_than(days)
+
+        cutoff = retention_cutoff(days)
+        papers = [
+            json.loads(data)
+            for (data,) in self.conn.execute(
+                f"SELECT data FROM papers WHERE {EXPIRED} ORDER BY published", (cutoff,)
+            )
+        ]
+        if not papers:
+            return 0
+
+        partitions = self.archive.append(papers)
+        self._index_archived(papers)
+        self._delete_index_rows(cutoff)
+        self.conn.execute(f"DELETE FROM papers WHERE {EXPIRED}", (cutoff,))
+        self.conn.commit()
+        print(
+            f"✓ Archived {len(papers)} papers older than {days} days "
+            f"into {len(partitions)} partitions"
+        )
+        return len(papers)
+
+    def _index_archived(self, papers: List[Dict]):
+        now = datetime.now().isoformat()
+        self.conn.executemany(
+            "INSERT INTO archive_index "
+            "(id, partition, published, source, title, keywords, archived_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET partition = excluded.partition, "
+            "published = excluded.published, source = excluded.source, "
+            "title = excluded.title, keywords = excluded.keywords, "
+            "archived_at = excluded.archived_at",
+            [
+                (
+                    p["id"],
+                    self.archive.partition_for(p),
+                    p.get("published"),
+                    p.get("source"),
+                    p.get("title"),
+                    " ".join(p.get("keywords", [])),
+                    now,
+                )
+                for p in papers
+            ],
+        )
+
+    def reindex_archive(self) -> int:
+        """
+        Rebuild ``archive_index`` from the archive partitions.
+
+        Used when the database is recreated next to an existing archive;
+        papers that are also in the hot set are not indexed.
+
+        Returns:
+            Number of indexed papers
+        """
+        if self.archive is None:
+            return 0
+        hot = {paper_id for (paper_id,) in self.conn.execute("SELECT id FROM papers")}
+        count = 0
+        for partition in self.archive.partitions():
+            papers = [
+                p for p in self.archive.read_partition(partition).values() if p["id"] not in hot
+            ]
+            self._index_archived(papers)
+            count += len(papers)
+        self.conn.commit()
+        return count
+
+    def archived_locations(self, paper_ids: Iterable[str]) -> Dict[str, str]:
+        """Return {id: partition} for the ids that are in the archive index."""
+        locations = {}
+        for chunk in _chunks(list(paper_ids)):
+            placeholders = ",".join("?" * len(chunk))
+            locations.update(
+                self.conn.execute(
+                    f"SELECT id, partition FROM archive_index WHERE id IN ({placeholders})",
+                    chunk,
+                )
+            )
+        return locations
+
+    def restore(self, paper_ids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Bring archived papers back into the hot set.
+
+        The running total is kept in ``restored_count``.
+
+        Returns:
+            Dictionary of paper id to restored paper
+        """
+        if self.archive is None:
+            return {}
+        locations = self.archived_locations(paper_ids)
+        if not locations:
+            return {}
+
+        restored = self.archive.load(locations)
+        now = datetime.now().isoformat()
+        for paper in restored.values():
+            self._write(paper, now)
+        self.conn.executemany(
+            "DELETE FROM archive_index WHERE id = ?", [(i,) for i in restored]
+        )
+        self.conn.commit()
+        self.restored_count += len(restored)
+        return restored
+
+    def search_archive(self, text: str, limit: int = 50) -> List[Dict]:
+        """
+        Find archived papers whose title or keywords contain ``text``.
+
+        Returns:
+            Index rows (id, partition, published, source, title), newest first
+        """
+        pattern = f"%{text.lower()}%"
+        rows = self.conn.execute(
+            "SELECT id, partition, published, source, title FROM archive_index "
+            "WHERE lower(title) LIKE ? OR lower(keywords) LIKE ? "
+            "ORDER BY published DESC LIMIT ?",
+            (pattern, pattern, limit),
+        )
+        columns = ["id", "partition", "published", "source", "title"]
+        return [dict(zip(columns, row)) for row in rows]
+
+    def archive_count(self) -> int:
+        """Number of papers in the archive index."""
+        return self.conn.execute("SELECT COUNT(*) FROM archive_index").fetchone()[0]
+
+    # Render cache
+
+    def get_renders(self, paper_ids: Iterable[str]) -> Dict[str, tuple]:
+        """Return {id: (content_hash, fragments)} of the cached renders."""
+        found = {}
+        for chunk in _chunks(list(paper_ids)):
+            placeholders = ",".join("?" * len(chunk))
+            for paper_id, key, data in self.conn.execute(
+                f"SELECT paper_id, content_hash, data FROM renders "
+                f"WHERE paper_id IN ({placeholders})",
+                chunk,
+            ):
+                found[paper_id] = (key, json.loads(data))
+        return found
+
+    def put_renders(self, rows: List[tuple]):
+        """Store (id, content_hash, fragments) rows, replacing older renders."""
+        self.conn.executemany(
+            "INSERT INTO renders (paper_id, content_hash, data) VALUES (?, ?, ?) "
+            "ON CONFLICT(paper_id) DO UPDATE SET content_hash = excluded.content_hash, "
+            "data = excluded.data",
+            [(i, key, json.dumps(data, ensure_ascii=False)) for i, key, data in rows],
+        )
+        self.conn.commit()
+
+    def prune_renders(self, keep: Iterable[str] = ()) -> int:
+        """
+        Drop renders of papers that left the hot set (expired or archived).
+
+        Args:
+            keep: Ids to keep even if they are not in the hot set (e.g. the
+                papers of the current email report)
+        """
+        keep = set(keep)
+        stale = [
+            (paper_id,)
+            for (paper_id,) in self.conn.execute(
+                "SELECT paper_id FROM renders WHERE paper_id NOT IN (SELECT id FROM papers)"
+            )
+            if paper_id not in keep
+        ]
+        self.conn.executemany("DELETE FROM renders WHERE paper_id = ?", stale)
+        self.conn.commit()
+        return len(stale)
+
+    # Import / export
+
+    def import_papers(self, papers: List[Dict], last_updated: str = None) -> int:
+        """Write complete paper documents as they are (bootstrap and snapshot restore)."""
+        now = datetime.now().isoformat()
+        for paper in papers:
+            self._write(paper, now)
+        if last_updated:
+            self.set_meta("last_updated", last_updated)
+        self.conn.commit()
+        return len(papers)
+
+    def import_json(self, filepath: Path) -> int:
+        """Load papers from a papers.json file (used to bootstrap the store)."""
+        with open(filepath, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        count = self.import_papers(data.get("papers", []), data.get("last_updated"))
+        print(f"✓ Imported {count} papers from {filepath} into {self.db_path}")
+        return count
+
+    def export_json(
+        self,
+        filepath: Path,
+        last_updated: str = None,
+        compact: bool = True,
+        precompress: List[str] = None,
+        profile: str = None,
+    ) -> dict:
+        """
+        Write the papers.json view consumed by the static site.
+
+        Args:
+            filepath: Destination path
+            last_updated: Timestamp to record (default: now)
+            compact: Write compact JSON instead of indented
+            precompress: Compressed siblings to write, e.g. ["gz", "br"]
+            profile: Export only this profile's papers, with the keywords
+                that profile matched (None for every paper)
+
+        Returns:
+            The exported data dictionary
+        """
+        last_updated = last_updated or datetime.now().isoformat()
+        self.set_meta("last_updated", last_updated)
+        self.conn.commit()
+        papers = [profile_view(p, profile) for p in self.recent(profile=profile)]
+        data = {
+            "papers": papers,
+            "last_updated": last_updated,
+            "total_count": len(papers),
+        }
+        write_json(filepath, data, compact=compact, precompress=precompress)
+        print(f"✓ Saved data to {filepath}")
+        return data
@@ -17,12 +17,24 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 import sys
 import os
 
+from backends import LLMBackend, DashScopeBackend
+from telemetry import SummaryTelemetry
+from metrics import (
+    LLM_TOKENS,
+    SUMMARIZE_CALLS,
+    SUMMARIZE_LATENCY,
+    SUMMARIZE_PAPER_SECONDS,
+    SUMMARIZE_RETRIES,
+)
+from tracing import span
+
 # Import progress utilities if available
 try:
     from progress import ProgressBar
@@ -33,17 +45,26 @@ except ImportError:
 
 
 class ModelScopeSummarizer:
-    """Summarizes paper abstracts using DashScope API (Qwen/通义千问)."""
+    """
+    Summarizes paper abstracts using DashScope API (Qwen/通义千问).
+
+    The HTTP layer is provided by an LLMBackend, so the same pipeline can run
+    against DashScope, any OpenAI-compatible service or a local server.
+    """
 
     # DashScope API (阿里云通义千问)
-    API_URL = (
-        "https://dashscope.aliyuncs.com/api/v1/services/aigc/text-generation/generation"
-    )
+    API_URL = DashScopeBackend.DEFAULT_URL
     DEFAULT_MODEL = "qwen-plus"  # Free tier available
     DEFAULT_MAX_TOKENS = 500
     DEFAULT_TEMPERATURE = 0.7
     DEFAULT_TIMEOUT = 60
     DEFAULT_RATE_LIMIT_DELAY = 1.0
+    # Section markers requested by the bilingual prompt
+    SECTION_MARKERS = {"zh": "中文摘要", "en": "English Summary"}
+    # Shorter sections are treated as missing/truncated and get repaired
+    MIN_SECTION_CHARS = {"zh": 40, "en": 80}
+    # Share of max_tokens granted to a single-section repair request
+    REPAIR_TOKEN_SHARE = {"zh": 0.7, "en": 0.4}
     DEFAULT_PROMPT_TEMPLATE = """Please summarize this research paper in 3-5 sentences. Focus on the main contribution, methods, and key results.
 
 Title: {title}
@@ -63,6 +84,11 @@ Provide a concise summary:"""
         timeout: int = None,
         rate_limit_delay: float = None,
         prompt_template: str = None,
+        api_url: str = None,
+        concurrency: int = 1,
+        cascade_models: list = None,
+        escalate_score: int = 0,
+        backend: LLMBackend = None,
     ):
         """
         Initialize DashScope summarizer.
@@ -77,6 +103,15 @@ Provide a concise summary:"""
             timeout: Request timeout in seconds
             rate_limit_delay: Delay between API calls
             prompt_template: Custom prompt template with {title} and {abstract} placeholders
+            api_url: Override the DashScope endpoint (e.g. a local mock server)
+            concurrency: Number of papers summarized in parallel by batch_summarize
+            cascade_models: Models ordered from cheapest to strongest. Each paper
+                starts on the first one and escalates to the next only when the
+                output fails validation and cannot be repaired (default: [model])
+            escalate_score: Papers whose keyword_score is at least this value
+                skip the cheapest tier (0 disables relevance-based escalation)
+            backend: Provider backend (default: DashScopeBackend using api_key
+                and api_url). Its max_concurrency caps ``concurrency``.
         """
         self.api_key = api_key
         self.model = model or self.DEFAULT_MODEL
@@ -85,15 +120,37 @@ Provide a concise summary:"""
         self.max_tokens = max_tokens or self.DEFAULT_MAX_TOKENS
         self.temperature = temperature or self.DEFAULT_TEMPERATURE
         self.timeout = timeout or self.DEFAULT_TIMEOUT
-        self.rate_limit_delay = rate_limit_delay or self.DEFAULT_RATE_LIMIT_DELAY
+        self.rate_limit_delay = (
+            self.DEFAULT_RATE_LIMIT_DELAY if rate_limit_delay is None else rate_limit_delay
+        )
         self.prompt_template = prompt_template or self.DEFAULT_PROMPT_TEMPLATE
+        self.api_url = api_url or self.API_URL
+        self.backend = backend or DashScopeBackend(api_key=api_key, url=self.api_url)
+        self.concurrency = self.backend.limit_concurrency(concurrency)
+        self.cascade_models = list(cascade_models or [self.model])
+        self.escalate_score = escalate_score or 0
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.total_cached_input_tokens = 0
+        self.total_retries = 0
+        self.total_repairs = 0
+        self.total_escalations = 0
+        self._stats_lock = threading.Lock()
+        # Per-call instrumentation; the thread-local context tags records
+        # with the paper being processed by the current worker
+        self.telemetry = SummaryTelemetry()
+        self._call_context = threading.local()
 
     def summarize(self, paper: Dict) -> tuple[Optional[str], Optional[str]]:
         """
         Generate bilingual (Chinese and English) summaries for a paper.
 
+        The paper walks up ``cascade_models``: a response with one missing or
+        truncated section gets a small follow-up request for just that section,
+        and only a response that cannot be repaired escalates to the next model.
+        The model that produced the accepted summary is stored in
+        ``paper["summary_model"]``.
+
         Args:
             paper: Paper dictionary containing title and abstract
 
@@ -104,35 +161,202 @@ Provide a concise summary:"""
         abstract = paper.get("abstract", "")
 
         if not abstract:
+            self._call_context.last_error = "empty_abstract"
             return None, None
 
-        # Create prompt for bilingual summarization
+        # Create prompt for bilingual summarization: shared system prefix
+        # plus the per-paper user message
+        system_prompt = self._create_bilingual_system_prompt()
         prompt = self._create_bilingual_prompt(title, abstract)
 
-        # Try to generate summary with retries
+        start_tier = 0
+        if (
+            self.escalate_score
+            and len(self.cascade_models) > 1
+            and paper.get("keyword_score", 0) >= self.escalate_score
+        ):
+            start_tier = 1
+
+        for tier in range(start_tier, len(self.cascade_models)):
+            model = self.cascade_models[tier]
+            if tier > start_tier:
+                with self._stats_lock:
+                    self.total_escalations += 1
+
+            result = self._call_with_retries(prompt, system_prompt, model, kind="full")
+            if result is None:
+                continue
+
+            sections = dict(
+                zip(("zh", "en"), self._parse_bilingual_summary(result["content"]))
+            )
+            # A length stop can only cut off whichever section came last
+            cut_off = None
+            if result.get("finish_reason") == "length":
+                cut_off = self._last_section(result["content"])
+            invalid = [
+                lang
+                for lang in ("zh", "en")
+                if not self._section_is_valid(lang, sections[lang], lang == cut_off)
+            ]
+            result["record"]["parse"] = (
+                "ok" if not invalid else "invalid_" + "_".join(invalid)
+            )
+
+            # Repair a single bad section with a small targeted request
+            if len(invalid) == 1:
+                lang = invalid[0]
+                repaired = self._repair_section(lang, prompt, model)
+                if repaired:
+                    sections[lang] = repaired
+                    invalid = []
+
+            if not invalid:
+                paper["summary_model"] = model
+                return sections["zh"], sections["en"]
+            self._call_context.last_error = "invalid_output"
+
+        return None, None
+
+    def _call_with_retries(
+        self,
+        prompt: str,
+        system_prompt: str,
+        model: str,
+        max_tokens: int = None,
+        kind: str = "full",
+    ) -> Optional[Dict]:
+        """
+        Call the API up to max_retries times; return the first non-empty result.
+
+        Every attempt is recorded in ``self.telemetry``; the returned result
+        carries its call record under ``"record"`` so the caller can add the
+        parse outcome.
+        """
+        ctx = self._call_context
         for attempt in range(self.max_retries):
-            try:
-                summary, input_tokens, output_tokens = self._call_api(prompt)
-                if summary:
+            if attempt > 0:
+                with self._stats_lock:
+                    self.total_retries += 1
+                SUMMARIZE_RETRIES.inc()
+
+            result = None
+            start = time.perf_counter()
+            with span("llm.call", cat="llm", model=model, kind=kind, attempt=attempt + 1) as call:
+                try:
+                    result = self._call_api(
+                        prompt,
+                        system_prompt=system_prompt,
+                        model=model,
+                        max_tokens=max_tokens,
+                    )
+                    status = result.get("status")
+                except Exception as e:
+                    response = getattr(e, "response", None)
+                    status = getattr(response, "status_code", None) or type(e).__name__
+                call.args["status"] = status
+
+            record = self.telemetry.record_call(
+                paper_id=getattr(ctx, "paper_id", None),
+                model=model,
+                kind=kind,
+                attempt=attempt + 1,
+                status=status,
+                latency=time.perf_counter() - start,
+                ttfb=result.get("ttfb") if result else None,
+                input_tokens=result["input_tokens"] if result else 0,
+                output_tokens=result["output_tokens"] if result else 0,
+                cached_tokens=result["cached_tokens"] if result else 0,
+                parse=None,
+            )
+            ctx.calls = getattr(ctx, "calls", 0) + 1
+            model_label = model or self.model
+            SUMMARIZE_CALLS.inc(model=model_label, status=status)
+            SUMMARIZE_LATENCY.observe(record["latency"], model=model_label)
+            if result is not None:
+                LLM_TOKENS.inc(result["input_tokens"], model=model_label, type="input")
+                LLM_TOKENS.inc(result["cached_tokens"], model=model_label, type="cached_input")
+                LLM_TOKENS.inc(result["output_tokens"], model=model_label, type="output")
+
+            if result is not None:
+                if result["content"]:
                     # Accumulate token usage
-                    self.total_input_tokens += input_tokens
-                    self.total_output_tokens += output_tokens
-                    # Parse bilingual response
-                    zh_summary, en_summary = self._parse_bilingual_summary(summary)
-                    return zh_summary, en_summary
-            except Exception as e:
+                    with self._stats_lock:
+                        self.total_input_tokens += result["input_tokens"]
+                        self.total_output_tokens += result["output_tokens"]
+                        self.total_cached_input_tokens += result["cached_tokens"]
+                    result["record"] = record
+                    return result
+                record["parse"] = "empty"
+                ctx.last_error = "empty_response"
+            else:
+                ctx.last_error = f"http_{status}" if isinstance(status, int) else status
                 if attempt < self.max_retries - 1:
                     time.sleep(self.retry_delay)
+                    ctx.retry_sleep = getattr(ctx, "retry_sleep", 0.0) + self.retry_delay
 
-        return None, None
+        return None
 
-    def _create_bilingual_prompt(self, title: str, abstract: str) -> str:
-        """Create a prompt for bilingual summarization."""
-        return f"""请对这篇研究论文生成中英文双语摘要。**重要：你有 {self.max_tokens} tokens 的输出限制，请合理分配给中英文两部分。**
+    def _section_is_valid(self, lang: str, text: str, truncated: bool = False) -> bool:
+        """Check that a parsed section is present, long enough and not cut off."""
+        return bool(text) and not truncated and len(text) >= self.MIN_SECTION_CHARS[lang]
 
-论文标题: {title}
+    def _last_section(self, text: str) -> Optional[str]:
+        """Return the language whose marker appears last in text, if any."""
+        positions = {
+            lang: text.rfind(f"[{marker}]")
+            for lang, marker in self.SECTION_MARKERS.items()
+        }
+        lang = max(positions, key=positions.get)
+        return lang if positions[lang] >= 0 else None
 
-论文摘要: {abstract}
+    def _repair_section(self, lang: str, prompt: str, model: str) -> Optional[str]:
+        """
+        Regenerate only one section of the bilingual summary.
+
+        Args:
+            lang: "zh" or "en"
+            prompt: The per-paper user message of the original request
+            model: Model to use (the tier that produced the rest of the summary)
+
+        Returns:
+            The repaired section text, or None if the repair also failed validation
+        """
+        with self._stats_lock:
+            self.total_repairs += 1
+
+        max_tokens = max(1, int(self.max_tokens * self.REPAIR_TOKEN_SHARE[lang]))
+        result = self._call_with_retries(
+            prompt,
+            self._create_section_system_prompt(lang, max_tokens),
+            model,
+            max_tokens=max_tokens,
+            kind=f"repair_{lang}",
+        )
+        if result is None:
+            return None
+
+        zh_summary, en_summary = self._parse_bilingual_summary(result["content"])
+        text = {"zh": zh_summary, "en": en_summary}[lang]
+        if not text and not any(
+            f"[{marker}]" in result["content"] for marker in self.SECTION_MARKERS.values()
+        ):
+            # Only one section was requested, so an unmarked reply is that section
+            text = result["content"].strip()
+
+        truncated = result.get("finish_reason") == "length"
+        valid = self._section_is_valid(lang, text, truncated)
+        result["record"]["parse"] = "ok" if valid else "invalid"
+        return text if valid else None
+
+    def _create_bilingual_system_prompt(self) -> str:
+        """
+        Create the instruction block shared by every paper.
+
+        It is sent as the system message and must not contain per-paper
+        data, so the provider can reuse it as a cached prompt prefix.
+        """
+        return f"""你是一位学术论文解读助手。用户会提供一篇研究论文的标题和摘要，请对其生成中英文双语摘要。**重要：你有 {self.max_tokens} tokens 的输出限制，请合理分配给中英文两部分。**
 
 请按照以下格式输出（严格遵守格式，以便程序解析）：
 
@@ -152,98 +376,103 @@ Provide a concise summary:"""
 3. 可以使用 Markdown 格式（## 标题、**加粗**、列表等）
 4. 确保在 token 限制内完成两个摘要，不要截断"""
 
+    def _create_bilingual_prompt(self, title: str, abstract: str) -> str:
+        """Create the per-paper part of the bilingual prompt (user message)."""
+        return f"""论文标题: {title}
+
+论文摘要: {abstract}"""
+
+    def _create_section_system_prompt(self, lang: str, max_tokens: int) -> str:
+        """Create the system message for repairing a single summary section."""
+        if lang == "zh":
+            return f"""你是一位学术论文解读助手。用户会提供一篇研究论文的标题和摘要，请只生成中文摘要（约 400-600 字，包含背景、方法、主要发现和创新点，可使用Markdown格式）。你有 {max_tokens} tokens 的输出限制，不要截断。
+
+请按照以下格式输出：
+
+[中文摘要]
+<这里写中文摘要>"""
+        return f"""You are an assistant for reading academic papers. The user provides the title and abstract of a research paper. Write only an English summary (150-250 words, 3-5 sentences covering the core contribution and key results; Markdown allowed). You have a limit of {max_tokens} output tokens, do not truncate.
+
+Use exactly this format:
+
+[English Summary]
+<English summary here>"""
+
     def _parse_bilingual_summary(self, text: str) -> tuple[str, str]:
-        """Parse bilingual summary response into Chinese and English parts."""
+        """
+        Parse bilingual summary response into Chinese and English parts.
+
+        Each section runs from its marker to the next marker (or the end), in
+        either order. A missing section is returned as an empty string rather
+        than guessed, so the caller can repair or escalate it.
+        """
         import re
 
-        # Try to find Chinese and English sections
-        zh_match = re.search(
-            r"\[中文摘要\]\s*\n(.*?)\n\[English Summary\]", text, re.DOTALL
-        )
-        en_match = re.search(r"\[English Summary\]\s*\n(.*?)$", text, re.DOTALL)
-
-        zh_summary = zh_match.group(1).strip() if zh_match else ""
-        en_summary = en_match.group(1).strip() if en_match else ""
-
-        # Fallback: if parsing fails, split by markers or use whole text
-        if not zh_summary and not en_summary:
-            # Try alternative parsing
-            parts = re.split(r"\[(?:中文摘要|English Summary)\]", text)
-            if len(parts) >= 3:
-                zh_summary = parts[1].strip()
-                en_summary = parts[2].strip()
-            else:
-                # If all parsing fails, use the original text for both
-                zh_summary = text.strip()
-                en_summary = text.strip()
+        parts = re.split(r"\[(中文摘要|English Summary)\]", text)
+        sections = {}
+        for marker, body in zip(parts[1::2], parts[2::2]):
+            # Keep the first non-empty occurrence of each marker
+            if not sections.get(marker):
+                sections[marker] = body.strip()
 
+        zh_summary = sections.get(self.SECTION_MARKERS["zh"], "")
+        en_summary = sections.get(self.SECTION_MARKERS["en"], "")
         return zh_summary, en_summary
 
     def _create_prompt(self, title: str, abstract: str) -> str:
         """Create a prompt for the summarization model."""
         return self.prompt_template.format(title=title, abstract=abstract)
 
-    def _call_api(self, prompt: str) -> tuple:
+    def _call_api(
+        self,
+        prompt: str,
+        system_prompt: str = None,
+        model: str = None,
+        max_tokens: int = None,
+    ) -> Dict:
         """
-        Call DashScope API to generate summary.
+        Call the configured backend to generate summary.
+
+        Args:
+            prompt: Per-paper user message
+            system_prompt: Shared instructions sent first as the system message
+                so repeated calls share a cacheable prefix
+            model: Model to use (default: self.model)
+            max_tokens: Output token limit (default: self.max_tokens)
 
         Returns:
-            Tuple of (summary_text, input_tokens, output_tokens)
+            Dictionary with content, finish_reason, input_tokens, output_tokens,
+            cached_tokens, status (HTTP status code) and ttfb (seconds until
+            the response headers or first streamed token arrived)
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
-        payload = {
-            "model": self.model,
-            "input": {"messages": [{"role": "user", "content": prompt}]},
-            "parameters": {
-                "max_tokens": self.max_tokens,
-                "temperature": self.temperature,
-                "result_format": "message",
-            },
-        }
-
-        try:
-            response = requests.post(
-                self.API_URL,
-                json=payload,
-                headers=headers,
-                timeout=self.timeout,
-            )
-            response.raise_for_status()
-
-            result = response.json()
-
-            # Extract summary from DashScope response format
-            content = None
-            if "output" in result and "choices" in result["output"]:
-                choices = result["output"]["choices"]
-                if choices and len(choices) > 0:
-                    message = choices[0].get("message", {})
-                    content = message.get("content", "").strip()
-
-            # Extract token usage information
-            input_tokens = 0
-            output_tokens = 0
-            if "usage" in result:
-                usage = result["usage"]
-                input_tokens = usage.get("input_tokens", 0)
-                output_tokens = usage.get("output_tokens", 0)
-
-            return (content, input_tokens, output_tokens)
-
-        except requests.RequestException as e:
-            raise
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        return self.backend.complete(
+            messages,
+            model=model or self.model,
+            max_tokens=max_tokens or self.max_tokens,
+            temperature=self.temperature,
+            timeout=self.timeout,
+        )
 
-    def batch_summarize(self, papers: list, delay: float = None) -> tuple:
+    def batch_summarize(
+        self, papers: list, delay: float = None, journal=None
+    ) -> tuple:
         """
         Summarize multiple papers with rate limiting and progress display.
 
+        When ``concurrency`` is greater than 1, papers are summarized by a
+        thread pool; each worker still waits ``delay`` seconds between its
+        own calls. Results keep the input order either way.
+
         Args:
             papers: List of paper dictionaries
             delay: Delay between API calls to avoid rate limiting
+            journal: Optional SummaryJournal; each paper is appended to it as
+                soon as it is finished
 
         Returns:
             Tuple of (successful_papers, failed_papers)
@@ -251,8 +480,6 @@ Provide a concise summary:"""
         if delay is None:
             delay = self.rate_limit_delay
 
-        successful = []
-        failed = []
         total = len(papers)
 
         # Create progress bar if available
@@ -260,40 +487,33 @@ Provide a concise summary:"""
             progress = ProgressBar(total, "Summarizing papers")
         else:
             progress = None
+        progress_lock = threading.Lock()
 
-        for i, paper in enumerate(papers, 1):
-            # Update progress bar or print simple progress
-            if progress:
-                progress.update(1)
-            else:
-                print(f"[{i}/{total}] Summarizing: {paper['title'][:60]}...")
-
-            zh_summary, en_summary = self.summarize(paper)
+        def process(index: int, paper: Dict) -> bool:
+            with progress_lock:
+                # Update progress bar or print simple progress
+                if progress:
+                    progress.update(1)
+                else:
+                    print(f"[{index}/{total}] Summarizing: {paper['title'][:60]}...")
+            return self.summarize_one(
+                paper,
+                journal=journal,
+                delay=delay if index < total else 0.0,
+                enqueued=enqueued,
+            )
 
-            if zh_summary and en_summary:
-                paper["summary_zh"] = zh_summary
-                paper["summary_en"] = en_summary
-                paper["summary"] = (
-                    zh_summary  # Default to Chinese for backward compatibility
+        enqueued = time.perf_counter()
+        if self.concurrency > 1 and total > 1:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                outcomes = list(
+                    pool.map(process, range(1, total + 1), papers)
                 )
-                paper["summary_status"] = "success"
-                successful.append(paper)
-            else:
-                abstract = paper.get("abstract", "")
-                if abstract:
-                    paper["summary"] = abstract
-                    paper["summary_zh"] = abstract
-                    paper["summary_en"] = abstract
-                else:
-                    paper["summary"] = "Summary not available"
-                    paper["summary_zh"] = "摘要不可用"
-                    paper["summary_en"] = "Summary not available"
-                paper["summary_status"] = "failed"
-                failed.append(paper)
+        else:
+            outcomes = [process(i, paper) for i, paper in enumerate(papers, 1)]
 
-            # Rate limiting
-            if i < total:
-                time.sleep(delay)
+        successful = [p for p, ok in zip(papers, outcomes) if ok]
+        failed = [p for p, ok in zip(papers, outcomes) if not ok]
 
         # Finish progress bar
         if progress:
@@ -304,15 +524,104 @@ Provide a concise summary:"""
         )
         return successful, failed
 
+    def summarize_one(
+        self, paper: Dict, journal=None, delay: float = 0.0, enqueued: float = None
+    ) -> bool:
+        """
+        Summarize one paper in place, journal it and record its telemetry.
+
+        Safe to call from several threads at once; used by batch_summarize()
+        and by the streaming pipeline.
+
+        Args:
+            paper: Paper dictionary (summary fields are set on it)
+            journal: Optional SummaryJournal to append the finished paper to
+            delay: Rate-limit sleep after the paper (seconds)
+            enqueued: perf_counter() timestamp when the paper was queued
+
+        Returns:
+            True if a bilingual summary was produced; on failure the error
+            class is stored in ``paper["summary_error"]``
+        """
+        started = time.perf_counter()
+        ctx = self._call_context
+        ctx.paper_id = paper.get("id")
+        ctx.calls = 0
+        ctx.retry_sleep = 0.0
+        ctx.last_error = None
+
+        with span("summarize", cat="summarize", paper=paper.get("id")) as paper_span:
+            zh_summary, en_summary = self.summarize(paper)
+            ok = self._apply_summary(paper, zh_summary, en_summary)
+            paper_span.args["ok"] = ok
+        if ok:
+            paper.pop("summary_error", None)
+        else:
+            # Failure class for the retry queue, e.g. "http_429", "Timeout",
+            # "invalid_output" or "empty_abstract"
+            paper["summary_error"] = ctx.last_error or "unknown"
+        if journal is not None:
+            journal.append(paper)
+        duration = time.perf_counter() - started
+        SUMMARIZE_PAPER_SECONDS.observe(duration, outcome="success" if ok else "failed")
+
+        # Rate limiting
+        if delay:
+            time.sleep(delay)
+
+        self.telemetry.record_paper(
+            paper_id=paper.get("id"),
+            queue_wait=started - enqueued if enqueued is not None else 0.0,
+            duration=duration,
+            calls=ctx.calls,
+            retry_sleep=ctx.retry_sleep,
+            rate_limit_sleep=delay,
+            model=paper.get("summary_model") if ok else None,
+            outcome="success" if ok else "failed",
+            error=None if ok else paper["summary_error"],
+        )
+        ctx.paper_id = None
+        return ok
+
+    def _apply_summary(
+        self, paper: Dict, zh_summary: Optional[str], en_summary: Optional[str]
+    ) -> bool:
+        """Store summaries (or the abstract fallback) on the paper; return success."""
+        if zh_summary and en_summary:
+            paper["summary_zh"] = zh_summary
+            paper["summary_en"] = en_summary
+            paper["summary"] = zh_summary  # Default to Chinese for backward compatibility
+            paper["summary_status"] = "success"
+            return True
+
+        abstract = paper.get("abstract", "")
+        if abstract:
+            paper["summary"] = abstract
+            paper["summary_zh"] = abstract
+            paper["summary_en"] = abstract
+        else:
+            paper["summary"] = "Summary not available"
+            paper["summary_zh"] = "摘要不可用"
+            paper["summary_en"] = "Summary not available"
+        paper["summary_status"] = "failed"
+        return False
+
     def get_usage_stats(self) -> dict:
         """
         Get token usage statistics.
 
         Returns:
-            Dictionary with input_tokens, output_tokens, and total_tokens
+            Dictionary with input_tokens (split into cached_input_tokens and
+            uncached_input_tokens), output_tokens, total_tokens, retries,
+            repairs and escalations
         """
         return {
             'input_tokens': self.total_input_tokens,
+            'cached_input_tokens': self.total_cached_input_tokens,
+            'uncached_input_tokens': self.total_input_tokens - self.total_cached_input_tokens,
             'output_tokens': self.total_output_tokens,
-            'total_tokens': self.total_input_tokens + self.total_output_tokens
+            'total_tokens': self.total_input_tokens + self.total_output_tokens,
+            'retries': self.total_retries,
+            'repairs': self.total_repairs,
+            'escalations': self.total_escalations,
         }
@@ -0,0 +1,218 @@
+"""
+Per-call summarization telemetry for Paper Pulse.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import bisect
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is +Inf.
+# Shared by the telemetry summary and the Prometheus histograms (metrics.py).
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0]
+
+# Timing fields of call records and paper records that get histograms
+CALL_TIMINGS = ["latency", "ttfb"]
+PAPER_TIMINGS = ["queue_wait", "duration", "retry_sleep", "rate_limit_sleep"]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = int(pct / 100 * len(ordered) + 0.5)
+    return ordered[max(0, min(len(ordered) - 1, rank - 1))]
+
+
+def bucket_counts(values: List[float], buckets: List[float]) -> List[int]:
+    """
+    Number of values per bucket (not cumulative).
+
+    Bucket i holds the values in (buckets[i-1], buckets[i]]; the extra last
+    bucket holds the values above every bound.
+    """
+    counts = [0] * (len(buckets) + 1)
+    for value in values:
+        counts[bisect.bisect_left(buckets, value)] += 1
+    return counts
+
+
+def cumulative_counts(counts: List[int]) -> List[int]:
+    """Running totals of bucket_counts(): values <= each bound, then all (+Inf)."""
+    totals = []
+    running = 0
+    for count in counts:
+        running += count
+        totals.append(running)
+    return totals
+
+
+def histogram(values: List[float], buckets: List[float] = None) -> Dict[str, int]:
+    """Cumulative histogram keyed by bucket upper bound (Prometheus style)."""
+    buckets = sorted(buckets or LATENCY_BUCKETS)
+    totals = cumulative_counts(bucket_counts(values, buckets))
+    return dict(zip([str(bound) for bound in buckets] + ["+Inf"], totals))
+
+
+def usage_from_calls(calls: List[Dict]) -> Dict[str, int]:
+    """
+    Token usage in the layout of ModelScopeSummarizer.get_usage_stats(),
+    derived from call records (used when the calls were made by queue
+    workers in other processes).
+    """
+    input_tokens = sum(c.get("input_tokens", 0) for c in calls)
+    cached = sum(c.get("cached_tokens", 0) for c in calls)
+    output_tokens = sum(c.get("output_tokens", 0) for c in calls)
+    models = {}
+    for c in calls:
+        if c.get("kind") == "full":
+            models.setdefault(c.get("paper_id"), set()).add(c.get("model"))
+    return {
+        "input_tokens": input_tokens,
+        "cached_input_tokens": cached,
+        "uncached_input_tokens": input_tokens - cached,
+        "output_tokens": output_tokens,
+        "total_tokens": input_tokens + output_tokens,
+        "retries": sum(1 for c in calls if c.get("attempt", 1) > 1),
+        "repairs": sum(1 for c in calls if c.get("kind") != "full" and c.get("attempt") == 1),
+        "escalations": sum(len(m) - 1 for m in models.values()),
+    }
+
+
+class SummaryTelemetry:
+    """
+    Thread-safe collector of summarization call and paper records.
+
+    Call records (``type: "call"``) describe one HTTP attempt: paper id, model,
+    kind (``full`` or ``repair_zh``/``repair_en``), attempt number, HTTP status
+    (or exception name), request latency, time-to-first-byte, token counts and
+    the parse outcome of the response. Paper records (``type: "paper"``)
+    describe one paper end to end: queue wait, total duration, number of calls,
+    time spent in retry and rate-limit sleeps, and the final outcome.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.papers = []
+        self._lock = threading.Lock()
+
+    def record_call(self, **fields) -> Dict:
+        """Append a call record and return it so the caller can annotate it."""
+        record = {"type": "call", **fields}
+        with self._lock:
+            self.calls.append(record)
+        return record
+
+    def record_paper(self, **fields) -> Dict:
+        """Append a paper record."""
+        record = {"type": "paper", **fields}
+        with self._lock:
+            self.papers.append(record)
+        return record
+
+    def pop_paper(self, paper_id: str) -> List[Dict]:
+        """Remove and return the call and paper records of one paper."""
+        with self._lock:
+            mine = [r for r in self.calls + self.papers if r.get("paper_id") == paper_id]
+            self.calls = [r for r in self.calls if r.get("paper_id") != paper_id]
+            self.papers = [r for r in self.papers if r.get("paper_id") != paper_id]
+        return mine
+
+    def add(self, records: List[Dict]):
+        """Append records produced elsewhere (e.g. by a queue worker)."""
+        with self._lock:
+            for record in records:
+                (self.calls if record.get("type") == "call" else self.papers).append(record)
+
+    def clear(self):
+        """Drop all records (after they were exported, in watch mode)."""
+        with self._lock:
+            self.calls = []
+            self.papers = []
+
+    def summary(self) -> Dict:
+        """
+        Aggregate the records into percentiles, histograms and counters.
+
+        Returns:
+            Dictionary with ``calls``/``papers`` counts, ``timings`` (p50/p95/p99,
+            max and histogram per timing field), ``status`` counts, ``parse``
+            outcome counts and ``attempts`` distribution
+        """
+        with self._lock:
+            calls = list(self.calls)
+            papers = list(self.papers)
+
+        timings = {}
+        for field, records in [(f, calls) for f in CALL_TIMINGS] + [
+            (f, papers) for f in PAPER_TIMINGS
+        ]:
+            values = [r[field] for r in records if r.get(field) is not None]
+            timings[field] = {
+                "count": len(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "p99": percentile(values, 99),
+                "max": max(values) if values else 0.0,
+                "sum": sum(values),
+                "histogram": histogram(values),
+            }
+
+        def count_by(records, field):
+            counts = {}
+            for r in records:
+                key = str(r.get(field))
+                counts[key] = counts.get(key, 0) + 1
+            return counts
+
+        return {
+            "calls": len(calls),
+            "papers": len(papers),
+            "timings": timings,
+            "status": count_by(calls, "status"),
+            "parse": count_by([c for c in calls if c.get("parse")], "parse"),
+            "attempts": count_by(calls, "attempt"),
+            "outcome": count_by(papers, "outcome"),
+        }
+
+    def export(self, ndjson_path: Path, summary_path: Path = None):
+        """
+        Write every record as NDJSON and (optionally) the aggregate summary as JSON.
+
+        Args:
+            ndjson_path: Destination of the per-call/per-paper records
+            summary_path: Destination of summary() output
+        """
+        # journal -> metrics -> telemetry: import here to avoid the cycle
+        from journal import atomic_write_text
+
+        with self._lock:
+            records = self.calls + self.papers
+        atomic_write_text(
+            ndjson_path,
+            "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records),
+        )
+
+        if summary_path:
+            atomic_write_text(
+                summary_path, json.dumps(self.summary(), indent=2, ensure_ascii=False)
+            )
+
+        print(f"✓ Wrote {len(records)} telemetry records to {ndjson_path}")
@@ -0,0 +1,259 @@
+"""
+Lightweight tracing spans and opt-in per-stage profiling.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+Spans record monotonic start/end times per thread and are exported in the
+Chrome trace-event format, which chrome://tracing, Perfetto
+(https://ui.perfetto.dev) and speedscope display as a timeline/flame chart:
+
+    with span("arxiv.page", cat="fetch", category="cs.CR", start=0):
+        ...
+
+    get_tracer().export_chrome_trace(Path("data/trace.json"))
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Optional
+
+
+def slugify(name: str) -> str:
+    """ASCII slug of a span name ("📥 Fetching papers" -> "fetching-papers")."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "stage"
+
+
+class StageProfiler:
+    """
+    cProfile + tracemalloc around each top-level stage span.
+
+    For every stage it writes ``NN-<stage>.prof`` (pstats data, e.g. for
+    snakeviz or flameprof) and ``NN-<stage>.txt`` (wall/CPU time, peak
+    traced memory, hottest functions and allocation sites), plus a
+    ``summary.json`` over all stages. cProfile only sees the thread that
+    runs the stage; work in pool threads shows up in the trace instead.
+    """
+
+    def __init__(self, output_dir: Path, top: int = 25):
+        self.output_dir = Path(output_dir)
+        self.top = top
+        self.stages = []
+        self._profile = None
+        # Reports of an earlier run would be mistaken for this run's stages
+        for stale in self.output_dir.glob("[0-9][0-9]-*"):
+            stale.unlink()
+
+    def start(self, name: str):
+        self._name = name
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+        tracemalloc.reset_peak()
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def stop(self):
+        if self._profile is None:
+            return
+        self._profile.disable()
+        wall = time.perf_counter() - self._wall
+        cpu = time.process_time() - self._cpu
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+
+        index = len(self.stages) + 1
+        stem = self.output_dir / f"{index:02d}-{slugify(self._name)}"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._profile.dump_stats(str(stem) + ".prof")
+
+        with open(str(stem) + ".txt", "w", encoding="utf-8") as f:
+            f.write(f"Stage: {self._name}\n")
+            f.write(f"Wall time: {wall:.3f}s\nCPU time:  {cpu:.3f}s\n")
+            f.write(f"Peak traced memory: {peak / 1024 / 1024:.1f} MiB\n\n")
+            stats = pstats.Stats(self._profile, stream=f)
+            stats.sort_stats("cumulative").print_stats(self.top)
+            f.write("Top allocation sites (live at end of stage)\n")
+            for stat in snapshot.statistics("lineno")[: self.top]:
+                f.write(f"  {stat}\n")
+
+        self.stages.append(
+            {
+                "stage": self._name,
+                "wall_s": round(wall, 4),
+                "cpu_s": round(cpu, 4),
+                "peak_memory_bytes": peak,
+                "profile": Path(str(stem) + ".prof").name,
+                "report": Path(str(stem) + ".txt").name,
+            }
+        )
+        self._profile = None
+
+    def write_summary(self) -> Path:
+        """Write summary.json and stop tracemalloc."""
+        path = self.output_dir / "summary.json"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"stages": self.stages}, f, indent=2, ensure_ascii=False)
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        return path
+
+
+class Span:
+    """One timed operation; use as a context manager (see span())."""
+
+    def __init__(self, tracer: "Tracer", name: str, cat: str, args: Dict):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.tracer._enter(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer._exit(self, end)
+        return False
+
+
+class Tracer:
+    """
+    Thread-safe collector of completed spans.
+
+    Stage spans (``cat="stage"``, opened by progress.github_group) that are
+    not nested in another stage are profiled when a StageProfiler is set.
+    """
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events = []
+        self.profiler: Optional[StageProfiler] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._threads = {}
+
+    def span(self, name: str, cat: str = "op", **args) -> Span:
+        return Span(self, name, cat, args)
+
+    def _enter(self, span: Span):
+        if span.cat == "stage":
+            depth = getattr(self._local, "stage_depth", 0)
+            self._local.stage_depth = depth + 1
+            span.profiled = (
+                depth == 0
+                and self.profiler is not None
+                and threading.current_thread() is threading.main_thread()
+            )
+            if span.profiled:
+                self.profiler.start(span.name)
+
+    def _exit(self, span: Span, end: float):
+        if span.cat == "stage":
+            self._local.stage_depth -= 1
+            if span.profiled:
+                self.profiler.stop()
+
+        thread = threading.current_thread()
+        event = {
+            "name": span.name,
+            "cat": span.cat,
+            "ph": "X",
+            "ts": round((span.start - self.origin) * 1e6, 1),
+            "dur": round((end - span.start) * 1e6, 1),
+            "pid": os.getpid(),
+            "tid": thread.ident,
+        }
+        if span.args:
+            event["args"] = span.args
+        with self._lock:
+            self.events.append(event)
+            self._threads.setdefault(thread.ident, thread.name)
+
+    def clear(self):
+        """Drop the completed spans (a long-running watch exports them per round)."""
+        with self._lock:
+            self.events = []
+
+    def totals(self, cat: str = None) -> Dict[str, float]:
+        """Summed span durations in seconds by name (optionally one category)."""
+        totals = {}
+        with self._lock:
+            for event in self.events:
+                if cat is None or event["cat"] == cat:
+                    totals[event["name"]] = totals.get(event["name"], 0.0) + event["dur"] / 1e6
+        return totals
+
+    def export_chrome_trace(self, path: Path) -> int:
+        """
+        Write the spans as Chrome trace-event JSON.
+
+        Returns:
+            Number of span events written
+        """
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e["ts"])
+            metadata = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+                for tid, name in self._threads.items()
+            ]
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"traceEvents": metadata + events, "displayTimeUnit": "ms"},
+                f,
+                ensure_ascii=False,
+            )
+        return len(events)
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """The process-wide tracer."""
+    return _tracer
+
+
+def span(name: str, cat: str = "op", **args) -> Span:
+    """
+    Time a block of code.
+
+    Args:
+        name: Span name shown in the trace viewer
+        cat: Category ("stage", "fetch", "summarize", "llm", "io", ...)
+        **args: Extra details attached to the event
+    """
+    return _tracer.span(name, cat, **args)
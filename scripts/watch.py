@@ -0,0 +1,171 @@
+"""
+Scheduling helpers for the long-running ``main.py watch`` mode.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import signal
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterator, List
+
+
+class PollSchedule:
+    """Periodic jobs (source polls, retries, archiving) with their next due time."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.jobs = {}
+
+    def add(self, name: str, interval: float, delay: float = 0.0):
+        """
+        Schedule a job every ``interval`` seconds, first after ``delay`` seconds.
+        """
+        self.jobs[name] = {"interval": max(1.0, interval), "next": self.clock() + delay}
+
+    def due(self) -> List[str]:
+        """Names of the jobs that are due, each rescheduled one interval from now."""
+        now = self.clock()
+        names = [name for name, job in self.jobs.items() if job["next"] <= now]
+        for name in names:
+            self.jobs[name]["next"] = now + self.jobs[name]["interval"]
+        return names
+
+    def delay(self) -> float:
+        """Seconds until the next job is due."""
+        if not self.jobs:
+            return 0.0
+        return max(0.0, min(job["next"] for job in self.jobs.values()) - self.clock())
+
+
+class IncrementalFetcher:
+    """
+    Wraps a fetcher so that repeated polls only yield papers not seen before.
+
+    The first poll covers the whole ``days_back`` window (like a cron run,
+    so cached papers are re-matched against the current profiles). Later
+    polls ask the fetcher only for papers published since the previous
+    successful poll minus ``overlap`` (arXiv lists papers with their
+    submission date, which can be a day or two before they are announced),
+    and drop ids yielded by an earlier poll.
+
+    A poll only counts once commit() is called after its papers were
+    stored; if the round fails, the next poll yields the same papers again.
+    Seen ids published before the next poll's window are forgotten, since
+    the fetcher no longer returns them.
+    """
+
+    def __init__(self, fetcher, overlap: timedelta = timedelta(days=2)):
+        self.fetcher = fetcher
+        self.overlap = overlap
+        # id -> publication date (or the date it was first yielded)
+        self.seen: Dict[str, str] = {}
+        self.last_poll = None
+        self._pending: Dict[str, str] = {}
+        self._started = None
+
+    def iter_papers(self) -> Iterator[Dict]:
+        since = self.last_poll - self.overlap if self.last_poll else None
+        started = datetime.now(timezone.utc)
+        if self._pending and hasattr(self.fetcher, "etag"):
+            # The previous round failed; a conditional request would get a
+            # 304 and hide its papers
+            self.fetcher.etag = self.fetcher.last_modified = None
+        self._pending = {}
+        self._started = None
+        today = started.strftime("%Y-%m-%d")
+        for paper in self.fetcher.iter_papers(since=since):
+            if paper["id"] in self.seen or paper["id"] in self._pending:
+                continue
+            self._pending[paper["id"]] = paper.get("published") or today
+            yield paper
+        # A failed request ends the fetch early; poll the same window again
+        if getattr(self.fetcher, "last_error", None) is None:
+            self._started = started
+
+    def fetch_papers(self) -> List[Dict]:
+        return list(self.iter_papers())
+
+    def commit(self):
+        """Mark the papers of the last poll as seen once they were stored."""
+        self.seen.update(self._pending)
+        self._pending = {}
+        if self._started is not None:
+            self.last_poll = self._started
+            self._started = None
+        if self.last_poll is not None:
+            cutoff = (self.last_poll - self.overlap).strftime("%Y-%m-%d")
+            self.seen = {
+                paper_id: published
+                for paper_id, published in self.seen.items()
+                if published >= cutoff
+            }
+
+
+@contextmanager
+def stop_on_signals(stop: threading.Event):
+    """Set ``stop`` on SIGINT/SIGTERM instead of raising, inside the block."""
+    previous = {}
+    if threading.current_thread() is threading.main_thread():
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            previous[signum] = signal.signal(signum, lambda *_: stop.set())
+    try:
+        yield stop
+    finally:
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+
+def run_forever(
+    schedule: PollSchedule,
+    tick: Callable[[List[str]], None],
+    max_cycles: int = None,
+    stop: threading.Event = None,
+) -> int:
+    """
+    Run due jobs until SIGINT/SIGTERM (or ``max_cycles`` rounds).
+
+    An exception in one round is printed and the loop continues with the
+    next one; a signal lets the current round finish before returning.
+
+    Args:
+        schedule: Jobs and intervals
+        tick: Called with the names of the due jobs
+        max_cycles: Stop after this many rounds (None: run until stopped)
+        stop: Event that ends the loop when set
+
+    Returns:
+        Number of rounds run
+    """
+    stop = stop or threading.Event()
+    cycles = 0
+    with stop_on_signals(stop):
+        while not stop.is_set():
+            due = schedule.due()
+            if due:
+                cycles += 1
+                try:
+                    tick(due)
+                except Exception as e:
+                    print(f"::error::Watch round {cycles} failed: {e}")
+                    traceback.print_exc()
+                if max_cycles is not None and cycles >= max_cycles:
+                    break
+            stop.wait(schedule.delay())
+    return cycles
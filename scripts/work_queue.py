@@ -0,0 +1,465 @@
+"""
+Lease-based summarization work queue shared by worker processes.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+The queue is a single SQLite file, so no broker is needed: `main.py`
+enqueues the papers that need a summary, any number of `main.py worker`
+processes (on this host or on others that mount the same directory) claim
+them with time-limited leases, and `main.py` collects the results. A worker
+that dies loses its lease when it expires and the job is claimed again.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from telemetry import SummaryTelemetry, usage_from_calls
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    priority REAL NOT NULL DEFAULT 0,
+    paper TEXT NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    claims INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    telemetry TEXT,
+    enqueued_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, priority);
+"""
+
+# Job states: pending -> leased -> done | failed
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class WorkQueue:
+    """
+    Summarization jobs in SQLite, claimed by workers with leases.
+
+    Claims run in an IMMEDIATE transaction, so concurrent workers never get
+    the same job while its lease is valid. A lease that is not renewed
+    before it expires makes the job claimable again; after ``max_claims``
+    expired leases the job fails with ``lease_expired`` instead of taking
+    down workers forever. Results are committed first-writer-wins: a late
+    result for a job that another worker already finished is ignored.
+
+    The rollback journal (not WAL) is used so that hosts sharing the file
+    over a network filesystem rely only on POSIX file locks.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        lease_seconds: float = 300.0,
+        max_claims: int = 3,
+        busy_timeout: float = 30.0,
+    ):
+        """
+        Open (and create if needed) the queue.
+
+        Args:
+            db_path: Queue database, e.g. data/work_queue.db
+            lease_seconds: How long a claim is valid without renewal
+            max_claims: Claims after which a job whose lease keeps expiring fails
+            busy_timeout: Seconds to wait for another process's lock
+        """
+        self.db_path = Path(db_path)
+        self.lease_seconds = lease_seconds
+        self.max_claims = max(1, max_claims)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; transactions are opened explicitly. One connection
+        # is shared by the threads of a process behind a lock.
+        self.conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self.conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def enqueue(self, papers: List[Dict]) -> int:
+        """
+        Add jobs for papers that are not queued yet.
+
+        Papers whose job is pending, leased or finished but not yet collected
+        keep that job, so enqueueing is idempotent.
+
+        Returns:
+            Number of jobs added
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (id, status, priority, paper, enqueued_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        p["id"],
+                        PENDING,
+                        p.get("keyword_score", 0),
+                        json.dumps(p, ensure_ascii=False),
+                        now,
+                    )
+                    for p in papers
+                ],
+            )
+            return conn.total_changes - before
+
+    def claim(self, worker: str, limit: int = 1) -> List[Dict]:
+        """
+        Lease up to ``limit`` jobs, highest keyword score first.
+
+        Returns:
+            The papers of the claimed jobs
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            # Jobs whose leases expired too often are given up
+            for job_id, paper in conn.execute(
+                "SELECT id, paper FROM jobs WHERE status = ? AND lease_expires < ? "
+                "AND claims >= ?",
+                (LEASED, now, self.max_claims),
+            ).fetchall():
+                paper = json.loads(paper)
+                paper["summary_status"] = "failed"
+                paper["summary_error"] = "lease_expired"
+                conn.execute(
+                    "UPDATE jobs SET status = ?, result = ?, lease_owner = NULL, "
+                    "finished_at = ? WHERE id = ?",
+                    (FAILED, json.dumps(paper, ensure_ascii=False), now, job_id),
+                )
+
+            rows = conn.execute(
+                "SELECT id, paper FROM jobs WHERE status = ? "
+                "OR (status = ? AND lease_expires < ?) "
+                "ORDER BY priority DESC, enqueued_at LIMIT ?",
+                (PENDING, LEASED, now, limit),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE jobs SET status = ?, lease_owner = ?, lease_expires = ?, "
+                "claims = claims + 1 WHERE id = ?",
+                [(LEASED, worker, now + self.lease_seconds, job_id) for job_id, _ in rows],
+            )
+        return [json.loads(paper) for _, paper in rows]
+
+    def renew(self, worker: str, ids: Iterable[str]) -> int:
+        """Extend the leases this worker still holds; returns how many."""
+        ids = list(ids)
+        if not ids:
+            return 0
+        expires = time.time() + self.lease_seconds
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "UPDATE jobs SET lease_expires = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                [(expires, job_id, LEASED, worker) for job_id in ids],
+            )
+            return conn.total_changes - before
+
+    def complete(self, paper: Dict, ok: bool, telemetry: List[Dict] = None) -> bool:
+        """
+        Store a job's result unless another worker finished it first.
+
+        Returns:
+            True if this result was recorded
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, telemetry = ?, lease_owner = NULL, "
+                "finished_at = ? WHERE id = ? AND status IN (?, ?)",
+                (
+                    DONE if ok else FAILED,
+                    json.dumps(paper, ensure_ascii=False),
+                    json.dumps(telemetry or [], ensure_ascii=False),
+                    time.time(),
+                    paper["id"],
+                    PENDING,
+                    LEASED,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def finished(self, ids: Iterable[str]) -> List[Dict]:
+        """
+        Finished jobs among ``ids``.
+
+        Returns:
+            List of {"paper", "ok", "telemetry"} dictionaries
+        """
+        ids = list(ids)
+        results = []
+        with self._lock:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                results.extend(
+                    {
+                        "paper": json.loads(result),
+                        "ok": status == DONE,
+                        "telemetry": json.loads(telemetry) if telemetry else [],
+                    }
+                    for status, result, telemetry in self.conn.execute(
+                        f"SELECT status, result, telemetry FROM jobs "
+                        f"WHERE id IN ({placeholders}) AND status IN (?, ?)",
+                        chunk + [DONE, FAILED],
+                    )
+                )
+        return results
+
+    def remove(self, ids: Iterable[str]):
+        """Delete collected jobs."""
+        with self._transaction() as conn:
+            conn.executemany("DELETE FROM jobs WHERE id = ?", [(i,) for i in ids])
+
+    def purge(self, older_than_days: float) -> int:
+        """Delete jobs enqueued longer ago than this (papers that left the window)."""
+        cutoff = time.time() - older_than_days * 86400
+        with self._transaction() as conn:
+            return conn.execute("DELETE FROM jobs WHERE enqueued_at < ?", (cutoff,)).rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per state."""
+        with self._lock:
+            rows = self.conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+            return dict(rows.fetchall())
+
+
+def run_worker(
+    queue: WorkQueue,
+    summarizer,
+    worker: str = None,
+    poll_interval: float = 2.0,
+    idle_timeout: float = None,
+    stop: threading.Event = None,
+) -> int:
+    """
+    Claim, summarize and complete jobs until stopped (or idle).
+
+    Runs ``summarizer.concurrency`` threads, each holding one lease at a
+    time; a heartbeat thread renews the leases of papers in progress.
+
+    Args:
+        queue: Work queue
+        summarizer: ModelScopeSummarizer doing the work
+        worker: Lease owner name (default: host-pid)
+        poll_interval: Seconds between claims while the queue is empty
+        idle_timeout: Return after the queue was empty this long (None: never)
+        stop: Event that ends the worker when set
+
+    Returns:
+        Number of jobs completed by this worker
+    """
+    worker = worker or default_worker_id()
+    stop = stop or threading.Event()
+    inflight = set()
+    lock = threading.Lock()
+    completed = [0]
+
+    def heartbeat():
+        while not stop.wait(queue.lease_seconds / 3):
+            with lock:
+                ids = list(inflight)
+            queue.renew(worker, ids)
+
+    def loop():
+        idle_since = time.monotonic()
+        while not stop.is_set():
+            jobs = queue.claim(worker)
+            if not jobs:
+                if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                    return
+                stop.wait(poll_interval)
+                continue
+            paper = jobs[0]
+            with lock:
+                inflight.add(paper["id"])
+            try:
+                print(f"[{worker}] Summarizing: {paper['title'][:60]}...")
+                ok = summarizer.summarize_one(paper, delay=summarizer.rate_limit_delay)
+                if queue.complete(paper, ok, summarizer.telemetry.pop_paper(paper["id"])):
+                    with lock:
+                        completed[0] += 1
+            except Exception as e:
+                # The lease expires and another worker retries the job
+                print(f"::warning::[{worker}] {paper['id']} failed: {e}")
+            finally:
+                # A failed attempt must not leave its records behind for the next paper's
+                # export; after a successful one this finds nothing left to drop
+                summarizer.telemetry.pop_paper(paper["id"])
+                with lock:
+                    inflight.discard(paper["id"])
+            idle_since = time.monotonic()
+
+    beat = threading.Thread(target=heartbeat, name="lease-heartbeat", daemon=True)
+    beat.start()
+    threads = [
+        threading.Thread(target=loop, name=f"worker-{i}") for i in range(max(1, summarizer.concurrency))
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            thread.join()
+    finally:
+        stop.set()
+    return completed[0]
+
+
+class QueueSummarizer:
+    """
+    Summarizer stand-in that hands papers to queue workers.
+
+    batch_summarize() enqueues the papers and collects their results as
+    workers finish them. Papers that are not finished within
+    ``wait_timeout`` are neither successful nor failed; they stay queued and
+    the next run collects them. With ``local`` (a ModelScopeSummarizer) this
+    process works through its own queue as well.
+    """
+
+    # The streaming pipeline is not used; papers are queued in one batch
+    concurrency = 1
+    rate_limit_delay = 0.0
+
+    def __init__(
+        self,
+        queue: WorkQueue,
+        local=None,
+        poll_interval: float = 1.0,
+        wait_timeout: float = None,
+    ):
+        """
+        Args:
+            queue: Work queue shared with the workers
+            local: Optional summarizer used by in-process worker threads
+            poll_interval: Seconds between checks for finished jobs
+            wait_timeout: Stop waiting after this many seconds (None: wait
+                until every paper is finished)
+        """
+        self.queue = queue
+        self.local = local
+        self.poll_interval = poll_interval
+        self.wait_timeout = wait_timeout
+        self.telemetry = SummaryTelemetry()
+
+    def batch_summarize(self, papers: list, delay: float = None, journal=None) -> tuple:
+        """
+        Queue papers and wait for their results.
+
+        Finished papers are updated in place and journaled as they are
+        collected, then removed from the queue.
+
+        Returns:
+            Tuple of (successful_papers, failed_papers)
+        """
+        by_id = {p["id"]: p for p in papers}
+        added = self.queue.enqueue(papers)
+        print(
+            f"✓ Queued {added} papers for the workers"
+            + (f" ({len(papers) - added} already queued)" if len(papers) > added else "")
+        )
+
+        stop = threading.Event()
+        local_thread = None
+        if self.local is not None:
+            local_thread = threading.Thread(
+                target=run_worker,
+                args=(self.queue, self.local, f"{default_worker_id()}-local"),
+                kwargs={"poll_interval": self.poll_interval, "stop": stop},
+                daemon=True,
+            )
+            local_thread.start()
+
+        outcomes = {}
+        remaining = set(by_id)
+        deadline = time.monotonic() + self.wait_timeout if self.wait_timeout else None
+        reported = 0
+        try:
+            while remaining:
+                finished = self.queue.finished(remaining)
+                for row in finished:
+                    paper = by_id[row["paper"]["id"]]
+                    paper.clear()
+                    paper.update(row["paper"])
+                    if journal is not None:
+                        journal.append(paper)
+                    self.telemetry.add(row["telemetry"])
+                    outcomes[paper["id"]] = row["ok"]
+                    remaining.discard(paper["id"])
+                if finished:
+                    self.queue.remove(row["paper"]["id"] for row in finished)
+                if len(outcomes) - reported >= 10 or (finished and not remaining):
+                    reported = len(outcomes)
+                    print(f"  {len(outcomes)}/{len(by_id)} papers finished")
+                if not remaining or (deadline is not None and time.monotonic() >= deadline):
+                    break
+                time.sleep(self.poll_interval)
+        finally:
+            stop.set()
+            if local_thread is not None:
+                local_thread.join()
+
+        if remaining:
+            print(
+                f"⏳ {len(remaining)} papers are still queued; "
+                "the next run collects them when the workers are done"
+            )
+        successful = [p for p in papers if outcomes.get(p["id"]) is True]
+        failed = [p for p in papers if outcomes.get(p["id"]) is False]
+        print(
+            f"\n✓ Summarization complete: {len(successful)} successful, {len(failed)} failed"
+        )
+        return successful, failed
+
+    def get_usage_stats(self) -> dict:
+        """Token usage of the collected papers, from the workers' call records."""
+        return usage_from_calls(self.telemetry.calls)
@@ -0,0 +1,54 @@
+"""
+Shared pytest setup for the Paper Pulse tests.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+The pipeline modules live in scripts/ and import each other by name, as
+when they are run as scripts, so that directory is put on sys.path (and
+benchmarks/, for the synthetic corpus and the hot-path cases).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench",
+        action="store_true",
+        help="Also time the hot paths and compare them with benchmarks/baselines.json",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "bench: hot-path timings compared with the baseline (run with --bench)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--bench"):
+        return
+    skip = pytest.mark.skip(reason="timing comparison; run with --bench")
+    for item in items:
+        if "bench" in item.keywords:
+            item.add_marker(skip)
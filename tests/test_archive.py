@@ -0,0 +1,132 @@
+"""
+Tests for the cold archive and restoring archived papers into the store.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import datetime, timedelta
+
+from archive import ColdArchive
+from store import PaperStore
+
+
+def make_paper(paper_id: str, published: str, **fields) -> dict:
+    paper = {
+        "id": paper_id,
+        "title": f"Paper {paper_id}",
+        "abstract": "An abstract.",
+        "authors": ["Alice Smith"],
+        "published": published,
+        "source": "arXiv",
+        "summary_status": "success",
+    }
+    paper.update(fields)
+    return paper
+
+
+def test_round_trip_keeps_line_separator_characters(tmp_path):
+    # json.dumps leaves U+2028, U+2029 and U+0085 unescaped
+    abstract = "First line\u2028second\u2029third\u0085fourth"
+    archive = ColdArchive(tmp_path / "archive")
+    archive.append(
+        [make_paper("a", "2025-01-03", abstract=abstract), make_paper("b", "2025-01-04")]
+    )
+
+    reread = ColdArchive(tmp_path / "archive")
+    papers = reread.read_partition("2025-01")
+    assert set(papers) == {"a", "b"}
+    assert papers["a"]["abstract"] == abstract
+
+
+def test_last_appended_copy_wins(tmp_path):
+    archive = ColdArchive(tmp_path / "archive")
+    archive.append([make_paper("a", "2025-01-03", title="old")])
+    archive.append([make_paper("a", "2025-01-03", title="new")])
+    assert ColdArchive(tmp_path / "archive").read_partition("2025-01")["a"]["title"] == "new"
+
+
+def test_torn_last_member_is_ignored(tmp_path):
+    archive = ColdArchive(tmp_path / "archive")
+    archive.append([make_paper("a", "2025-01-03")])
+    path = archive.path_for("2025-01")
+    # A crash while appending the second member leaves a truncated gzip stream
+    second = ColdArchive(tmp_path / "other")
+    second.append([make_paper("b", "2025-01-04")])
+    torn = second.path_for("2025-01").read_bytes()[:-10]
+    with open(path, "ab") as f:
+        f.write(torn)
+    assert set(ColdArchive(tmp_path / "archive").read_partition("2025-01")) == {"a"}
+
+
+def test_undated_papers_get_their_own_partition():
+    assert ColdArchive.partition_for({"published": "2025-02-11"}) == "2025-02"
+    assert ColdArchive.partition_for({"published": ""}) == "undated"
+    assert ColdArchive.partition_for({}) == "undated"
+
+
+def test_archived_paper_is_restored_by_get_many(tmp_path):
+    store = PaperStore(tmp_path / "papers.db", archive=ColdArchive(tmp_path / "archive"))
+    try:
+        store.upsert(
+            [make_paper("old", "2000-01-01", abstract="x\u2028y"), make_paper("new", "2999-01-01")]
+        )
+        assert store.archive_older_than(30) == 1
+        assert [p["id"] for p in store.recent()] == ["new"]
+
+        found = store.get_many(["old"])
+        assert found["old"]["abstract"] == "x\u2028y"
+        assert store.restored_count == 1
+        assert {p["id"] for p in store.recent()} == {"old", "new"}
+    finally:
+        store.close()
+
+
+def days_ago(days: int) -> str:
+    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def test_retention_keeps_papers_inside_the_window(tmp_path):
+    store = PaperStore(tmp_path / "papers.db", archive=ColdArchive(tmp_path / "archive"))
+    try:
+        store.upsert([make_paper(f"d{days}", days_ago(days)) for days in (0, 29, 30, 31, 45)])
+        # A paper expires once its publication day (at midnight) is more
+        # than 30 days ago
+        assert store.archive_older_than(30) == 3
+        assert sorted(p["id"] for p in store.recent()) == ["d0", "d29"]
+        assert store.archive_count() == 3
+        assert [row["id"] for row in store.search_archive("paper d4")] == ["d45"]
+        # Nothing left to expire
+        assert store.archive_older_than(30) == 0
+    finally:
+        store.close()
+
+
+def test_delete_mode_drops_expired_papers(tmp_path):
+    with PaperStore(tmp_path / "papers.db") as store:
+        store.upsert([make_paper("old", days_ago(40)), make_paper("new", days_ago(1))])
+        assert store.archive_older_than(30) == 1
+        assert [p["id"] for p in store.recent()] == ["new"]
+        assert store.get_many(["old"]) == {}
+        assert store.archive_count() == 0
+
+
+def test_papers_without_a_usable_date_are_kept(tmp_path):
+    undated = [make_paper("empty", ""), make_paper("bad", "unknown"), make_paper("none", None)]
+    for archive in (None, ColdArchive(tmp_path / "archive")):
+        with PaperStore(tmp_path / f"{archive is None}.db", archive=archive) as store:
+            store.upsert(undated + [make_paper("old", days_ago(40))])
+            assert store.archive_older_than(7) == 1
+            assert sorted(p["id"] for p in store.recent()) == ["bad", "empty", "none"]
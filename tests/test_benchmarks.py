@@ -0,0 +1,68 @@
+"""
+Hot-path benchmarks (benchmarks/bench_hotpaths.py) as pytest cases.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+By default every case runs once on a small corpus, so a broken benchmark
+fails the suite. With ``--bench`` the cases are also timed at 1k papers and
+compared with benchmarks/baselines.json, like ``bench_hotpaths.py --compare``.
+"""
+
+import contextlib
+import io
+import json
+
+import pytest
+
+import bench_hotpaths
+from store import PaperStore
+from synthetic import make_corpus
+
+THRESHOLD = 0.25
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return make_corpus(200, seed=0)
+
+
+@pytest.mark.parametrize("name", list(bench_hotpaths.CASES))
+def test_case_runs(name, corpus, tmp_path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn = bench_hotpaths.CASES[name](corpus, tmp_path)
+        try:
+            fn()
+        finally:
+            store = getattr(fn, "__self__", None)
+            if isinstance(store, PaperStore):
+                store.close()
+
+
+def test_baseline_covers_every_case():
+    baseline = json.loads(bench_hotpaths.DEFAULT_BASELINE.read_text(encoding="utf-8"))
+    for size, cases in baseline["results"].items():
+        assert set(cases) == set(bench_hotpaths.CASES), size
+
+
+@pytest.mark.bench
+def test_no_regression_against_baseline():
+    baseline = json.loads(bench_hotpaths.DEFAULT_BASELINE.read_text(encoding="utf-8"))
+    repeat = baseline.get("repeat", 5)
+    speed = bench_hotpaths.calibrate(repeat)
+    results = bench_hotpaths.run_cases([1000], list(bench_hotpaths.CASES), repeat, seed=0)
+    speed = min(bench_hotpaths.calibrate(repeat), speed)
+    regressions = bench_hotpaths.compare(results, baseline, THRESHOLD, speed)
+    assert not regressions, regressions
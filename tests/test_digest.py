@@ -0,0 +1,59 @@
+"""
+Tests for the email digest size cap.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import pytest
+
+from digest import generate_email_report
+from synthetic import make_corpus
+
+USAGE = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
+
+
+def report(papers, tmp_path, **kwargs):
+    output = tmp_path / "email_report.txt"
+    counts = generate_email_report(
+        papers, [], [], len(papers), USAGE, output, "https://example.org", **kwargs
+    )
+    files = {suffix: output.with_suffix(suffix) for suffix in (".txt", ".md", ".html")}
+    return counts, files
+
+
+@pytest.mark.parametrize("max_bytes", [20_000, 60_000])
+@pytest.mark.parametrize("group_by", ["keyword", "none"])
+def test_reports_stay_under_the_cap(tmp_path, max_bytes, group_by):
+    papers = make_corpus(300, seed=1)
+    counts, files = report(papers, tmp_path, max_bytes=max_bytes, group_by=group_by)
+
+    assert counts["full"] + counts["compact"] + counts["omitted"] == len(papers)
+    assert counts["full"] and counts["omitted"]
+    for suffix, path in files.items():
+        size = path.stat().st_size
+        assert size <= max_bytes
+        assert counts["bytes"][suffix.lstrip(".")] == size
+    html = files[".html"].read_text(encoding="utf-8")
+    assert html.count("<ul>") == html.count("</ul>")
+    assert f"{counts['omitted']}" in files[".txt"].read_text(encoding="utf-8")
+
+
+def test_no_cap_writes_every_paper_in_full(tmp_path):
+    papers = make_corpus(50, seed=1)
+    counts, files = report(papers, tmp_path, max_bytes=0)
+    assert counts == {"full": 50, "compact": 0, "omitted": 0, "bytes": counts["bytes"]}
+    text = files[".md"].read_text(encoding="utf-8")
+    assert all(paper["title"] in text for paper in papers)
@@ -0,0 +1,119 @@
+"""
+Tests for atomic writes and the summary journal.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+import stat
+
+import pytest
+
+from digest import generate_email_report
+from journal import (
+    FILE_MODE,
+    SummaryJournal,
+    atomic_write_bytes,
+    compact_journal,
+    replay_journal,
+)
+from store import PaperStore
+from telemetry import SummaryTelemetry
+
+posix_only = pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+
+
+def mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+@posix_only
+def test_atomic_write_uses_umask_mode(tmp_path):
+    target = tmp_path / "papers.json"
+    atomic_write_bytes(target, b"{}")
+    assert target.read_bytes() == b"{}"
+    # Same permissions as a file created by open(), not mkstemp()'s 0600
+    reference = tmp_path / "reference"
+    reference.write_bytes(b"")
+    assert mode(target) == mode(reference) == FILE_MODE
+    assert not list(tmp_path.glob(".papers.json.*"))
+
+
+@posix_only
+def test_email_reports_use_umask_mode(tmp_path):
+    usage = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
+    generate_email_report([], [], [], 0, usage, tmp_path / "email_report.txt", "")
+    for suffix in (".txt", ".md", ".html"):
+        assert mode(tmp_path / f"email_report{suffix}") == FILE_MODE
+
+
+@posix_only
+def test_telemetry_export_is_atomic(tmp_path):
+    telemetry = SummaryTelemetry()
+    telemetry.record_call(paper_id="2601.00001", status="ok", latency=1.5)
+    telemetry.record_paper(paper_id="2601.00001", outcome="success")
+    telemetry.export(tmp_path / "telemetry.ndjson", tmp_path / "telemetry.json")
+
+    lines = (tmp_path / "telemetry.ndjson").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["type"] for line in lines] == ["call", "paper"]
+    assert json.loads((tmp_path / "telemetry.json").read_text(encoding="utf-8"))["calls"] == 1
+    assert mode(tmp_path / "telemetry.ndjson") == FILE_MODE
+    assert not list(tmp_path.glob(".telemetry.*"))
+
+
+def summarized(paper_id, status="success", summary="摘要"):
+    return {
+        "id": paper_id,
+        "title": f"Paper {paper_id}",
+        "published": "2026-01-10",
+        "summary_status": status,
+        "summary_zh": summary,
+    }
+
+
+def test_replay_skips_torn_line_and_keeps_latest(tmp_path):
+    path = tmp_path / "summaries.journal"
+    journal = SummaryJournal(path, fsync_every=2)
+    journal.append(summarized("a", status="failed"))
+    journal.append(summarized("b"))
+    journal.append(summarized("a", summary="retried"))
+    journal.close()
+    # The process died while writing the next record
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"ts": "2026-01-10T00:00:00", "paper": {"id": "c"')
+
+    papers = replay_journal(path)
+    assert [p["id"] for p in papers] == ["a", "b"]
+    assert papers[0]["summary_status"] == "success"
+    assert papers[0]["summary_zh"] == "retried"
+    assert replay_journal(tmp_path / "missing.journal") == []
+
+
+def test_compaction_folds_successes_into_store(tmp_path):
+    path = tmp_path / "summaries.journal"
+    journal = SummaryJournal(path)
+    journal.append(summarized("ok"))
+    journal.append(summarized("bad", status="failed"))
+    journal.close()
+
+    with PaperStore(tmp_path / "papers.db") as store:
+        assert compact_journal(path, store) == 1
+        assert not path.exists()
+        assert store.get("ok")["summary_zh"] == "摘要"
+        assert store.get("bad") is None
+        # Nothing left to replay on the next start
+        assert compact_journal(path, store) == 0
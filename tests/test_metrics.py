@@ -0,0 +1,51 @@
+"""
+Tests for the Prometheus metrics registry.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import metrics
+from telemetry import LATENCY_BUCKETS, histogram
+
+
+def test_histogram_buckets_match_the_telemetry_summary():
+    values = [0.05, 0.1, 2.0, 2.2, 25.0, 500.0]
+    metric = metrics.Histogram("test_seconds", "Test latency.", ["model"])
+    for value in values:
+        metric.observe(value, model="m")
+
+    buckets = {
+        labels.split('le="')[1][:-2]: count
+        for name, labels, count in metric.samples()
+        if name == "test_seconds_bucket"
+    }
+    summary = histogram(values)
+    assert list(buckets.values()) == list(summary.values())
+    assert len(buckets) == len(LATENCY_BUCKETS) + 1
+    assert buckets["2"] == summary["2.0"] == 3
+    assert buckets["+Inf"] == summary["+Inf"] == len(values)
+
+
+def test_histogram_renders_count_and_sum():
+    metric = metrics.Histogram("test_seconds", "Test latency.", buckets=[1.0])
+    metric.observe(0.5)
+    metric.observe(3.0)
+    assert metric.samples() == [
+        ("test_seconds_bucket", '{le="1"}', 1),
+        ("test_seconds_bucket", '{le="+Inf"}', 2),
+        ("test_seconds_count", "", 2),
+        ("test_seconds_sum", "", 3.5),
+    ]
@@ -0,0 +1,165 @@
+"""
+Tests for the batch and streaming fetch → filter → summarize pipelines.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import copy
+import threading
+import time
+
+import pytest
+
+from filter import KeywordFilter
+from pipeline import Source, run_batch, run_streaming
+from store import PaperStore
+from summarizer import ModelScopeSummarizer
+
+
+class ListFetcher:
+    """Fetcher over a fixed list, optionally failing after ``fail_after`` papers."""
+
+    def __init__(self, papers, fail_after=None, delay=0.0):
+        self.papers = papers
+        self.fail_after = fail_after
+        self.delay = delay
+
+    def iter_papers(self):
+        for index, paper in enumerate(self.papers):
+            if index == self.fail_after:
+                raise RuntimeError("fetch failed")
+            time.sleep(self.delay)
+            yield copy.deepcopy(paper)
+
+    def fetch_papers(self):
+        return list(self.iter_papers())
+
+
+class FakeSummarizer(ModelScopeSummarizer):
+    """Summarizer without API calls; records the rate-limit delay of every paper."""
+
+    def __init__(self, concurrency=1, duration=0.0, fail_ids=()):
+        super().__init__(api_key="test", rate_limit_delay=0.5, concurrency=concurrency)
+        self.duration = duration
+        self.fail_ids = set(fail_ids)
+        self.delays = {}
+        self._delays_lock = threading.Lock()
+
+    def summarize(self, paper):
+        time.sleep(self.duration)
+        if paper["id"] in self.fail_ids:
+            return None, None
+        return f"摘要 {paper['id']}", f"Summary {paper['id']}"
+
+    def summarize_one(self, paper, journal=None, delay=0.0, enqueued=None):
+        with self._delays_lock:
+            self.delays[paper["id"]] = delay
+        return super().summarize_one(paper, journal=journal, delay=0.0, enqueued=enqueued)
+
+
+def make_paper(paper_id, title="Backdoor attacks on language models"):
+    return {
+        "id": paper_id,
+        "title": title,
+        "abstract": f"Abstract of {paper_id}.",
+        "authors": ["Alice Smith"],
+        "published": "2026-01-10",
+        "source": "arXiv" if paper_id.startswith("arxiv") else "IACR",
+    }
+
+
+@pytest.fixture
+def keyword_filter(tmp_path):
+    keywords = tmp_path / "keywords.txt"
+    keywords.write_text("backdoor\n", encoding="utf-8")
+    return KeywordFilter(config_file=str(keywords))
+
+
+def make_sources():
+    arxiv = [make_paper(f"arxiv_{i}") for i in range(12)]
+    arxiv[3]["title"] = "Unrelated title"
+    # Overlapping result pages repeat a paper
+    arxiv.append(copy.deepcopy(arxiv[5]))
+    iacr = [make_paper(f"iacr_{i}", title="Lattice signatures") for i in range(5)]
+    return [
+        Source("arXiv", ListFetcher(arxiv)),
+        Source("IACR", ListFetcher(iacr), apply_filter=False),
+    ]
+
+
+def run_pipeline(runner, tmp_path, keyword_filter, **kwargs):
+    store = PaperStore(tmp_path / f"{runner.__name__}.db")
+    try:
+        store.upsert([dict(make_paper("arxiv_7"), summary_status="success", summary_zh="旧")])
+        summarizer = FakeSummarizer(concurrency=3, fail_ids={"iacr_2"})
+        result = runner(
+            make_sources(), keyword_filter, store, summarizer, skip_ids={"arxiv_9"}, **kwargs
+        )
+        return result, summarizer
+    finally:
+        store.close()
+
+
+def ids(papers):
+    return [paper["id"] for paper in papers]
+
+
+def test_streaming_matches_batch(tmp_path, keyword_filter):
+    batch, batch_summarizer = run_pipeline(run_batch, tmp_path, keyword_filter)
+    streaming, streaming_summarizer = run_pipeline(
+        run_streaming, tmp_path, keyword_filter, queue_size=2
+    )
+
+    for key in ("fetched", "selected", "deferred"):
+        assert streaming[key] == batch[key]
+    for key in ("new", "cached", "successful", "failed"):
+        assert streaming[key] == batch[key], key
+
+    assert batch["fetched"] == {"arXiv": 13, "IACR": 5}
+    assert batch["selected"] == {"arXiv": 12, "IACR": 5}
+    assert batch["deferred"] == 1
+    assert ids(batch["cached"]) == ["arxiv_7"]
+    assert ids(batch["failed"]) == ["iacr_2"]
+    # The repeated paper is summarized once
+    assert ids(batch["new"]).count("arxiv_5") == 1
+    assert sorted(streaming_summarizer.delays) == sorted(batch_summarizer.delays)
+
+
+@pytest.mark.parametrize("runner", [run_batch, run_streaming])
+def test_last_paper_skips_rate_limit_sleep(tmp_path, keyword_filter, runner):
+    result, summarizer = run_pipeline(runner, tmp_path, keyword_filter)
+    # Only the last submitted paper skips the sleep; streaming submits in arrival order
+    delays = sorted(summarizer.delays.values())
+    assert len(delays) == len(result["new"])
+    assert delays == [0.0] + [0.5] * (len(delays) - 1)
+
+
+def test_streaming_fails_fast_on_fetch_error(tmp_path, keyword_filter):
+    papers = [make_paper(f"arxiv_{i}") for i in range(200)]
+    sources = [
+        Source("arXiv", ListFetcher(papers, delay=0.001)),
+        Source("IACR", ListFetcher([make_paper("iacr_0")] * 3, fail_after=2, delay=0.05)),
+    ]
+    summarizer = FakeSummarizer(duration=0.01)
+    store = PaperStore(tmp_path / "papers.db")
+    try:
+        started = time.perf_counter()
+        with pytest.raises(RuntimeError, match="fetch failed"):
+            run_streaming(sources, keyword_filter, store, summarizer, queue_size=4)
+        assert time.perf_counter() - started < 1.0
+        assert len(summarizer.delays) < len(papers)
+    finally:
+        store.close()
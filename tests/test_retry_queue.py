@@ -0,0 +1,116 @@
+"""
+Tests for the retry queue: backoff, dead-lettering, expiry and requeueing.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import datetime, timedelta
+
+from retry_queue import RetryQueue
+
+NOW = datetime(2026, 3, 1, 12, 0)
+
+
+def make_queue(tmp_path, **kwargs):
+    options = {"max_attempts": 3, "base_delay_hours": 6, "max_delay_hours": 20}
+    options.update(kwargs)
+    return RetryQueue(tmp_path / "failed.json", tmp_path / "dead_letter.json", **options)
+
+
+def failed(paper_id, error="http_429", published="2026-02-28"):
+    return {"id": paper_id, "published": published, "summary_error": error}
+
+
+def test_backoff_doubles_up_to_the_cap(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=10)
+    waits = []
+    now = NOW
+    for _ in range(4):
+        queue.record_failure([failed("p1")], now=now)
+        next_eligible = datetime.fromisoformat(queue.entries["p1"]["retry"]["next_eligible"])
+        waits.append(next_eligible - now)
+        assert queue.due(now=now) == []
+        now = next_eligible
+        assert [p["id"] for p in queue.due(now=now)] == ["p1"]
+    assert waits == [timedelta(hours=h) for h in (6, 12, 20, 20)]
+    assert queue.entries["p1"]["retry"]["attempts"] == 4
+
+
+def test_due_respects_quota_and_priority(tmp_path):
+    queue = make_queue(tmp_path, quota=2)
+    queue.record_failure([failed("old", published="2026-01-01")], now=NOW)
+    queue.record_failure([failed("new", published="2026-02-01")], now=NOW)
+    queue.record_failure([failed("twice")], now=NOW - timedelta(days=2))
+    queue.record_failure([failed("twice")], now=NOW - timedelta(days=1))
+    later = NOW + timedelta(days=1)
+    assert [p["id"] for p in queue.due(now=later)] == ["new", "old"]
+
+
+def test_dead_lettering_and_save_round_trip(tmp_path):
+    queue = make_queue(tmp_path, dead_letter_errors=["empty_abstract"])
+    queue.record_failure([failed("empty", error="empty_abstract")], now=NOW)
+    for attempt in range(3):
+        queue.record_failure([failed("flaky")], now=NOW + timedelta(days=attempt))
+    assert set(queue.dead) == {"empty", "flaky"}
+    assert [p["id"] for p in queue.newly_dead] == ["empty", "flaky"]
+    assert len(queue) == 0
+    queue.save()
+
+    reloaded = make_queue(tmp_path)
+    assert set(reloaded.dead) == {"empty", "flaky"}
+    assert reloaded.ids() == {"empty", "flaky"}
+    assert not (tmp_path / "failed.json").exists()
+
+
+def test_success_clears_retry_data(tmp_path):
+    queue = make_queue(tmp_path)
+    queue.record_failure([failed("p1")], now=NOW)
+    paper = dict(queue.entries["p1"], summary_zh="摘要")
+    queue.record_success([paper])
+    assert len(queue) == 0
+    assert "retry" not in paper
+
+
+def test_dead_letters_expire_with_retention(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=1, dead_letter_days=7)
+    queue.record_failure([failed("stale")], now=NOW - timedelta(days=8))
+    queue.record_failure([failed("recent")], now=NOW - timedelta(days=6))
+    assert queue.expire_dead(now=NOW) == 1
+    assert set(queue.dead) == {"recent"}
+    assert "stale" not in queue.ids()
+
+    queue.expire_dead(now=NOW + timedelta(days=2))
+    queue.save()
+    assert not (tmp_path / "dead_letter.json").exists()
+
+
+def test_requeue_dead_resets_attempts(tmp_path):
+    queue = make_queue(tmp_path, max_attempts=2)
+    for paper_id in ("a", "b"):
+        queue.record_failure([failed(paper_id)], now=NOW)
+        queue.record_failure([failed(paper_id)], now=NOW + timedelta(hours=6))
+    assert set(queue.dead) == {"a", "b"}
+
+    assert queue.requeue_dead(["a", "missing"], now=NOW + timedelta(days=1)) == ["a"]
+    assert set(queue.dead) == {"b"}
+    assert [p["id"] for p in queue.due(now=NOW + timedelta(days=1))] == ["a"]
+    assert queue.entries["a"]["retry"]["first_failed"] == NOW.isoformat()
+
+    # A failure after requeueing counts as the first attempt again
+    queue.record_failure([failed("a")], now=NOW + timedelta(days=1))
+    assert queue.entries["a"]["retry"]["attempts"] == 1
+    assert queue.requeue_dead() == ["b"]
+    assert queue.dead == {}
@@ -0,0 +1,82 @@
+"""
+Tests for the main and focused feeds.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from email.utils import parsedate_to_datetime
+from xml.etree import ElementTree
+
+from rss import generate_feeds
+
+
+def paper(paper_id, source, keywords, published="2026-01-10"):
+    return {
+        "id": paper_id,
+        "title": f"Paper {paper_id}",
+        "url": f"https://example.org/{paper_id}",
+        "published": published,
+        "source": source,
+        "keywords": keywords,
+        "summary_en": "Summary.",
+    }
+
+
+def item_titles(path):
+    return [item.findtext("title") for item in ElementTree.parse(path).iter("item")]
+
+
+def test_keyword_named_like_a_source_gets_its_own_feed(tmp_path):
+    papers = [paper("a", "IACR", ["lattice"]), paper("b", "arXiv", ["IACR"])]
+    generate_feeds(papers, tmp_path / "feed.xml", formats=["rss"])
+
+    feeds = tmp_path / "feeds"
+    assert sorted(p.name for p in feeds.iterdir()) == [
+        "kw-iacr.xml",
+        "kw-lattice.xml",
+        "source-arxiv.xml",
+        "source-iacr.xml",
+    ]
+    assert item_titles(feeds / "source-iacr.xml") == ["Paper a"]
+    assert item_titles(feeds / "kw-iacr.xml") == ["Paper b"]
+
+
+def test_stale_cleanup_only_removes_generated_feeds(tmp_path):
+    # feeds_dir pointed at the site root
+    for name in ("index.html", "app.js", "iacr.xml", "kw-old.json.gz", "source-old.atom"):
+        (tmp_path / name).write_text("", encoding="utf-8")
+    papers = [paper("a", "IACR", ["lattice"])]
+    generate_feeds(papers, tmp_path / "feed.xml", feeds_dir=tmp_path, formats=["rss"])
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "app.js",
+        "feed.xml",
+        "iacr.xml",
+        "index.html",
+        "kw-lattice.xml",
+        "source-iacr.xml",
+    ]
+
+
+def test_pub_date_is_utc(tmp_path):
+    papers = [paper("a", "IACR", [], published="2026-01-10"), paper("b", "IACR", [], "bad")]
+    generate_feeds(papers, tmp_path / "feed.xml", formats=["rss"], per_source=False)
+    dates = [
+        item.findtext("pubDate") for item in ElementTree.parse(tmp_path / "feed.xml").iter("item")
+    ]
+    assert dates[0] == "Sat, 10 Jan 2026 00:00:00 +0000"
+    # Unparseable dates fall back to the build time, also in UTC
+    assert dates[1].endswith("+0000")
+    assert parsedate_to_datetime(dates[1]).utcoffset().total_seconds() == 0
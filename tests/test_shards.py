@@ -0,0 +1,67 @@
+"""
+Tests for the day shards and their manifest.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+
+from shards import load_manifest, write_shards
+
+
+def paper(paper_id, published):
+    return {"id": paper_id, "title": f"Paper {paper_id}", "published": published}
+
+
+def test_last_updated_only_changes_with_the_shards(tmp_path):
+    shard_dir = tmp_path / "shards"
+    manifest_path = tmp_path / "manifest.json"
+    papers = [paper("b", "2026-01-11"), paper("a", "2026-01-10")]
+
+    first = write_shards(papers, shard_dir, manifest_path, last_updated="2026-01-11T08:00:00")
+    assert first["last_updated"] == "2026-01-11T08:00:00"
+    mtime = manifest_path.stat().st_mtime_ns
+
+    # Same papers: nothing written, the manifest is left untouched
+    again = write_shards(papers, shard_dir, manifest_path, last_updated="2026-01-12T08:00:00")
+    assert again == first
+    assert manifest_path.stat().st_mtime_ns == mtime
+
+    # A changed day updates the timestamp
+    papers[0]["title"] = "Revised"
+    changed = write_shards(papers, shard_dir, manifest_path, last_updated="2026-01-13T08:00:00")
+    assert changed["last_updated"] == "2026-01-13T08:00:00"
+
+    # So does a day that disappeared
+    removed = write_shards(
+        papers[:1], shard_dir, manifest_path, last_updated="2026-01-14T08:00:00"
+    )
+    assert removed["last_updated"] == "2026-01-14T08:00:00"
+    assert [s["date"] for s in load_manifest(manifest_path)["shards"]] == ["2026-01-11"]
+    assert sorted(p.name for p in shard_dir.iterdir()) == ["2026-01-11.json"]
+
+
+def test_missing_shard_file_is_rewritten(tmp_path):
+    shard_dir = tmp_path / "shards"
+    manifest_path = tmp_path / "manifest.json"
+    papers = [paper("a", "2026-01-10")]
+    write_shards(papers, shard_dir, manifest_path, last_updated="2026-01-10T08:00:00")
+    (shard_dir / "2026-01-10.json").unlink()
+
+    manifest = write_shards(papers, shard_dir, manifest_path, last_updated="2026-01-11T08:00:00")
+    assert manifest["last_updated"] == "2026-01-11T08:00:00"
+    shard = json.loads((shard_dir / "2026-01-10.json").read_text(encoding="utf-8"))
+    assert [p["id"] for p in shard["papers"]] == ["a"]
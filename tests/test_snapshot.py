@@ -0,0 +1,93 @@
+"""
+Tests for the committed text snapshot of the paper database.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import datetime, timedelta
+
+import main
+from shards import read_snapshot
+
+
+def days_ago(days: int) -> str:
+    return (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def paper(paper_id, published, **fields):
+    return dict(
+        {"id": paper_id, "title": f"Paper {paper_id}", "published": published, "source": "arXiv"},
+        summary_status="success",
+        summary_zh="摘要\n第二行",
+        **fields,
+    )
+
+
+def make_settings(tmp_path):
+    return main.Settings({"general": {"data_dir": str(tmp_path), "days_back": 30}})
+
+
+def test_database_is_rebuilt_from_the_snapshot(tmp_path):
+    settings = make_settings(tmp_path)
+    store = main.open_store(settings)
+    store.upsert([paper("new", days_ago(1)), paper("mid", days_ago(5)), paper("old", days_ago(60))])
+    store.archive_older_than(30)
+    main.save_snapshot(settings, store)
+    store.close()
+
+    papers, manifest = read_snapshot(settings.snapshot_dir)
+    assert sorted(p["id"] for p in papers) == ["mid", "new"]
+    # Indented, so git diffs it line by line
+    day = (settings.snapshot_dir / manifest["shards"][0]["file"]).read_text(encoding="utf-8")
+    assert day.count("\n") > 5
+
+    settings.papers_db.unlink()
+    with main.open_store(settings) as rebuilt:
+        assert [p["id"] for p in rebuilt.recent()] == ["new", "mid"]
+        assert rebuilt.get("new")["summary_zh"] == "摘要\n第二行"
+        # The archive is indexed again, so archived papers can be restored
+        assert rebuilt.archive_count() == 1
+        assert rebuilt.get_many(["old"])["old"]["title"] == "Paper old"
+
+
+def test_stale_database_is_updated_from_the_snapshot(tmp_path):
+    settings = make_settings(tmp_path)
+    store = main.open_store(settings)
+    store.upsert([paper("a", days_ago(1))])
+    main.save_snapshot(settings, store)
+    store.close()
+    stale = settings.papers_db.read_bytes()
+
+    store = main.open_store(settings)
+    store.upsert([paper("b", days_ago(2))])
+    main.save_snapshot(settings, store)
+    store.close()
+
+    # A database restored from an older cache entry
+    settings.papers_db.write_bytes(stale)
+    with main.open_store(settings) as store:
+        assert sorted(p["id"] for p in store.recent()) == ["a", "b"]
+
+
+def test_unchanged_store_rewrites_no_day(tmp_path):
+    settings = make_settings(tmp_path)
+    with main.open_store(settings) as store:
+        store.upsert([paper("a", days_ago(1)), paper("b", days_ago(2))])
+        main.save_snapshot(settings, store)
+        days = settings.snapshot_dir / "days"
+        mtimes = {p.name: p.stat().st_mtime_ns for p in days.iterdir()}
+        main.save_snapshot(settings, store)
+        assert {p.name: p.stat().st_mtime_ns for p in days.iterdir()} == mtimes
@@ -0,0 +1,152 @@
+"""
+Tests for the incremental fetcher of the long-running watch mode.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from watch import IncrementalFetcher
+
+
+class WindowFetcher:
+    """Returns the papers published since ``since`` like the real fetchers."""
+
+    def __init__(self, papers):
+        self.papers = papers
+        self.last_error = None
+        self.etag = "v1"
+        self.last_modified = "yesterday"
+        self.calls = []
+
+    def iter_papers(self, since=None):
+        self.calls.append(since)
+        for paper in self.papers:
+            if since is None or paper["published"] >= since.strftime("%Y-%m-%d"):
+                yield dict(paper)
+
+
+def days_ago(days):
+    return (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+def make_papers():
+    return [{"id": f"p{days}", "published": days_ago(days)} for days in (0, 1, 3, 10)]
+
+
+def ids(papers):
+    return [paper["id"] for paper in papers]
+
+
+def test_committed_poll_drops_seen_papers():
+    fetcher = IncrementalFetcher(WindowFetcher(make_papers()), overlap=timedelta(days=2))
+    assert ids(fetcher.fetch_papers()) == ["p0", "p1", "p3", "p10"]
+    fetcher.commit()
+
+    fetcher.fetcher.papers.append({"id": "new", "published": days_ago(0)})
+    assert ids(fetcher.fetch_papers()) == ["new"]
+    assert fetcher.fetcher.calls[-1] is not None
+
+
+def test_failed_round_yields_papers_again():
+    fetcher = IncrementalFetcher(WindowFetcher(make_papers()), overlap=timedelta(days=2))
+    first = ids(fetcher.fetch_papers())
+    # The round failed before commit(): same window, same papers, no 304
+    assert ids(fetcher.fetch_papers()) == first
+    assert fetcher.fetcher.calls == [None, None]
+    assert fetcher.fetcher.etag is None and fetcher.fetcher.last_modified is None
+    assert fetcher.seen == {}
+
+
+def test_seen_is_pruned_to_the_next_poll_window():
+    fetcher = IncrementalFetcher(WindowFetcher(make_papers()), overlap=timedelta(days=2))
+    fetcher.fetch_papers()
+    fetcher.commit()
+    # Papers older than the next window are never returned again
+    assert sorted(fetcher.seen) == ["p0", "p1"]
+
+
+def test_failed_fetch_keeps_the_previous_window():
+    source = WindowFetcher(make_papers())
+    fetcher = IncrementalFetcher(source, overlap=timedelta(days=2))
+    source.last_error = RuntimeError("timeout")
+    fetcher.fetch_papers()
+    fetcher.commit()
+    assert fetcher.last_poll is None
+    assert sorted(fetcher.seen) == ["p0", "p1", "p10", "p3"]
+
+
+class FlakyFetcher:
+    """Raises on the first poll, then returns nothing."""
+
+    def __init__(self):
+        self.last_error = None
+        self.polls = 0
+
+    def iter_papers(self, since=None):
+        self.polls += 1
+        if self.polls == 1:
+            raise RuntimeError("arXiv unreachable")
+        return iter([])
+
+
+def test_summaries_of_a_failed_round_are_kept(tmp_path, monkeypatch):
+    import main
+    import watch
+    from pipeline import Source
+    from retry_queue import RetryQueue
+    from summarizer import ModelScopeSummarizer
+
+    class Summarizer(ModelScopeSummarizer):
+        def summarize(self, paper):
+            return "摘要", "Summary"
+
+    config = main.load_config()
+    config["general"] = dict(config.get("general", {}), data_dir=str(tmp_path))
+    config["pipeline"] = {"streaming": False}
+    config.pop("profiles", None)
+    settings = main.Settings(config)
+
+    queue = main.make_retry_queue(settings)
+    queue.record_failure([{"id": "p1", "title": "Paper", "abstract": "An abstract."}])
+    queue.entries["p1"]["retry"]["next_eligible"] = None
+    queue.save()
+
+    summarizer = Summarizer(api_key="test", rate_limit_delay=0)
+    monkeypatch.setattr(main, "make_pipeline_summarizer", lambda settings: summarizer)
+    monkeypatch.setattr(
+        main, "make_sources", lambda *args, **kwargs: [Source("arXiv", FlakyFetcher(), False)]
+    )
+    published = []
+    monkeypatch.setattr(main, "stage_publish", lambda *args, **kwargs: published.append(1))
+
+    def two_rounds(schedule, tick, max_cycles=None, stop=None):
+        # Round 1 retries p1 (journaled), then the poll raises
+        with pytest.raises(RuntimeError):
+            tick(["retry", "arXiv"])
+        tick(["arXiv"])
+        return 2
+
+    monkeypatch.setattr(watch, "run_forever", two_rounds)
+    main.watch(settings)
+
+    with main.PaperStore(settings.papers_db) as store:
+        assert store.get("p1")["summary_zh"] == "摘要"
+    assert not settings.journal_file.exists()
+    assert "p1" not in RetryQueue(settings.failed_file, settings.dead_letter_file).ids()
+    assert published
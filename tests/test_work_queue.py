@@ -0,0 +1,123 @@
+"""
+Tests for the SQLite work queue: leases, expiry and first-writer-wins results.
+
+Copyright (C) 2024-2026 Paper Pulse Contributors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+
+import pytest
+
+from telemetry import SummaryTelemetry
+from work_queue import WorkQueue, run_worker
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = WorkQueue(tmp_path / "work_queue.db", lease_seconds=300)
+    yield queue
+    queue.close()
+
+
+def paper(paper_id, score=0):
+    return {"id": paper_id, "title": f"Paper {paper_id}", "keyword_score": score}
+
+
+def expire_leases(queue):
+    # Leases end strictly before the next claim
+    queue.conn.execute("UPDATE jobs SET lease_expires = ?", (time.time() - 1,))
+
+
+def test_enqueue_is_idempotent(queue):
+    assert queue.enqueue([paper("a"), paper("b")]) == 2
+    assert queue.enqueue([paper("a"), paper("c")]) == 1
+    assert queue.counts() == {"pending": 3}
+
+
+def test_claims_are_exclusive_and_by_priority(queue):
+    queue.enqueue([paper("low", 1), paper("high", 5), paper("mid", 3)])
+    assert [p["id"] for p in queue.claim("w1", limit=2)] == ["high", "mid"]
+    assert [p["id"] for p in queue.claim("w2", limit=2)] == ["low"]
+    assert queue.claim("w3") == []
+
+
+def test_expired_lease_is_claimed_again(queue):
+    queue.enqueue([paper("a")])
+    assert queue.claim("w1")
+    assert queue.claim("w2") == []
+    expire_leases(queue)
+    assert [p["id"] for p in queue.claim("w2")] == ["a"]
+    # The first worker lost its lease and cannot renew it
+    assert queue.renew("w1", ["a"]) == 0
+    assert queue.renew("w2", ["a"]) == 1
+
+
+def test_lease_expiring_too_often_fails_the_job(tmp_path):
+    queue = WorkQueue(tmp_path / "work_queue.db", max_claims=2)
+    try:
+        queue.enqueue([paper("a")])
+        for worker in ("w1", "w2"):
+            assert queue.claim(worker)
+            expire_leases(queue)
+        assert queue.claim("w3") == []
+        [result] = queue.finished(["a"])
+        assert not result["ok"]
+        assert result["paper"]["summary_error"] == "lease_expired"
+    finally:
+        queue.close()
+
+
+def test_first_result_wins(queue):
+    queue.enqueue([paper("a")])
+    queue.claim("w1")
+    expire_leases(queue)
+    queue.claim("w2")
+    assert queue.complete(dict(paper("a"), summary_zh="w2"), ok=True)
+    # The late result of the worker whose lease expired is dropped
+    assert not queue.complete(dict(paper("a"), summary_zh="w1"), ok=True)
+
+    [result] = queue.finished(["a", "missing"])
+    assert result["ok"] and result["paper"]["summary_zh"] == "w2"
+    queue.remove(["a"])
+    assert queue.counts() == {}
+
+
+def test_purge_drops_old_jobs(queue):
+    queue.enqueue([paper("old"), paper("new")])
+    queue.conn.execute(
+        "UPDATE jobs SET enqueued_at = ? WHERE id = 'old'", (time.time() - 3 * 86400,)
+    )
+    assert queue.purge(older_than_days=2) == 1
+    assert [p["id"] for p in queue.claim("w1", limit=5)] == ["new"]
+
+
+class FailingSummarizer:
+    concurrency = 1
+    rate_limit_delay = 0
+
+    def __init__(self):
+        self.telemetry = SummaryTelemetry()
+
+    def summarize_one(self, paper, delay=0):
+        self.telemetry.record_call(paper_id=paper["id"], status="error")
+        raise RuntimeError("backend down")
+
+
+def test_failed_job_leaves_no_telemetry_behind(queue):
+    summarizer = FailingSummarizer()
+    queue.enqueue([paper("a")])
+    assert run_worker(queue, summarizer, worker="w1", poll_interval=0.01, idle_timeout=0) == 0
+    assert summarizer.telemetry.calls == []